@@ -0,0 +1,246 @@
+"""End-to-end benchmark for the `run_n_cycles` pipeline.
+
+Drives the orchestrator with `ScriptedLLM` (synthetic latency, realistic
+outputs) and records wall-clock throughput plus per-phase latency:
+tester, implementer (LLM + run_tests), refactorer (LLM + run_tests),
+supervisor, diff, state.view/state.to_dict and persistence.
+
+Usage (from repo root, package importable):
+    python benchmarks/bench_pipeline.py --cycles 1,3,5 --asserts 1,10 --out bench.json
+    python benchmarks/bench_pipeline.py --compare bench.json --threshold 20
+
+Results are JSON so two versions can be diffed; `--compare` prints per-phase
+mean deltas against a baseline file and exits 1 on regressions above the
+threshold. The test result cache is disabled unless `--test-cache` is given
+so `run_tests` cost stays visible.
+"""
+
+from __future__ import annotations
+import argparse
+import contextlib
+import functools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterator, List, Mapping
+from unittest import mock
+
+from scripted_llm import ScriptedLLM
+
+KATA = "FizzBuzz kata: return Fizz, Buzz, FizzBuzz or the number"
+
+
+class PhaseTimer:
+    """Collects wall-clock samples (ms) per phase name."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.current_agent = ""
+
+    def add(self, name: str, started: float) -> None:
+        self.samples[name].append((time.perf_counter() - started) * 1000)
+
+    def sync(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(name, started)
+
+        return wrapper
+
+    def agent(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self.current_agent = name
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                self.add(name, started)
+
+        return wrapper
+
+    def run_tests(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                self.add(f"{self.current_agent}_run_tests", started)
+
+        return wrapper
+
+
+@contextlib.contextmanager
+def instrumented(timer: PhaseTimer) -> Iterator[None]:
+    from tdd_agents import diff, runtime_validation, state
+    from tdd_agents.agents.implementer import ImplementerAgent
+    from tdd_agents.agents.refactorer import RefactorerAgent
+    from tdd_agents.agents.supervisor import SupervisorAgent
+    from tdd_agents.agents.tester import TesterAgent
+
+    patches = [
+        mock.patch.object(TesterAgent, "aact", timer.agent("tester", TesterAgent.aact)),
+        mock.patch.object(
+            ImplementerAgent, "aact", timer.agent("implementer", ImplementerAgent.aact)
+        ),
+        mock.patch.object(RefactorerAgent, "aact", timer.agent("refactorer", RefactorerAgent.aact)),
+        mock.patch.object(SupervisorAgent, "aact", timer.agent("supervisor", SupervisorAgent.aact)),
+        mock.patch.object(
+            runtime_validation,
+            "arun_tests_report",
+            timer.run_tests(runtime_validation.arun_tests_report),
+        ),
+        mock.patch.object(diff, "unified_code_diff", timer.sync("diff", diff.unified_code_diff)),
+        mock.patch.object(
+            state.SystemState, "to_dict", timer.sync("state_to_dict", state.SystemState.to_dict)
+        ),
+        mock.patch.object(
+            state.SystemState, "view", timer.sync("state_view", state.SystemState.view)
+        ),
+    ]
+    with contextlib.ExitStack() as stack:
+        for p in patches:
+            stack.enter_context(p)
+        yield
+
+
+def _stats(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        "total_ms": round(sum(ordered), 3),
+        "mean_ms": round(sum(ordered) / len(ordered), 3),
+        "p50_ms": round(pct(0.5), 3),
+        "p95_ms": round(pct(0.95), 3),
+    }
+
+
+def run_scenario(cycles: int, asserts: int, latency_ms: float, repeat: int) -> Dict[str, Any]:
+    from tdd_agents.orchestrator import run_n_cycles
+    from tdd_agents.persist import write_current, write_snapshot
+
+    timer = PhaseTimer()
+    completed_cycles = 0
+    aborted = 0
+    with tempfile.TemporaryDirectory() as out_dir, instrumented(timer):
+
+        def on_cycle(state_dict: Mapping[str, Any], cycle_number: int) -> None:
+            started = time.perf_counter()
+            write_current(state_dict, out_dir)
+            write_snapshot(state_dict, out_dir, cycle_number)
+            timer.add("persistence", started)
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            llm = ScriptedLLM(latency_ms=latency_ms, asserts_per_test=asserts)
+            result = run_n_cycles("python", KATA, max_cycles=cycles, on_cycle=on_cycle, llm=llm)
+            completed_cycles += len(result["tdd_history"])
+            aborted += int(bool(result["aborted"]))
+        wall = time.perf_counter() - started
+    return {
+        "key": f"cycles={cycles},asserts={asserts},latency_ms={latency_ms:g}",
+        "cycles": cycles,
+        "asserts_per_test": asserts,
+        "llm_latency_ms": latency_ms,
+        "runs": repeat,
+        "completed_cycles": completed_cycles,
+        "aborted_runs": aborted,
+        "wall_sec": round(wall, 4),
+        "cycles_per_sec": round(completed_cycles / wall, 3) if wall else 0.0,
+        "phases": {name: _stats(values) for name, values in sorted(timer.samples.items())},
+    }
+
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold_pct: float) -> int:
+    """Print per-phase mean deltas; return number of regressions over threshold."""
+    base = {s["key"]: s for s in baseline["scenarios"]}
+    regressions = 0
+    for scenario in current["scenarios"]:
+        old = base.get(scenario["key"])
+        if old is None:
+            continue
+        print(f"{scenario['key']}: cycles/sec {old['cycles_per_sec']} -> {scenario['cycles_per_sec']}")
+        for name, stats in scenario["phases"].items():
+            prev = old["phases"].get(name)
+            if not prev or not prev["mean_ms"]:
+                continue
+            delta = (stats["mean_ms"] - prev["mean_ms"]) / prev["mean_ms"] * 100
+            flag = "  REGRESSION" if delta > threshold_pct else ""
+            regressions += bool(flag)
+            print(f"  {name:28s} {prev['mean_ms']:10.3f} -> {stats['mean_ms']:10.3f} ms ({delta:+.1f}%){flag}")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", default="1,3,5", help="Comma list of max cycle counts")
+    parser.add_argument("--asserts", default="1,10", help="Comma list of asserts per test")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Synthetic LLM latency")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--runner", help="TDD_AGENTS_TEST_RUNNER value to benchmark")
+    parser.add_argument("--test-cache", action="store_true", help="Keep test result cache on")
+    parser.add_argument("--out", help="Write JSON results to this file (default stdout)")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Regression %% threshold")
+    args = parser.parse_args(argv)
+
+    if args.runner:
+        os.environ["TDD_AGENTS_TEST_RUNNER"] = args.runner
+    if not args.test_cache:
+        os.environ["TDD_AGENTS_TEST_CACHE"] = "0"
+
+    scenarios = [
+        run_scenario(cycles, asserts, args.latency_ms, args.repeat)
+        for cycles in (int(c) for c in args.cycles.split(","))
+        for asserts in (int(a) for a in args.asserts.split(","))
+    ]
+    results = {
+        "meta": {
+            "git_rev": _git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runner": os.getenv("TDD_AGENTS_TEST_RUNNER", "subprocess"),
+            "test_cache": args.test_cache,
+            "timestamp": time.time(),
+        },
+        "scenarios": scenarios,
+    }
+    payload = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    elif not args.compare:
+        print(payload)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        return 1 if compare(baseline, results, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Scripted fake LLM producing realistic agent outputs for benchmarks.
+
+Unlike `NullLLM`, responses go through every real code path: the tester adds
+a new FizzBuzz test per cycle, the implementer returns a passing
+implementation, the refactorer a behavior-preserving rewrite, and the
+supervisor asks to continue. Each call sleeps `latency_ms` first.
+"""
+
+from __future__ import annotations
+import asyncio
+import re
+import time
+from dataclasses import dataclass, replace
+
+IMPLEMENTATION = '''def fizzbuzz(n):
+    if n % 15 == 0:
+        return "FizzBuzz"
+    if n % 3 == 0:
+        return "Fizz"
+    if n % 5 == 0:
+        return "Buzz"
+    return str(n)
+'''
+
+REFACTORED = '''def fizzbuzz(n):
+    words = ""
+    if n % 3 == 0:
+        words += "Fizz"
+    if n % 5 == 0:
+        words += "Buzz"
+    return words or str(n)
+'''
+
+_CYCLE_RE = re.compile(r"Previous cycles: (\d+)")
+
+
+def expected(n: int) -> str:
+    return "FizzBuzz" if n % 15 == 0 else "Fizz" if n % 3 == 0 else "Buzz" if n % 5 == 0 else str(n)
+
+
+def tester_output(cycle: int, asserts_per_test: int) -> str:
+    """One test function for `cycle` with `asserts_per_test` assertions."""
+    start = cycle * asserts_per_test + 1
+    lines = [f"def test_fizzbuzz_cycle_{cycle}():"]
+    for n in range(start, start + asserts_per_test):
+        lines.append(f"    assert fizzbuzz({n}) == {expected(n)!r}")
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class ScriptedLLM:
+    latency_ms: float = 0.0
+    asserts_per_test: int = 3
+    role: str = ""
+
+    def for_role(self, role: str) -> "ScriptedLLM":
+        return replace(self, role=role)
+
+    def _respond(self, prompt: str) -> str:
+        role = self.role or _guess_role(prompt)
+        if role == "tester":
+            match = _CYCLE_RE.search(prompt)
+            return tester_output(int(match.group(1)) if match else 0, self.asserts_per_test)
+        if role == "implementer":
+            return IMPLEMENTATION
+        if role == "refactorer":
+            return REFACTORED
+        return "continue"
+
+    def generate(self, prompt: str) -> str:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        return self._respond(prompt)
+
+    async def agenerate(self, prompt: str) -> str:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self._respond(prompt)
+
+
+def _guess_role(prompt: str) -> str:
+    if prompt.startswith("You are a TDD test author"):
+        return "tester"
+    if prompt.startswith("You are an implementation agent"):
+        return "implementer"
+    if prompt.startswith("You are a refactoring assistant"):
+        return "refactorer"
+    return "supervisor"
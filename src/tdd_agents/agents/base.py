@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 
 
 class Agent(ABC):
-    """Abstract base for all agents."""
+    """Abstract base for all agents.
+
+    Subclasses split their work into `build_prompt` (what to ask the LLM, or
+    None to skip the call) and `respond` (turn the optional generation into a
+    structured output). `act` and `aact` share that logic and differ only in
+    how the LLM is awaited.
+    """
 
     name: str
 
@@ -14,7 +20,25 @@ class Agent(ABC):
         self.name = name
         self.llm = llm  # injected dependency (can be NullLLM)
 
+    def build_prompt(self, state: Mapping[str, Any]) -> Optional[str]:
+        """Prompt to send to the LLM, or None when no call is needed."""
+        return None
+
     @abstractmethod
-    def act(self, state: Dict[str, Any]) -> Dict[str, Any]:  # minimal for scaffolding
-        """Perform agent action given partial state; return structured output dict."""
+    def respond(self, state: Mapping[str, Any], generated: Optional[str]) -> Dict[str, Any]:
+        """Build structured output; `generated` is None when the LLM was not asked."""
         raise NotImplementedError
+
+    def act(self, state: Mapping[str, Any]) -> Dict[str, Any]:
+        """Perform agent action given partial state; return structured output dict."""
+        prompt = self.build_prompt(state) if self.llm else None
+        generated = self.llm.generate(prompt) if prompt is not None else None
+        return self.respond(state, generated)
+
+    async def aact(self, state: Mapping[str, Any]) -> Dict[str, Any]:
+        """Async variant of `act`; awaits `agenerate` instead of blocking."""
+        from tdd_agents.llm import agenerate
+
+        prompt = self.build_prompt(state) if self.llm else None
+        generated = await agenerate(self.llm, prompt) if prompt is not None else None
+        return self.respond(state, generated)
@@ -1,59 +1,56 @@
 """Implementer agent stub."""
 
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 from .base import Agent
 
 
+def _seed_stubs(test_suite: str) -> Tuple[Set[str], List[str]]:
+    """Referenced function names plus stub definitions seeded from assert literals."""
+    from tdd_agents.symbols import index_for
+
+    index = index_for(test_suite)
+    stubs = []
+    for fn in sorted(index.calls):
+        expected_literal = index.expected.get(fn)
+        if expected_literal:
+            stubs.append(
+                f"def {fn}(*args, **kwargs):\n    return {expected_literal}\n"
+            )
+        else:
+            stubs.append(
+                f"def {fn}(*args, **kwargs):\n    raise NotImplementedError('{fn} stub')\n"
+            )
+    return set(index.calls), stubs
+
+
 class ImplementerAgent(Agent):
-    def act(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        test_suite = str(state.get("full_test_suite", ""))
-        from tdd_agents.naming import extract_called_functions
-        import re
-
-        referenced = extract_called_functions(test_suite)
-        stubs = []
-        for fn in sorted(referenced):
-            # Attempt to locate a simple expected literal on an assert line
-            expected_literal = None
-            for line in test_suite.splitlines():
-                if "assert" in line and f"{fn}(" in line and "==" in line:
-                    # Extract RHS after '=='
-                    rhs = line.split("==", 1)[1].strip()
-                    # Trim trailing assertion message after comma
-                    if "," in rhs:
-                        rhs = rhs.split(",", 1)[0].strip()
-                    # crude guard: bracketed/brace/numeric/quoted
-                    if re.match(r"^(\[.*\]|\{.*\}|\d+|'.*'|\".*\")$", rhs):
-                        expected_literal = rhs
-                        break
-            if expected_literal:
-                stubs.append(
-                    f"def {fn}(*args, **kwargs):\n    return {expected_literal}\n"
-                )
-            else:
-                stubs.append(
-                    f"def {fn}(*args, **kwargs):\n    raise NotImplementedError('{fn} stub')\n"
-                )
+    def build_prompt(self, state: Mapping[str, Any]) -> Optional[str]:
+        from tdd_agents.prompts import implementer_prompt
+
+        _, stubs = _seed_stubs(str(state.get("full_test_suite", "")))
+        baseline = "\n".join(stubs) if stubs else "# implementation stub\n"
+        return implementer_prompt(state) + "\nCurrent stubs provided:\n" + baseline
+
+    def respond(self, state: Mapping[str, Any], generated: Optional[str]) -> Dict[str, Any]:
+        referenced, stubs = _seed_stubs(str(state.get("full_test_suite", "")))
         baseline = "\n".join(stubs) if stubs else "# implementation stub\n"
         updated = baseline
         notes = "seed implementations/stubs for referenced functions" if stubs else "no functions referenced"
-        if self.llm:
-            from tdd_agents.prompts import implementer_prompt
+        # If NullLLM sentinel output, keep baseline
+        if generated is not None and generated.strip() != "[NULL_LLM_OUTPUT]":
             from tdd_agents.sanitize import sanitize_snippet
 
-            prompt = implementer_prompt(state) + "\nCurrent stubs provided:\n" + baseline
-            generated = self.llm.generate(prompt)
-            # If NullLLM sentinel output, keep baseline
-            if generated.strip() != "[NULL_LLM_OUTPUT]":
-                candidate = sanitize_snippet(generated)
-                if candidate.strip():
-                    # Only accept if it contains at least one referenced function definition
-                    if any(f"def {fn}" in candidate for fn in referenced):
-                        updated = candidate
-                        notes = "LLM augmented implementation"
-                    else:
-                        notes = "Ignored LLM output lacking function definitions"
+            from tdd_agents.symbols import index_for
+
+            candidate = sanitize_snippet(generated)
+            if candidate.strip():
+                # Only accept if it contains at least one referenced function definition
+                if referenced & index_for(candidate).defs:
+                    updated = candidate
+                    notes = "LLM augmented implementation"
+                else:
+                    notes = "Ignored LLM output lacking function definitions"
         return {
             "updated_code": updated,
             "implementation_notes": notes,
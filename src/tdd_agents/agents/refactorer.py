@@ -1,35 +1,36 @@
 """Refactorer agent stub."""
 
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 from .base import Agent
 
 
 class RefactorerAgent(Agent):
-    def act(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        base_code = state.get("final_code", "")
-        if self.llm:
-            from tdd_agents.prompts import refactorer_prompt
+    def build_prompt(self, state: Mapping[str, Any]) -> Optional[str]:
+        from tdd_agents.prompts import refactorer_prompt
+
+        return refactorer_prompt(state)
 
-            prompt = refactorer_prompt(state)
-            generated = self.llm.generate(prompt)
+    def respond(self, state: Mapping[str, Any], generated: Optional[str]) -> Dict[str, Any]:
+        base_code = state.get("final_code", "")
+        if generated is None:
+            refactored = base_code
+            notes = "No refactor applied."
+        elif generated.strip() == "[NULL_LLM_OUTPUT]":
+            refactored = base_code
+            notes = "No refactor (null LLM)."
+        else:
             from tdd_agents.sanitize import sanitize_snippet
-            if generated.strip() == "[NULL_LLM_OUTPUT]":
+            from tdd_agents.symbols import index_for
+
+            candidate = sanitize_snippet(generated)
+            existing_fns = index_for(str(base_code)).defs
+            if existing_fns and not existing_fns & index_for(candidate).defs:
                 refactored = base_code
-                notes = "No refactor (null LLM)."
+                notes = "Ignored LLM refactor lacking function defs"
             else:
-                candidate = sanitize_snippet(generated)
-                import re
-                existing_fns = re.findall(r'^def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', base_code, flags=re.MULTILINE)
-                if existing_fns and not any(f"def {fn}" in candidate for fn in existing_fns):
-                    refactored = base_code
-                    notes = "Ignored LLM refactor lacking function defs"
-                else:
-                    refactored = candidate or base_code
-                    notes = "LLM suggested refactor or echoed original."
-        else:
-            refactored = base_code
-            notes = "No refactor applied."
+                refactored = candidate or base_code
+                notes = "LLM suggested refactor or echoed original."
         return {
             "refactored_code": refactored,
             "refactor_notes": notes,
@@ -0,0 +1,61 @@
+"""Per-phase attempt tracking to short-circuit futile retries.
+
+An `AttemptTracker` lives for one implementer or refactorer retry loop. It
+remembers:
+- the test report per candidate code fingerprint, so a behavior-identical
+  candidate is not re-run through pytest;
+- how often each (code fingerprint, failure signature) pair failed.
+
+`failure()` classifies a failed attempt as `new`, `repeat` (an identical
+dead end: callers feed the failure back into the prompt) or `abort` once
+more than `max_repeats` repeats were seen (`TDD_AGENTS_MAX_REPEATS`,
+default 1). Pure in-memory state; no side effects.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+from typing import Dict, Optional
+
+from tdd_agents.reports import SuiteReport
+from tdd_agents.fingerprint import code_fingerprint
+
+REPEAT_HINT = "The same candidate already failed exactly this way; try a different approach."
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class AttemptTracker:
+    def __init__(self, max_repeats: Optional[int] = None) -> None:
+        if max_repeats is None:
+            max_repeats = int(os.getenv("TDD_AGENTS_MAX_REPEATS", "1"))
+        self.max_repeats = max_repeats
+        self.repeats = 0
+        self._reports: Dict[str, SuiteReport] = {}
+        self._failures: Dict[str, int] = {}
+
+    def report_for(self, code: str) -> Optional[SuiteReport]:
+        """Report of an earlier attempt with the same code fingerprint, if any."""
+        return self._reports.get(code_fingerprint(code))
+
+    def remember(self, code: str, report: SuiteReport) -> None:
+        if report.outcome != "timeout":  # timeouts may be load-dependent
+            self._reports[code_fingerprint(code)] = report
+
+    def failure(self, code: str, signature: str) -> str:
+        """Record a failed attempt; return 'new', 'repeat' or 'abort'."""
+        key = _digest(code_fingerprint(code), signature)
+        count = self._failures[key] = self._failures.get(key, 0) + 1
+        if count == 1:
+            return "new"
+        self.repeats += 1
+        return "abort" if self.repeats > self.max_repeats else "repeat"
+
+
+__all__ = ["AttemptTracker", "REPEAT_HINT"]
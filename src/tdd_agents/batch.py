@@ -0,0 +1,155 @@
+"""Batch kata runner fanning `run_n_cycles` out over a process pool.
+
+Side effects: reads kata inputs, writes per-kata artifacts. Inputs:
+- a directory of kata text files (`*.txt`, `*.md`; id = file stem), or
+- a JSONL file, one object per line: `{"id"?, "kata"|"description", "language"?}`
+
+Each kata persists under `<out_dir>/<kata_id>/` using the `persist` layout
+plus `state.json` (final state). `<out_dir>/batch_summary.json` records
+throughput (katas/min, cycles/sec) and failure rate.
+"""
+
+from __future__ import annotations
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+_KATA_SUFFIXES = (".txt", ".md")
+
+
+@dataclass
+class KataSpec:
+    kata_id: str
+    description: str
+    language: Optional[str] = None
+
+
+def _safe_id(raw: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", raw).strip("._") or "kata"
+
+
+def _unique(specs: List[KataSpec], path: str) -> List[KataSpec]:
+    """Reject ids that would share a per-kata output directory."""
+    seen = set()
+    for spec in specs:
+        if spec.kata_id in seen:
+            raise ValueError(f"{path}: duplicate kata id {spec.kata_id!r}")
+        seen.add(spec.kata_id)
+    return specs
+
+
+def load_katas(path: str) -> List[KataSpec]:
+    """Load kata specs from a directory or JSONL file (sorted, stable, unique ids)."""
+    if os.path.isdir(path):
+        specs = []
+        for name in sorted(os.listdir(path)):
+            if not name.endswith(_KATA_SUFFIXES):
+                continue
+            with open(os.path.join(path, name), "r", encoding="utf-8") as f:
+                text = f.read().strip()
+            if text:
+                specs.append(KataSpec(_safe_id(os.path.splitext(name)[0]), text))
+        return _unique(specs, path)
+    specs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            text = str(obj.get("kata") or obj.get("description") or "").strip()
+            if not text:
+                raise ValueError(f"{path}:{index + 1}: missing 'kata' or 'description'")
+            kata_id = _safe_id(str(obj.get("id") or f"kata_{index + 1:04d}"))
+            specs.append(KataSpec(kata_id, text, obj.get("language")))
+    return _unique(specs, path)
+
+
+def run_one(
+    spec: KataSpec, language: str, cycles: int, out_dir: str, write_each: bool = False
+) -> Dict[str, Any]:
+    """Run one kata and persist its artifacts. Executes inside a pool worker."""
+    from tdd_agents.orchestrator import run_n_cycles
+    from tdd_agents.persist import write_current, write_snapshot
+
+    kata_dir = os.path.join(out_dir, spec.kata_id)
+    start = time.perf_counter()
+
+    def on_cycle(state_dict: Mapping[str, Any], cycle_number: int) -> None:
+        if write_each:
+            write_snapshot(state_dict, kata_dir, cycle_number)
+
+    try:
+        state = run_n_cycles(
+            spec.language or language, spec.description, max_cycles=cycles, on_cycle=on_cycle
+        )
+        write_current(state, kata_dir)
+        with open(os.path.join(kata_dir, "state.json"), "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        return {
+            "kata_id": spec.kata_id,
+            "cycles": len(state.get("tdd_history", [])),
+            "aborted": bool(state.get("aborted")),
+            "abort_reason": state.get("abort_reason", ""),
+            "error": "",
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+    except Exception as e:  # one broken kata must not sink the batch
+        return {
+            "kata_id": spec.kata_id,
+            "cycles": 0,
+            "aborted": False,
+            "abort_reason": "",
+            "error": f"{type(e).__name__}: {e}",
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+
+def summarize(results: List[Dict[str, Any]], elapsed_sec: float) -> Dict[str, Any]:
+    """Throughput + failure summary. Pure function."""
+    katas = len(results)
+    cycles = sum(int(r["cycles"]) for r in results)
+    failures = sum(1 for r in results if r["error"] or r["aborted"])
+    elapsed = max(elapsed_sec, 1e-9)
+    return {
+        "katas": katas,
+        "cycles": cycles,
+        "failures": failures,
+        "elapsed_sec": round(elapsed_sec, 3),
+        "katas_per_min": round(katas / elapsed * 60, 3),
+        "cycles_per_sec": round(cycles / elapsed, 3),
+        "failure_rate": round(failures / katas, 4) if katas else 0.0,
+    }
+
+
+def run_batch(
+    katas: List[KataSpec],
+    language: str,
+    cycles: int,
+    out_dir: str,
+    workers: int = 1,
+    write_each: bool = False,
+) -> Dict[str, Any]:
+    """Run all katas with at most `workers` in flight; write batch_summary.json."""
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(run_one, spec, language, cycles, out_dir, write_each) for spec in katas
+        ]
+        for fut in as_completed(futures):
+            results.append(fut.result())
+    results.sort(key=lambda r: str(r["kata_id"]))
+    summary = summarize(results, time.perf_counter() - start)
+    summary["workers"] = workers
+    summary["results"] = results
+    with open(os.path.join(out_dir, "batch_summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+__all__ = ["KataSpec", "load_katas", "run_batch", "run_one", "summarize"]
@@ -10,6 +10,10 @@ Examples:
 
     tdd-agents run --language python --kata-file kata.txt --cycles 2
 
+    tdd-agents batch --katas katas.jsonl --out-dir results --workers 4 --cycles 3
+
+    tdd-agents minimize --out-dir results/fizzbuzz
+
 Flags override environment variables. API key mapped to LLM_API_KEY.
 """
 
@@ -18,7 +22,7 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 from .orchestrator import run_n_cycles, run_single_cycle
 from .state import now_iso
 
@@ -41,6 +45,18 @@ def _apply_env_overrides(args: argparse.Namespace) -> None:
         os.environ["OPENAI_BASE_URL"] = args.base_url
     if args.api_key:
         os.environ["LLM_API_KEY"] = args.api_key
+    if getattr(args, "llm_cache", None):
+        os.environ["TDD_AGENTS_LLM_CACHE"] = args.llm_cache
+    if getattr(args, "record", None):
+        os.environ["TDD_AGENTS_RECORD"] = args.record
+    if getattr(args, "replay", None):
+        os.environ["TDD_AGENTS_REPLAY"] = args.replay
+    if getattr(args, "replay_latency", False):
+        os.environ["TDD_AGENTS_REPLAY_LATENCY"] = "1"
+    if getattr(args, "log_file", None):
+        os.environ["TDD_AGENTS_LOG_FILE"] = args.log_file
+    if getattr(args, "log_capacity", None) is not None:
+        os.environ["TDD_AGENTS_LOG_CAPACITY"] = str(args.log_capacity)
 
 
 def cmd_run(
@@ -57,8 +73,21 @@ def cmd_run(
     run_tests_each = getattr(args, "run_tests_each_cycle", False)
     git_commit = getattr(args, "git_commit", False)
     git_prefix = getattr(args, "git_prefix", "cycle")
+    import sys
+
+    on_event = None
+    progress = sys.stdout  # --stream lines; stderr when stdout carries JSONL events
+    if getattr(args, "output", "json") == "jsonl":
+        from .events import jsonl_writer
+
+        on_event = jsonl_writer(sys.stdout)
+        progress = sys.stderr
 
-    def on_cycle(state_dict: Dict[str, Any], cycle_number: int) -> None:
+    from .timeouts import AdaptiveTimeout
+
+    cycle_timeouts = AdaptiveTimeout.from_env()  # for --run-tests-each-cycle
+
+    def on_cycle(state_dict: Mapping[str, Any], cycle_number: int) -> None:
         # Persistence
         if out_dir:
             from .persist import write_current, write_snapshot
@@ -85,6 +114,7 @@ def cmd_run(
             diff_count = len(state_dict.get("code_diffs", []))
             print(
                 f"[cycle {cycle_number}] status={status} heuristic={reason} diffs={diff_count}",
+                file=progress,
                 flush=True,
             )
         # Optional test execution (isolated to persisted artifacts)
@@ -108,38 +138,34 @@ def cmd_run(
                         shutil.copy(
                             tests_file, _os.path.join(tmp_dir, "test_generated.py")
                         )
-                        result = subprocess.run(
-                            [sys.executable, "-m", "pytest", "-q"],
-                            cwd=tmp_dir,
-                            capture_output=True,
-                            text=True,
-                            timeout=15,
-                        )
-                        passed = result.returncode == 0
-                        summary_msg = (
-                            f"Generated tests {'passed' if passed else 'FAILED'}"
-                            + (
-                                f" stdout={result.stdout.strip().splitlines()[-1] if result.stdout.strip().splitlines() else ''}"
-                                if result.stdout
-                                else ""
+                        import time
+
+                        timeout = cycle_timeouts.current()
+                        started = time.perf_counter()
+                        try:
+                            result = subprocess.run(
+                                [sys.executable, "-m", "pytest", "-q"],
+                                cwd=tmp_dir,
+                                capture_output=True,
+                                text=True,
+                                timeout=timeout,
                             )
-                        )
-                        state_dict.setdefault("system_log", []).append(
-                            {
-                                "timestamp": state_dict.get("last_updated", ""),
-                                "message": summary_msg,
-                            }
-                        )
+                            verdict = "pass" if result.returncode == 0 else "fail"
+                            cycle_timeouts.observe(time.perf_counter() - started)
+                        except subprocess.TimeoutExpired:
+                            verdict = "timeout"
+                            cycle_timeouts.observe(timeout, timed_out=True)
                         if stream:
                             print(
-                                f"[cycle {cycle_number}] generated_tests={'pass' if passed else 'fail'}",
+                                f"[cycle {cycle_number}] generated_tests={verdict} timeout={timeout}s",
+                                file=progress,
                                 flush=True,
                             )
                     finally:
                         shutil.rmtree(tmp_dir, ignore_errors=True)
             except Exception as e:  # pragma: no cover - resilience
                 if stream:
-                    print(f"[cycle {cycle_number}] test run error: {e}", flush=True)
+                    print(f"[cycle {cycle_number}] test run error: {e}", file=progress, flush=True)
         # Optional git commit (requires git repo)
         if git_commit and out_dir:
             try:
@@ -161,10 +187,96 @@ def cmd_run(
     if args.cycles and args.cycles > 1:
         return dict(
             run_n_cycles(
-                args.language, kata_text, max_cycles=args.cycles, on_cycle=on_cycle
+                args.language,
+                kata_text,
+                max_cycles=args.cycles,
+                on_cycle=on_cycle,
+                on_event=on_event,
             )
         )
-    return dict(run_single_cycle(args.language, kata_text))
+    return dict(run_single_cycle(args.language, kata_text, on_event=on_event))
+
+
+def cmd_batch(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run many katas across a bounded process pool; returns throughput summary."""
+    from .batch import load_katas, run_batch
+
+    _apply_env_overrides(args)  # inherited by pool workers
+    katas = load_katas(args.katas)
+    if not katas:
+        raise SystemExit(f"No katas found in {args.katas}")
+    return run_batch(
+        katas,
+        args.language,
+        args.cycles,
+        args.out_dir,
+        workers=args.workers,
+        write_each=getattr(args, "write_each_cycle", False),
+    )
+
+
+def cmd_minimize(args: argparse.Namespace) -> Dict[str, Any]:
+    """Mark coverage-redundant tests of a persisted run dormant (tests/dormant.json)."""
+    from .minimize import dormant_tests
+    from .persist import write_dormant
+    from .suite import SnippetStore
+
+    paths = [
+        os.path.join(args.out_dir, "code", "main.py"),
+        os.path.join(args.out_dir, "tests", "generated_tests.py"),
+    ]
+    if not all(os.path.isfile(p) for p in paths):
+        raise SystemExit(f"No persisted code/tests under {args.out_dir}")
+    contents = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            contents.append(f.read())
+    snippets = list(SnippetStore.parse(contents[1]))
+    dormant = dormant_tests(contents[0], snippets, args.timeout)
+    write_dormant(dormant, args.out_dir)
+    return {"snippets": len(snippets), "dormant": len(dormant), "active": len(snippets) - len(dormant)}
+
+
+def _add_llm_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--provider", help="LLM provider id (e.g. deepseek, perplexity)")
+    p.add_argument("--model", help="Model name for provider")
+    p.add_argument(
+        "--base-url",
+        dest="base_url",
+        help="Custom base URL for OpenAI-compatible endpoint",
+    )
+    p.add_argument(
+        "--api-key", dest="api_key", help="API key (mapped to LLM_API_KEY)"
+    )
+    p.add_argument(
+        "--llm-cache",
+        dest="llm_cache",
+        help="SQLite file caching temperature-0 LLM responses (TDD_AGENTS_LLM_CACHE)",
+    )
+    p.add_argument("--record", help="Append every LLM call to this JSONL transcript")
+    p.add_argument(
+        "--replay", help="Serve LLM responses from a recorded JSONL transcript (no network)"
+    )
+    p.add_argument(
+        "--replay-latency",
+        dest="replay_latency",
+        action="store_true",
+        help="With --replay, sleep for each recorded call latency",
+    )
+
+
+def _add_log_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--log-file",
+        dest="log_file",
+        help="Append every system log record to this JSONL file (TDD_AGENTS_LOG_FILE)",
+    )
+    p.add_argument(
+        "--log-capacity",
+        dest="log_capacity",
+        type=int,
+        help="Max system log records kept in state output (default 1000)",
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -182,8 +294,6 @@ def build_parser() -> argparse.ArgumentParser:
     run_p.add_argument(
         "--cycles", type=int, default=1, help="Number of cycles (default 1)"
     )
-    run_p.add_argument("--provider", help="LLM provider id (e.g. deepseek, perplexity)")
-    run_p.add_argument("--model", help="Model name for provider")
     run_p.add_argument(
         "--stream", action="store_true", help="Stream per-cycle progress lines"
     )
@@ -215,28 +325,89 @@ def build_parser() -> argparse.ArgumentParser:
         help="Commit message Conventional Commit prefix (default feat)",
     )
     run_p.add_argument(
-        "--base-url",
-        dest="base_url",
-        help="Custom base URL for OpenAI-compatible endpoint",
-    )
-    run_p.add_argument(
-        "--api-key", dest="api_key", help="API key (mapped to LLM_API_KEY)"
+        "--output",
+        choices=["json", "jsonl"],
+        default="json",
+        help="json: final state blob (default); jsonl: one typed event per phase transition",
     )
+    _add_llm_args(run_p)
+    _add_log_args(run_p)
     run_p.set_defaults(func=cmd_run)
 
+    batch_p = sub.add_parser("batch", help="Run many katas across a process pool")
+    batch_p.add_argument(
+        "--katas", required=True, help="Directory of kata files or JSONL file"
+    )
+    batch_p.add_argument(
+        "--out-dir", dest="out_dir", required=True, help="Root directory for per-kata artifacts"
+    )
+    batch_p.add_argument(
+        "--language", default="python", help="Default language (per-kata override allowed)"
+    )
+    batch_p.add_argument(
+        "--cycles", type=int, default=3, help="Max cycles per kata (default 3)"
+    )
+    batch_p.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Max katas in flight (default cpu count)",
+    )
+    batch_p.add_argument(
+        "--write-each-cycle",
+        dest="write_each_cycle",
+        action="store_true",
+        help="Write snapshot per cycle under each kata directory",
+    )
+    _add_llm_args(batch_p)
+    _add_log_args(batch_p)
+    batch_p.set_defaults(func=cmd_batch)
+
+    min_p = sub.add_parser(
+        "minimize", help="Mark coverage-redundant generated tests dormant"
+    )
+    min_p.add_argument(
+        "--out-dir", dest="out_dir", required=True, help="Artifact directory of a run"
+    )
+    min_p.add_argument(
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="Max seconds for the coverage run (default 60)",
+    )
+    min_p.set_defaults(func=cmd_minimize)
+
     return parser
 
 
 def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.command == "batch":
+        summary = cmd_batch(args)
+        print(json.dumps(summary, indent=2))
+        print(
+            f"[tdd-agents] Batch completed at {now_iso()}: {summary['katas']} katas, "
+            f"{summary['katas_per_min']:.2f} katas/min, {summary['cycles_per_sec']:.2f} cycles/sec, "
+            f"failure rate {summary['failure_rate']:.1%}",
+            flush=True,
+        )
+        return
+    if args.command == "minimize":
+        print(json.dumps(cmd_minimize(args), indent=2))
+        return
     # mypy: callable attached via set_defaults; ignore attribute check safely
     result = cmd_run(args) if args.command == "run" else {}
-    print(json.dumps(result, indent=2))
-    print(
-        f"[tdd-agents] Completed at {now_iso()} with {len(result.get('tdd_history', []))} cycles",
-        flush=True,
+    completed = (
+        f"[tdd-agents] Completed at {now_iso()} with {len(result.get('tdd_history', []))} cycles"
     )
+    if getattr(args, "output", "json") == "jsonl":  # events already streamed; keep stdout pure
+        import sys
+
+        print(completed, file=sys.stderr, flush=True)
+        return
+    print(json.dumps(result, indent=2))
+    print(completed, flush=True)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,75 @@
+"""Typed phase-transition events for incremental consumers.
+
+The orchestrator emits one small dict per transition, carrying only the
+delta for that step (never the full state):
+
+- `tester_proposed`: attempt, test_code, compiled, error
+- `impl_attempt`: attempt, code, notes (speculative: candidates, verified)
+- `test_run`: phase, attempt, passed, outcome, summary, failures
+- `refactor_attempt`: attempt, code, notes
+- `supervisor_decision`: status, heuristic_reason, issues
+- `cycle_complete`: diff, aborted, abort_reason
+- `run_complete`: cycles, aborted, abort_reason, status
+
+Every event also has `event`, `cycle` and `ts` (epoch seconds). Callbacks
+may be plain functions or coroutine functions. Side effects: `jsonl_writer`
+writes to the given stream.
+"""
+
+from __future__ import annotations
+import inspect
+import json
+import time
+from typing import Any, Callable, Dict, Optional, TextIO
+
+EVENT_TYPES = (
+    "tester_proposed",
+    "impl_attempt",
+    "test_run",
+    "refactor_attempt",
+    "supervisor_decision",
+    "cycle_complete",
+    "run_complete",
+)
+
+
+class EventEmitter:
+    """Stamp and forward events to `callback`; no-op when it is None."""
+
+    def __init__(self, callback: Optional[Callable[[Dict[str, Any]], Any]] = None) -> None:
+        self.callback = callback
+        self.cycle = 0
+
+    async def emit(self, event: str, **fields: Any) -> None:
+        if self.callback is None:
+            return
+        payload = {"event": event, "cycle": self.cycle, "ts": round(time.time(), 6)}
+        payload.update(fields)
+        result = self.callback(payload)
+        if inspect.isawaitable(result):
+            await result
+
+    async def test_run(self, phase: str, attempt: int, report: Any) -> None:
+        """Emit a `test_run` event from a `SuiteReport`."""
+        await self.emit(
+            "test_run",
+            phase=phase,
+            attempt=attempt,
+            passed=report.passed,
+            outcome=report.outcome,
+            summary=report.summary,
+            failures=[{"name": c.name, "message": c.message} for c in report.failures],
+        )
+
+
+def jsonl_writer(stream: TextIO) -> Callable[[Dict[str, Any]], None]:
+    """Callback writing each event as one flushed JSON line to `stream`."""
+
+    def write(event: Dict[str, Any]) -> None:
+        stream.write(json.dumps(event) + "\n")
+        stream.flush()
+
+    return write
+
+
+__all__ = ["EVENT_TYPES", "EventEmitter", "jsonl_writer"]
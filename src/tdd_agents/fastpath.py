@@ -0,0 +1,144 @@
+"""In-process fast-path executor for simple assert-style generated suites.
+
+Most generated suites are plain `def test_x(): assert f(...) == ...` functions.
+For those we skip pytest collection and assertion rewriting: implementation
+and tests are compiled into fresh module namespaces inside a child forked by
+a warm pool worker (`worker_pool.run_fast_job`; the orchestrator process is
+multi-threaded and never forks itself), with timeout, and every `test*`
+function is called directly.
+
+`run_fast_report` returns a `SuiteReport` (`run_fast`: the `(passed,
+details)` contract of `run_tests`), or None when the suite uses anything
+pytest-specific (fixtures, decorators, imports, classes, top-level
+statements); callers then fall back to real pytest.
+"""
+
+from __future__ import annotations
+import ast
+import contextlib
+import inspect
+import io
+import sys
+import time
+import traceback
+import types
+from typing import Any, Dict, List, Optional, Tuple
+
+from tdd_agents.reports import CaseResult, SuiteReport, from_cases, timeout_report
+
+_TEST_FILE = "tests/test_generated.py"
+_PLACEHOLDER = "def test_placeholder():\n    assert True\n"
+_FALLBACK = "__fallback__"
+
+
+def is_simple_suite(impl_code: str, test_suite: str) -> bool:
+    """True if the suite only contains undecorated, argument-free functions. Pure."""
+    try:
+        ast.parse(impl_code or "")
+        tree = ast.parse(test_suite)
+    except SyntaxError:
+        return False  # let pytest produce the canonical collection error
+    for node in tree.body:
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue  # docstring / bare literal
+        if not isinstance(node, ast.FunctionDef) or node.decorator_list:
+            return False
+        args = node.args
+        if node.name.startswith("test") and (
+            args.args or args.posonlyargs or args.kwonlyargs or args.vararg or args.kwarg
+        ):
+            return False  # fixture injection
+    return not any(isinstance(n, (ast.Import, ast.ImportFrom)) for n in ast.walk(tree))
+
+
+def _star_exports(namespace: Dict[str, Any]) -> Dict[str, Any]:
+    """Names `from impl import *` would bind."""
+    public = namespace.get("__all__")
+    if public is not None:
+        return {name: namespace[name] for name in public}
+    return {k: v for k, v in namespace.items() if not k.startswith("_")}
+
+
+def _signature(exc: BaseException) -> str:
+    msg = str(exc).splitlines()[0] if str(exc) else ""
+    return f"{type(exc).__name__}: {msg}" if msg else type(exc).__name__
+
+
+def _execute(impl_code: str, test_suite: str) -> Tuple[Any, str, List[List[Any]]]:
+    """Run the suite in this process. Must only be called in a forked child.
+
+    Returns (passed, details, cases) with cases as [name, outcome, duration, message].
+    """
+    start = time.perf_counter()
+    impl = types.ModuleType("impl")
+    sys.modules["impl"] = impl
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        try:
+            impl_src = impl_code or "# empty impl\n"
+            exec(compile(impl_src, "impl.py", "exec", optimize=0), impl.__dict__)
+            namespace: Dict[str, Any] = {"__name__": "test_generated"}
+            namespace.update(_star_exports(impl.__dict__))
+            exec(compile(test_suite, _TEST_FILE, "exec", optimize=0), namespace)
+        except Exception as e:
+            case = [_TEST_FILE, "error", 0.0, _signature(e)]
+            return False, f"ERROR {_TEST_FILE} - {_signature(e)}\n1 error", [case]
+        tests = [
+            (name, obj)
+            for name, obj in namespace.items()
+            if name.startswith("test") and inspect.isfunction(obj)
+        ]
+        if any(inspect.signature(fn).parameters for _, fn in tests):
+            return _FALLBACK, "", []
+        progress: List[str] = []
+        failures: List[str] = []
+        cases: List[List[Any]] = []
+        for name, fn in tests:
+            case_start = time.perf_counter()
+            try:
+                fn()
+                progress.append(".")
+                cases.append([name, "passed", time.perf_counter() - case_start, ""])
+            except Exception as e:
+                progress.append("F")
+                tb = traceback.extract_tb(e.__traceback__)
+                where = f" (line {tb[-1].lineno})" if tb else ""
+                failures.append(f"FAILED {_TEST_FILE}::{name} - {_signature(e)}{where}")
+                cases.append([name, "failed", time.perf_counter() - case_start, _signature(e)])
+    elapsed = time.perf_counter() - start
+    if not tests:
+        return False, f"no tests ran in {elapsed:.2f}s", []
+    failed = len(failures)
+    counts = ([f"{failed} failed"] if failed else []) + (
+        [f"{len(tests) - failed} passed"] if len(tests) - failed else []
+    )
+    lines = ["".join(progress)] + failures + [f"{', '.join(counts)} in {elapsed:.2f}s"]
+    return failed == 0, "\n".join(lines)[:4000], cases
+
+
+def run_fast_report(impl_code: str, test_suite: str, timeout_sec: float = 5) -> Optional[SuiteReport]:
+    """Execute a simple suite in a pool worker's forked child; None means "use pytest"."""
+    suite = test_suite.strip() or _PLACEHOLDER
+    if not is_simple_suite(impl_code, suite):
+        return None
+    from tdd_agents.worker_pool import default_pool
+
+    started = time.perf_counter()
+    kind, value = default_pool().run_fast_job(impl_code, suite, timeout_sec)
+    if kind == "timeout":
+        return timeout_report(time.perf_counter() - started)
+    if kind == "error":
+        return None
+    passed, details, cases = value
+    if passed == _FALLBACK:
+        return None
+    results = tuple(CaseResult(str(n), str(o), round(float(d), 6), str(m)) for n, o, d, m in cases)
+    return from_cases(bool(passed), results, time.perf_counter() - started, str(details))
+
+
+def run_fast(impl_code: str, test_suite: str, timeout_sec: float = 5) -> Optional[Tuple[bool, str]]:
+    report = run_fast_report(impl_code, test_suite, timeout_sec)
+    return report.as_tuple() if report is not None else None
+
+
+__all__ = ["is_simple_suite", "run_fast", "run_fast_report"]
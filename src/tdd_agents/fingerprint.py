@@ -0,0 +1,32 @@
+"""AST-normalized code fingerprints.
+
+`code_fingerprint` hashes `ast.dump` of the parsed code, so candidates that
+differ only in whitespace, comments or formatting share a fingerprint.
+Unparseable code falls back to a hash of its whitespace-normalized text.
+Used to skip re-testing behavior-identical candidates, suppress cosmetic
+diffs and detect stagnation. Pure functions (results memoized).
+"""
+
+from __future__ import annotations
+import ast
+import hashlib
+from functools import lru_cache
+
+from tdd_agents.result_cache import normalize_code
+
+
+@lru_cache(maxsize=256)
+def code_fingerprint(code: str) -> str:
+    try:
+        text = "ast:" + ast.dump(ast.parse(code))
+    except (SyntaxError, ValueError):
+        text = "text:" + normalize_code(code)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def same_behavior(a: str, b: str) -> bool:
+    """True when both snippets parse to the same AST (or normalize equal)."""
+    return a == b or code_fingerprint(a) == code_fingerprint(b)
+
+
+__all__ = ["code_fingerprint", "same_behavior"]
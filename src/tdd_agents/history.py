@@ -0,0 +1,127 @@
+"""Bounded, append-only state lists with spill-to-disk.
+
+Side effects: once more than `retain` items are held, the oldest item is
+serialized as one JSON line to an append-only segment file (temp dir, or
+`TDD_AGENTS_HISTORY_DIR`) and dropped from memory. Indexing stays absolute:
+`len()` counts spilled items, recent items come from memory, older ones are
+read back by byte offset (as plain dicts/strings). The segment file is
+removed when the list is garbage collected.
+
+Enable via `TDD_AGENTS_HISTORY_RETAIN=N` (unset/0 keeps everything in memory).
+"""
+
+from __future__ import annotations
+import json
+import os
+import tempfile
+import threading
+import weakref
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def retention_from_env() -> int:
+    return max(0, int(os.getenv("TDD_AGENTS_HISTORY_RETAIN", "0") or 0))
+
+
+class _Segment:
+    """Append-only JSONL file addressed by per-line byte offsets."""
+
+    def __init__(self, prefix: str) -> None:
+        directory = os.getenv("TDD_AGENTS_HISTORY_DIR") or None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(prefix=prefix, suffix=".jsonl", dir=directory)
+        self._file = os.fdopen(fd, "a+b")
+        self._offsets: List[int] = []
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _Segment._remove, self._file, self.path)
+
+    @staticmethod
+    def _remove(handle: Any, path: str) -> None:
+        handle.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def append(self, item: Any) -> None:
+        line = json.dumps(asdict(item) if is_dataclass(item) else item).encode("utf-8") + b"\n"
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            self._offsets.append(self._file.tell())
+            self._file.write(line)
+
+    def read(self, index: int) -> Any:
+        with self._lock:
+            self._file.flush()
+            self._file.seek(self._offsets[index])
+            return json.loads(self._file.readline())
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            self._file.flush()
+            offsets = list(self._offsets)
+        with open(self.path, "rb") as f:  # sequential pass, independent handle
+            for _ in offsets:
+                yield json.loads(f.readline())
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+class SpillableList:
+    """Append-only list keeping the last `retain` items in memory."""
+
+    def __init__(self, retain: int, items: Optional[List[Any]] = None, prefix: str = "tdd_agents_") -> None:
+        self.retain = retain
+        self.spilled = 0
+        self._recent: List[Any] = []
+        self._segment: Optional[_Segment] = None
+        self._prefix = prefix
+        # Frozen views of in-memory items, keyed by absolute index (see StateView).
+        self.frozen: Dict[int, Any] = {}
+        for item in items or []:
+            self.append(item)
+
+    def append(self, item: Any) -> None:
+        self._recent.append(item)
+        if self.retain and len(self._recent) > self.retain:
+            if self._segment is None:
+                self._segment = _Segment(self._prefix)
+            self._segment.append(self._recent.pop(0))
+            self.frozen.pop(self.spilled, None)
+            self.spilled += 1
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._recent)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: int) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        if index >= self.spilled:
+            return self._recent[index - self.spilled]
+        assert self._segment is not None
+        return self._segment.read(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._segment is not None:
+            yield from self._segment
+        yield from list(self._recent)
+
+    def __repr__(self) -> str:
+        return f"SpillableList(retain={self.retain}, len={len(self)}, spilled={self.spilled})"
+
+    def close(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+
+
+__all__ = ["SpillableList", "retention_from_env"]
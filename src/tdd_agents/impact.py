@@ -0,0 +1,123 @@
+"""Impact-based test selection for refactorer verification.
+
+`impacted_tests(old_code, new_code, suite)` compares the top-level
+definitions of two versions of the implementation by AST, expands the
+changed ones to every definition and every name bound by a module-level
+statement (`step = _impl`) that (transitively) references them, and
+keeps only the test blocks of `suite` that reference an affected name (plus
+the non-test preamble). Returns None, meaning "run the full suite", when
+that cannot be decided safely: code that does not parse, changed
+module-level statements, a module-level statement that references an
+affected name without binding one, preamble helpers touching affected names,
+or every test being affected anyway. Pure functions (per-block scans memoized).
+"""
+
+from __future__ import annotations
+import ast
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+@dataclass(frozen=True)
+class Selection:
+    suite: str  # "" when no test reaches the change
+    selected: int
+    total: int
+
+
+def _references(node: ast.AST) -> FrozenSet[str]:
+    return frozenset(n.id for n in ast.walk(node) if isinstance(n, ast.Name))
+
+
+def _bindings(node: ast.AST) -> FrozenSet[str]:
+    """Names a module-level statement binds (assignment targets, imports)."""
+    names = {
+        n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)
+    }
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        names.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+    return frozenset(names)
+
+
+def _top_level(code: str) -> Optional[Tuple[Dict[str, ast.AST], List[ast.AST]]]:
+    """(definition name -> node, all other module-level statements)."""
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        return None
+    defs: Dict[str, ast.AST] = {}
+    rest: List[ast.AST] = []
+    for node in tree.body:
+        if isinstance(node, _DEFS):
+            defs[node.name] = node
+        else:
+            rest.append(node)
+    return defs, rest
+
+
+def affected_names(old_code: str, new_code: str) -> Optional[Set[str]]:
+    """Changed/added/removed definitions plus their transitive referrers."""
+    old, new = _top_level(old_code), _top_level(new_code)
+    if old is None or new is None or list(map(ast.dump, old[1])) != list(map(ast.dump, new[1])):
+        return None
+    old_defs, new_defs = old[0], new[0]
+    affected = {
+        name
+        for name in old_defs.keys() | new_defs.keys()
+        if name not in old_defs
+        or name not in new_defs
+        or ast.dump(old_defs[name]) != ast.dump(new_defs[name])
+    }
+    refs = {name: _references(node) for name, node in new_defs.items()}
+    statements = [(_bindings(node), _references(node)) for node in new[1]]
+    grew = True
+    while grew:
+        referrers = {name for name, used in refs.items() if name not in affected and used & affected}
+        for bound, used in statements:
+            if used & affected and not bound <= affected:
+                referrers |= bound
+            elif used & affected and not bound:
+                return None  # import-time side effect on the change
+        affected |= referrers
+        grew = bool(referrers)
+    return affected
+
+
+@lru_cache(maxsize=1024)
+def _block_refs(block: str) -> FrozenSet[str]:
+    try:
+        return _references(ast.parse(block))
+    except (SyntaxError, ValueError):
+        return frozenset()
+
+
+def select_tests(suite: str, affected: Set[str]) -> Optional[Selection]:
+    from tdd_agents.sharding import _test_names
+    from tdd_agents.symbols import split_blocks
+
+    preamble: List[str] = []
+    chosen: List[str] = []
+    total = 0
+    for block in split_blocks(suite):
+        if _test_names(block) is None:
+            if _block_refs(block) & affected:
+                return None  # helper/fixture may reach the change from any test
+            preamble.append(block)
+            continue
+        total += 1
+        if _block_refs(block) & affected:
+            chosen.append(block)
+    if not total or len(chosen) == total:
+        return None
+    return Selection("\n\n".join(preamble + chosen) if chosen else "", len(chosen), total)
+
+
+def impacted_tests(old_code: str, new_code: str, suite: str) -> Optional[Selection]:
+    affected = affected_names(old_code, new_code)
+    return None if affected is None else select_tests(suite, affected)
+
+
+__all__ = ["Selection", "affected_names", "impacted_tests", "select_tests"]
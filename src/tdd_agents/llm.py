@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Protocol, Optional, Any, Dict, Tuple, TYPE_CHECKING
+import asyncio
 import os
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
@@ -28,6 +29,22 @@ class LLMClient(Protocol):
         ...
 
 
+class AsyncLLMClient(Protocol):
+    async def agenerate(self, prompt: str) -> str:  # async counterpart
+        ...
+
+
+async def agenerate(client: Any, prompt: str) -> str:
+    """Await `client.agenerate` when offered; otherwise run `generate` off-loop.
+
+    Lets sync-only clients participate in the async orchestrator.
+    """
+    native = getattr(client, "agenerate", None)
+    if native is not None:
+        return str(await native(prompt))
+    return str(await asyncio.to_thread(client.generate, prompt))
+
+
 @dataclass
 class NullLLM:
     """Fallback deterministic LLM returning placeholder output.
@@ -39,6 +56,9 @@ class NullLLM:
     def generate(self, prompt: str) -> str:  # pragma: no cover - trivial
         return "[NULL_LLM_OUTPUT]"  # concise sentinel
 
+    async def agenerate(self, prompt: str) -> str:
+        return self.generate(prompt)
+
 
 @dataclass
 class OpenAIClient:
@@ -69,8 +89,61 @@ class OpenAIClient:
         # LangChain's ChatOpenAI returns an AIMessage; extract content
         return getattr(resp, "content", str(resp))
 
+    async def agenerate(self, prompt: str) -> str:
+        resp = await self._client.ainvoke(prompt)
+        return getattr(resp, "content", str(resp))
+
+
+def _with_response_cache(
+    client: OpenAIClient, info: Dict[str, Any]
+) -> Tuple[LLMClient, Dict[str, Any]]:
+    """Wrap a live client in `CachingLLM` when `TDD_AGENTS_LLM_CACHE` is set."""
+    path = os.getenv("TDD_AGENTS_LLM_CACHE")
+    if not path:
+        return client, info
+    from tdd_agents.llm_cache import CachingLLM, store_from_env
+
+    cached = CachingLLM(
+        client,
+        store_from_env(path),
+        provider=str(info["provider"]),
+        model=client.model,
+        temperature=client.temperature,
+    )
+    return cached, {**info, "cache": path}
+
 
 def build_llm() -> Tuple[LLMClient, Dict[str, Any]]:
+    """Factory selecting appropriate LLMClient, plus transcript record/replay.
+
+    `TDD_AGENTS_REPLAY` short-circuits provider selection (mode 'replay');
+    `TDD_AGENTS_RECORD` wraps whatever client was selected. See `transcript`.
+    """
+    replay_path = os.getenv("TDD_AGENTS_REPLAY")
+    if replay_path:
+        from tdd_agents.transcript import ReplayLLM
+
+        replay = ReplayLLM.from_file(
+            replay_path,
+            reproduce_latency=os.getenv("TDD_AGENTS_REPLAY_LATENCY") == "1",
+        )
+        return replay, {
+            "provider": "replay",
+            "model": "replay",
+            "base_url": None,
+            "mode": "replay",
+            "transcript": replay_path,
+        }
+    client, info = _select_llm()
+    record_path = os.getenv("TDD_AGENTS_RECORD")
+    if record_path:
+        from tdd_agents.transcript import RecordingLLM
+
+        return RecordingLLM.to_file(client, record_path), {**info, "transcript": record_path}
+    return client, info
+
+
+def _select_llm() -> Tuple[LLMClient, Dict[str, Any]]:
     """Factory selecting appropriate LLMClient.
 
     Returns (client, info_dict) where info_dict contains:
@@ -78,6 +151,7 @@ def build_llm() -> Tuple[LLMClient, Dict[str, Any]]:
     - model: model name (or 'null')
     - base_url: custom base URL if any
     - mode: 'live' or 'offline'
+    - cache: response cache path (only when enabled for a live client)
     """
     provider = os.getenv("LLM_PROVIDER", "").lower()
     api_key = (
@@ -107,12 +181,15 @@ def build_llm() -> Tuple[LLMClient, Dict[str, Any]]:
     if api_key:
         try:
             client = OpenAIClient(model=model, api_key=api_key, base_url=base_url)
-            return client, {
-                "provider": provider or "openai",
-                "model": model,
-                "base_url": base_url,
-                "mode": "live",
-            }
+            return _with_response_cache(
+                client,
+                {
+                    "provider": provider or "openai",
+                    "model": model,
+                    "base_url": base_url,
+                    "mode": "live",
+                },
+            )
         except Exception:
             return NullLLM(), {
                 "provider": provider or "openai",
@@ -0,0 +1,193 @@
+"""Caching `LLMClient` wrapper backed by a local SQLite store.
+
+Side effects: reads/writes the SQLite file. Keys combine provider, model,
+temperature and a prompt hash. Only temperature 0 calls are cached; sampled
+generations pass straight through so retries still see fresh candidates.
+Calls made inside `bypass_cache()` (speculative candidates) neither read nor
+write the store, so K racing candidates never collapse into one reply.
+Callers that reject a reply (syntax error, failing tests) drop it with
+`invalidate(entries)` on the entries `served_responses()` collected, so the
+retry and later runs ask the provider again instead of replaying it.
+
+Eviction: entries older than the TTL are dropped on access, and the store is
+trimmed to `max_entries` by least recent access.
+
+Enable via `TDD_AGENTS_LLM_CACHE=/path/cache.sqlite` (or CLI `--llm-cache`);
+tune with `TDD_AGENTS_LLM_CACHE_TTL` (seconds) and
+`TDD_AGENTS_LLM_CACHE_MAX_ENTRIES`.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+_BYPASS: ContextVar[bool] = ContextVar("tdd_agents_llm_cache_bypass", default=False)
+_SERVED: ContextVar[Optional[List[Tuple["SQLiteResponseStore", str]]]] = ContextVar(
+    "tdd_agents_llm_cache_served", default=None
+)
+
+
+@contextmanager
+def bypass_cache() -> Iterator[None]:
+    """Route LLM calls in this context (and tasks it spawns) past the cache."""
+    token = _BYPASS.set(True)
+    try:
+        yield
+    finally:
+        _BYPASS.reset(token)
+
+
+@contextmanager
+def served_responses() -> Iterator[List[Tuple["SQLiteResponseStore", str]]]:
+    """Collect the (store, key) entries cached calls in this context touch."""
+    entries: List[Tuple[SQLiteResponseStore, str]] = []
+    token = _SERVED.set(entries)
+    try:
+        yield entries
+    finally:
+        _SERVED.reset(token)
+
+
+def invalidate(entries: List[Tuple["SQLiteResponseStore", str]]) -> None:
+    """Drop rejected replies so the next identical prompt reaches the provider."""
+    for store, key in entries:
+        store.delete(key)
+    entries.clear()
+
+
+class SQLiteResponseStore:
+    """Key/value response store with TTL + LRU-by-access trimming."""
+
+    def __init__(
+        self, path: str, max_entries: int = 10000, ttl_sec: Optional[float] = None
+    ) -> None:
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if self.ttl_sec is not None and now - row[1] > self.ttl_sec:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            return str(row[0])
+
+    def put(self, key: str, response: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+
+@dataclass
+class CachingLLM:
+    """Wrap any LLM client; serve repeated temperature-0 prompts from `store`."""
+
+    inner: Any
+    store: SQLiteResponseStore
+    provider: str = ""
+    model: str = ""
+    temperature: float = 0.0
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def _key(self, prompt: str) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw = json.dumps([self.provider, self.model, self.temperature, prompt_hash])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _lookup(self, prompt: str) -> tuple[str, Optional[str]]:
+        if self.temperature > 0 or _BYPASS.get():
+            return "", None
+        key = self._key(prompt)
+        served = _SERVED.get()
+        if served is not None:
+            served.append((self.store, key))
+        cached = self.store.get(key)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return key, cached
+
+    def generate(self, prompt: str) -> str:
+        key, cached = self._lookup(prompt)
+        if cached is not None:
+            return cached
+        response = str(self.inner.generate(prompt))
+        if key:
+            self.store.put(key, response)
+        return response
+
+    async def agenerate(self, prompt: str) -> str:
+        from tdd_agents.llm import agenerate
+
+        key, cached = self._lookup(prompt)
+        if cached is not None:
+            return cached
+        response = await agenerate(self.inner, prompt)
+        if key:
+            self.store.put(key, response)
+        return response
+
+
+def store_from_env(path: str) -> SQLiteResponseStore:
+    ttl = os.getenv("TDD_AGENTS_LLM_CACHE_TTL")
+    return SQLiteResponseStore(
+        path,
+        max_entries=int(os.getenv("TDD_AGENTS_LLM_CACHE_MAX_ENTRIES", "10000")),
+        ttl_sec=float(ttl) if ttl else None,
+    )
+
+
+__all__ = [
+    "CachingLLM",
+    "SQLiteResponseStore",
+    "bypass_cache",
+    "invalidate",
+    "served_responses",
+    "store_from_env",
+]
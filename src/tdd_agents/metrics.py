@@ -0,0 +1,108 @@
+"""Per-phase timing spans for orchestrator cycles.
+
+Side effects: none beyond `time.perf_counter`. A `MetricsRecorder` collects
+`Span`s (phase, name, cycle, attempt, outcome, duration) for agent `act`,
+LLM `generate`, `run_tests`, `compile_snippet`, diff and persist calls.
+The orchestrator publishes `recorder.to_dict()` as `state.metrics` after each
+cycle, so `on_cycle` callbacks and the returned state both see it.
+
+`TimedLLM` wraps a role-scoped client so LLM wait time is separated from the
+rest of the agent step.
+"""
+
+from __future__ import annotations
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, Iterator, List
+
+
+@dataclass
+class Span:
+    phase: str
+    name: str
+    cycle: int
+    attempt: int
+    start_ms: float = 0.0
+    duration_ms: float = 0.0
+    outcome: str = "ok"
+    attrs: Dict[str, Any] = field(default_factory=dict)  # e.g. run_tests `timeout_s`
+
+
+class MetricsRecorder:
+    """Collects spans for one run; `cycle` is set by the orchestrator."""
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self.cycle = 0
+        self._origin = time.perf_counter()
+        self._attempts: Dict[str, int] = {}
+
+    def attempt_of(self, phase: str) -> int:
+        """Attempt number of the most recent span opened for `phase`."""
+        return self._attempts.get(phase, 0)
+
+    @contextmanager
+    def span(self, phase: str, name: str, attempt: int | None = None) -> Iterator[Span]:
+        """Time the block; callers may set `span.outcome`. Exceptions mark 'error'."""
+        if attempt is None:
+            attempt = self.attempt_of(phase)
+        else:
+            self._attempts[phase] = attempt
+        started = time.perf_counter()
+        span = Span(
+            phase, name, self.cycle, attempt, round((started - self._origin) * 1000, 3)
+        )
+        try:
+            yield span
+        except BaseException:
+            span.outcome = "error"
+            raise
+        finally:
+            span.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+            self.spans.append(span)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Aggregate per `phase.name`: count, total, mean and max ms."""
+        grouped: Dict[str, List[float]] = {}
+        for span in self.spans:
+            grouped.setdefault(f"{span.phase}.{span.name}", []).append(span.duration_ms)
+        return {
+            key: {
+                "count": len(values),
+                "total_ms": round(sum(values), 3),
+                "mean_ms": round(sum(values) / len(values), 3),
+                "max_ms": round(max(values), 3),
+            }
+            for key, values in sorted(grouped.items())
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"spans": [asdict(s) for s in self.spans], "summary": self.summary()}
+
+
+@dataclass
+class TimedLLM:
+    """Record an `llm.generate` span per call on behalf of `role`."""
+
+    inner: Any
+    recorder: MetricsRecorder = field(default_factory=MetricsRecorder)
+    role: str = ""
+
+    def for_role(self, role: str) -> "TimedLLM":
+        from tdd_agents.transcript import for_role
+
+        return replace(self, inner=for_role(self.inner, role), role=role)
+
+    def generate(self, prompt: str) -> str:
+        with self.recorder.span(self.role, "llm.generate"):
+            return str(self.inner.generate(prompt))
+
+    async def agenerate(self, prompt: str) -> str:
+        from tdd_agents.llm import agenerate
+
+        with self.recorder.span(self.role, "llm.generate"):
+            return await agenerate(self.inner, prompt)
+
+
+__all__ = ["MetricsRecorder", "Span", "TimedLLM"]
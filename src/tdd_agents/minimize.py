@@ -0,0 +1,147 @@
+"""Coverage-guided minimization of the generated test suite.
+
+Side-effect boundary: one Python subprocess in a pooled workspace that
+imports `impl.py`, executes the suite snippet by snippet in one namespace
+(module semantics) and calls each test function / `Test*` class method
+directly under `sys.settrace`, recording the arcs (line -> next line, entry
+and exit included) it executes in `impl.py`. Arcs stand in for line + branch
+coverage without adding coverage.py as a dependency.
+
+A test snippet whose arcs are all covered by earlier kept tests is dormant:
+still part of `full_test_suite` and persisted to `tests/generated_tests.py`,
+but left out of per-attempt verification runs (the cycle-end full-suite
+run, `TDD_AGENTS_FULL_SUITE_EVERY`, still includes it). Snippets that are not pure
+test definitions, take fixtures, fail, or reach no implementation code are
+never dormant. Enable between cycles with `TDD_AGENTS_MINIMIZE_EVERY` (every
+N cycles, default 0: off) or run `tdd-agents minimize` on an output dir.
+"""
+
+from __future__ import annotations
+import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING, FrozenSet, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from tdd_agents.state import SystemState
+
+Arcs = FrozenSet[Tuple[int, int]]
+
+_MARKER = "TDD_AGENTS_COVERAGE "
+
+_COLLECTOR = r"""
+import json, os, sys
+sys.path.insert(0, os.getcwd())
+job = json.load(sys.stdin)
+target = os.path.abspath("impl.py")
+arcs = set()
+
+def frame_tracer(frame):
+    prev = [-frame.f_code.co_firstlineno]
+    def local(frame, event, arg):
+        if event == "line":
+            arcs.add((prev[0], frame.f_lineno))
+            prev[0] = frame.f_lineno
+        elif event == "return":
+            arcs.add((prev[0], -frame.f_code.co_firstlineno))
+        return local
+    return local
+
+def tracer(frame, event, arg):
+    if event == "call" and frame.f_code.co_filename == target:
+        return frame_tracer(frame)
+    return None
+
+def traced(fn):
+    arcs.clear()
+    sys.settrace(tracer)
+    try:
+        fn()
+    finally:
+        sys.settrace(None)
+    return set(arcs)
+
+ns = {"__name__": "test_generated"}
+exec("from impl import *", ns)
+out = []
+for snippet, names in zip(job["snippets"], job["tests"]):
+    covered = None
+    try:
+        exec(compile(snippet, "test_generated.py", "exec"), ns)
+        if names is not None:
+            covered = set()
+            for name in names:
+                obj = ns[name]
+                if isinstance(obj, type):
+                    inst = obj()
+                    for attr in sorted(vars(obj)):
+                        if attr.startswith("test") and callable(getattr(inst, attr)):
+                            covered |= traced(getattr(inst, attr))
+                else:
+                    covered |= traced(obj)
+            covered = sorted(covered)
+    except Exception:
+        covered = None
+    out.append(covered)
+print("TDD_AGENTS_COVERAGE " + json.dumps(out))
+"""
+
+
+def collect_coverage(
+    impl_code: str, snippets: Sequence[str], timeout_sec: float
+) -> Optional[List[Optional[Arcs]]]:
+    """Per-snippet arcs (None: not a runnable passing test); None on timeout/crash."""
+    from tdd_agents.runtime_validation import _pytest_env
+    from tdd_agents.sharding import _test_names
+    from tdd_agents.workspace import default_workspaces
+
+    job = json.dumps({"snippets": list(snippets), "tests": [_test_names(s) for s in snippets]})
+    with default_workspaces().acquire(impl_code, "") as workspace:
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-c", _COLLECTOR],
+                input=job,
+                cwd=workspace.path,
+                env=_pytest_env(workspace.path),
+                capture_output=True,
+                text=True,
+                timeout=timeout_sec,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(_MARKER):
+            raw = json.loads(line[len(_MARKER) :])
+            return [None if arcs is None else frozenset(map(tuple, arcs)) for arcs in raw]
+    return None
+
+
+def redundant_tests(snippets: Sequence[str], coverage: Sequence[Optional[Arcs]]) -> List[str]:
+    """Snippets whose arcs earlier kept tests already cover. Pure function."""
+    covered: set = set()
+    dormant: List[str] = []
+    for snippet, arcs in zip(snippets, coverage):
+        if not arcs:
+            continue
+        if arcs <= covered:
+            dormant.append(snippet)
+        else:
+            covered |= arcs
+    return dormant
+
+
+def dormant_tests(impl_code: str, snippets: Sequence[str], timeout_sec: float) -> List[str]:
+    """Dormant snippets for `impl_code`; [] (all active) if coverage is unavailable."""
+    coverage = collect_coverage(impl_code, snippets, timeout_sec)
+    return [] if coverage is None else redundant_tests(snippets, coverage)
+
+
+def minimize_suite(state: "SystemState", timeout_sec: float) -> int:
+    """Recompute `state.dormant_tests` against `state.final_code`; returns the count."""
+    snippets = list(state.full_test_suite)
+    state.dormant_tests = dormant_tests(state.final_code, snippets, timeout_sec)
+    state.log(f"Suite minimized: {len(state.dormant_tests)}/{len(snippets)} snippets dormant.", phase="cycle")
+    return len(state.dormant_tests)
+
+
+__all__ = ["collect_coverage", "dormant_tests", "minimize_suite", "redundant_tests"]
@@ -43,11 +43,8 @@ def choose_target_function(kata_description: str) -> str:
 
 
 def extract_called_functions(test_code: str) -> Set[str]:
-    """Extract function names called in test code (excluding test_ functions). Pure."""
-    names: Set[str] = set()
-    for match in re.finditer(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\(", test_code):
-        n = match.group(1)
-        if n.startswith("test_"):
-            continue
-        names.add(n)
-    return names
+    """Function names called in test code (excluding test_ functions and helpers
+    the code defines itself). Pure."""
+    from tdd_agents.symbols import index_for
+
+    return set(index_for(test_code).calls)
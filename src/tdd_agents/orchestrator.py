@@ -1,11 +1,17 @@
 """Orchestrator loop for multi-agent TDD cycles.
 
 Provides single-cycle and multi-cycle entry points. Multi-cycle stops when
-supervisor returns status 'done' or when max_cycles reached.
+supervisor returns status 'done' or when max_cycles reached. The async
+entry points (`arun_single_cycle`, `arun_n_cycles`) hold the cycle logic;
+the sync ones are thin `asyncio.run` wrappers.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Tuple
+import asyncio
+import functools
+import inspect
+import itertools
+from typing import Any, Dict, Iterator, Tuple
 from .state import (
     initial_state,
     append_cycle,
@@ -25,17 +31,26 @@ from .validation import (
     validate_refactorer,
     validate_supervisor,
 )
-from .state import now_iso
 from .llm import build_llm
+from .llm_cache import bypass_cache, invalidate, served_responses
+from .transcript import for_role
+from .metrics import MetricsRecorder, TimedLLM
+from .attempts import AttemptTracker, REPEAT_HINT
+from .events import EventEmitter
+from .fingerprint import same_behavior
+from .timeouts import AdaptiveTimeout
 
 
-def _run_cycle(
+async def _arun_cycle(
     state: Any,
     cycle_number: int,
     tester: TesterAgent,
     implementer: ImplementerAgent,
     refactorer: RefactorerAgent,
     supervisor: SupervisorAgent,
+    recorder: MetricsRecorder | None = None,
+    events: EventEmitter | None = None,
+    timeouts: AdaptiveTimeout | None = None,
 ) -> Tuple[str, Dict[str, Any]]:
     """Execute a single cycle with runtime validation + retries.
 
@@ -44,24 +59,58 @@ def _run_cycle(
     - Tester phase: syntax errors trigger single retry; failing assertion kept.
     - Implementer/refactorer phases: require tests to pass; retries up to env limit.
     - On exhaustion set state.aborted and do not append cycle.
+    Every agent step, test run, compile check and the diff is timed as a span
+    on `recorder`; callers publish it via `state.metrics`. Phase transitions
+    are reported to `events` (see `tdd_agents.events`). Test run timeouts come
+    from `timeouts` (see `tdd_agents.timeouts`); each `run_tests` span
+    records the chosen `timeout_s` and its `scope` (`full` or `impacted`,
+    see `tdd_agents.impact`) in its attrs.
     """
     import os
-    from tdd_agents.runtime_validation import compile_snippet, run_tests
+    from tdd_agents.impact import impacted_tests
+    from tdd_agents.reports import SuiteReport
+    from tdd_agents.runtime_validation import compile_snippet, arun_tests_report
+
+    recorder = recorder or MetricsRecorder()
+    recorder.cycle = cycle_number
+    events = events or EventEmitter()
+    events.cycle = cycle_number
+    timeouts = timeouts or AdaptiveTimeout.from_env()
 
+    async def _run_tests(phase: str, code: str, suite: str, scope: str = "full") -> Any:
+        with recorder.span(phase, "run_tests") as span:
+            span.attrs["scope"] = scope
+            span.attrs["timeout_s"] = timeout = timeouts.current()
+            report = await arun_tests_report(code, suite, timeout)
+            span.outcome = report.outcome
+        timeouts.observe(report.duration, report.outcome == "timeout")
+        return report
     max_retries = int(os.getenv("TDD_AGENTS_MAX_RETRIES", "3"))
+    speculative_k = int(os.getenv("TDD_AGENTS_SPECULATIVE_K", "1"))
 
     pre_cycle_code = state.final_code  # capture code before any changes this cycle
     # Tester phase
     tester_attempts = 0
     while True:
-        tester_raw = tester.act(state.to_dict())
+        with recorder.span("tester", "act", tester_attempts + 1), served_responses() as served:
+            tester_raw = await tester.aact(state.view())
         tester_out, tester_msg = validate_tester(tester_raw)
-        state.system_log.append({"timestamp": now_iso(), "message": tester_msg})
-        ok, comp_msg = compile_snippet(tester_out.get("test_code", ""))
+        state.log(tester_msg, phase="tester")
+        with recorder.span("tester", "compile_snippet") as span:
+            ok, comp_msg = compile_snippet(tester_out.get("test_code", ""))
+            span.outcome = "ok" if ok else "syntax_error"
+        await events.emit(
+            "tester_proposed",
+            attempt=tester_attempts + 1,
+            test_code=tester_out.get("test_code", ""),
+            compiled=ok,
+            error="" if ok else comp_msg,
+        )
         if ok:
             break
+        invalidate(served)  # the retry (and later runs) must not replay this reply
         tester_attempts += 1
-        state.system_log.append({"timestamp": now_iso(), "message": f"Tester syntax error; rollback attempt {tester_attempts}: {comp_msg}"})
+        state.log(f"Tester syntax error; rollback attempt {tester_attempts}: {comp_msg}", "warning", "tester")
         if tester_attempts >= max_retries:
             state.aborted = True
             state.abort_reason = f"tester_syntax_retry_exhausted: {comp_msg}"
@@ -70,29 +119,89 @@ def _run_cycle(
     # Implementer phase with test run requirement (allow failing due to assertion until implementation stage?)
     impl_attempts = 0
     impl_out: Dict[str, Any] = {}
+    last_failure = ""  # failing-test bullets from the previous attempt, fed to the prompt
+    impl_tracker = AttemptTracker()
+    # Accumulated suite + current tester snippet: used for stub inference and test runs
+    new_test_snippet = tester_out.get("test_code", "")
+    combined_suite = state.full_test_suite.with_snippet(new_test_snippet, state.dormant_tests)
+
+    async def _candidate(failure: str, variants: Iterator[int]) -> Tuple[Dict[str, Any], str]:
+        """One speculative candidate; each gets its own variant hint in the prompt."""
+        view = state.view(
+            full_test_suite=combined_suite,
+            last_failure=failure,
+            candidate_variant=next(variants),
+            candidate_count=speculative_k,
+        )
+        with recorder.span("implementer", "act"):
+            return validate_implementer(await implementer.aact(view))
+
     while True:
-        # Provide tester snippet to implementer for stub inference
-        augmented_state = state.to_dict()
-        new_test_snippet = tester_out.get("test_code", "")
-        combined_for_stubs = augmented_state.get("full_test_suite", "").strip()
-        if new_test_snippet and new_test_snippet.strip() not in combined_for_stubs.split("\n\n"):
-            combined_for_stubs = (combined_for_stubs + "\n\n" + new_test_snippet).strip() if combined_for_stubs else new_test_snippet
-        augmented_state["full_test_suite"] = combined_for_stubs
-        implementer_raw = implementer.act(augmented_state)
-        impl_out, impl_msg = validate_implementer(implementer_raw)
-        state.system_log.append({"timestamp": now_iso(), "message": impl_msg})
-        # Run tests combining candidate code with accumulated test suite + current tester snippet
-        combined_suite = state.full_test_suite.strip()
-        if new_test_snippet and new_test_snippet.strip() not in combined_suite.split("\n\n"):
-            combined_suite = (combined_suite + "\n\n" + new_test_snippet).strip() if combined_suite else new_test_snippet
-        passed, details = run_tests(impl_out.get("updated_code", ""), combined_suite)
-        state.system_log.append({"timestamp": now_iso(), "message": f"Implementer test run passed={passed}."})
-        if passed:
-            # Accept tester snippet into suite
-            state.full_test_suite = combined_suite
+        augmented_state = state.view(full_test_suite=combined_suite, last_failure=last_failure)
+        if speculative_k > 1:
+            from tdd_agents.speculative import aspeculate
+
+            produce = functools.partial(_candidate, last_failure, itertools.count(1))
+            served = []  # speculative calls bypass the response cache
+            with recorder.span("implementer", "speculate", impl_attempts + 1) as span, bypass_cache():
+                span.attrs["timeout_s"] = timeout = timeouts.current()
+                spec = await aspeculate(produce, speculative_k, combined_suite, timeout_sec=timeout)
+                report = spec.report
+                span.outcome = report.outcome
+            timeouts.observe(report.duration, report.outcome == "timeout")
+            impl_out = spec.output
+            for impl_msg in spec.messages:
+                state.log(impl_msg, phase="implementer")
+            state.log(f"Implementer speculative candidates={speculative_k} verified={spec.tested}.", phase="implementer")
+            await events.emit(
+                "impl_attempt",
+                attempt=impl_attempts + 1,
+                code=impl_out.get("updated_code", ""),
+                notes=impl_out.get("implementation_notes", ""),
+                candidates=speculative_k,
+                verified=spec.tested,
+            )
+        else:
+            with recorder.span("implementer", "act", impl_attempts + 1), served_responses() as served:
+                implementer_raw = await implementer.aact(augmented_state)
+            impl_out, impl_msg = validate_implementer(implementer_raw)
+            state.log(impl_msg, phase="implementer")
+            await events.emit(
+                "impl_attempt",
+                attempt=impl_attempts + 1,
+                code=impl_out.get("updated_code", ""),
+                notes=impl_out.get("implementation_notes", ""),
+            )
+            known = impl_tracker.report_for(impl_out.get("updated_code", ""))
+            if known is not None:
+                report = known
+                state.log("Implementer candidate identical to an earlier attempt; reusing its test result.", "debug", "implementer")
+            else:
+                report = await _run_tests("implementer", impl_out.get("updated_code", ""), combined_suite)
+        impl_tracker.remember(impl_out.get("updated_code", ""), report)
+        await events.test_run("implementer", impl_attempts + 1, report)
+        state.log(f"Implementer test run passed={report.passed}.", phase="implementer")
+        if report.passed:
+            # Accept tester snippet into suite (no-op for near-duplicates)
+            state.full_test_suite.add(new_test_snippet)
+            impl_report = report
             break
+        invalidate(served)
         impl_attempts += 1
-        state.system_log.append({"timestamp": now_iso(), "message": f"Implementer failing tests attempt {impl_attempts}: {details.splitlines()[:1][0] if details else 'no details'}"})
+        state.log(f"Implementer failing tests attempt {impl_attempts}: {report.signature or 'no details'}", "warning", "implementer")
+        if report.outcome == "resource":  # retrying a CPU/memory bomb only burns the host
+            state.aborted = True
+            state.abort_reason = "implementer_resource_limit"
+            return "aborted", {"tester": tester_out, "implementer": impl_out}
+        last_failure = report.failure_text()
+        verdict = impl_tracker.failure(impl_out.get("updated_code", ""), report.signature)
+        if verdict == "abort":
+            state.log("Implementer repeated an identical failing candidate; aborting.", "warning", "implementer")
+            state.aborted = True
+            state.abort_reason = "implementer_repeated_failure"
+            return "aborted", {"tester": tester_out, "implementer": impl_out}
+        if verdict == "repeat":
+            last_failure = f"{last_failure}\n{REPEAT_HINT}"
         if impl_attempts >= max_retries:
             state.aborted = True
             state.abort_reason = "implementer_retry_exhausted"
@@ -101,37 +210,118 @@ def _run_cycle(
     # Persist implementer code as current baseline for refactorer reuse
     state.final_code = impl_out.get("updated_code", state.final_code)
 
-    # Refactorer phase: must keep tests green
+    # Refactorer phase: must keep tests green. Proposals are checked against the
+    # active tests that reach the changed definitions; every
+    # `TDD_AGENTS_FULL_SUITE_EVERY` cycles (0: every proposal against the active
+    # suite, no extra run) a green one is also run against the whole suite,
+    # dormant tests included. A full-suite failure is retried like any other
+    # (the refactorer sees the failing tests, so it can also repair a regression
+    # an earlier impacted-only cycle let through); once retries run out the
+    # cycle reverts to the implementer's code if that passes the full suite,
+    # and fails otherwise.
+    full_every = int(os.getenv("TDD_AGENTS_FULL_SUITE_EVERY", "1"))
+    full_due = full_every > 0 and cycle_number % full_every == 0
+    full_suite = state.full_test_suite.render()
+    impl_code = impl_out.get("updated_code", "")
+    impl_full = None  # implementer code's full-suite report, once a refactor failed it
+
+    async def _verify_refactor(base_code: str, code: str) -> Tuple[Any, str | None]:
+        """(report, suite it covered; None for an impacted subset)."""
+        suite = state.full_test_suite.render_active(state.dormant_tests)
+        selection = impacted_tests(base_code, code, suite) if full_every > 0 else None
+        if selection is None:
+            return await _run_tests("refactorer", code, suite), suite
+        state.log(f"Refactorer impacted tests {selection.selected}/{selection.total}.", "debug", "refactorer")
+        if not selection.suite:
+            return SuiteReport(True, "passed"), None
+        return await _run_tests("refactorer", code, selection.suite, "impacted"), None
+
     ref_attempts = 0
     refactor_out: Dict[str, Any] = {}
+    last_failure = ""
+    ref_tracker = AttemptTracker()
     while True:
-        refactor_raw = refactorer.act(state.to_dict())
+        with recorder.span("refactorer", "act", ref_attempts + 1), served_responses() as served:
+            refactor_raw = await refactorer.aact(state.view(last_failure=last_failure))
         refactor_out, refactor_msg = validate_refactorer(refactor_raw)
-        state.system_log.append({"timestamp": now_iso(), "message": refactor_msg})
+        state.log(refactor_msg, phase="refactorer")
         candidate_code = refactor_out.get("refactored_code") or impl_out.get("updated_code")
-        state.system_log.append({"timestamp": now_iso(), "message": f"Refactorer candidate_code_len={len(candidate_code or '')}"})
-        passed, details = run_tests(candidate_code or impl_out.get("updated_code", ""), state.full_test_suite)
-        state.system_log.append({"timestamp": now_iso(), "message": f"Refactorer test run passed={passed}."})
-        if passed:
+        await events.emit(
+            "refactor_attempt",
+            attempt=ref_attempts + 1,
+            code=refactor_out.get("refactored_code", ""),
+            notes=refactor_out.get("refactor_notes", ""),
+        )
+        state.log(f"Refactorer candidate_code_len={len(candidate_code or '')}", "debug", "refactorer")
+        candidate_code = candidate_code or impl_out.get("updated_code", "")
+        known = ref_tracker.report_for(candidate_code)
+        verified_suite: str | None = None  # suite the green report is known to cover
+        if same_behavior(candidate_code, impl_code):
+            report = impl_report  # same AST, same suite: green by construction
+            verified_suite = combined_suite
+            state.log("Refactorer candidate is behavior-identical to the implementation; skipping test run.", "debug", "refactorer")
+        elif known is not None:
+            report = known
+            state.log("Refactorer candidate identical to an earlier attempt; reusing its test result.", "debug", "refactorer")
+        else:
+            report, verified_suite = await _verify_refactor(impl_code, candidate_code)
+            ref_tracker.remember(candidate_code, report)
+        await events.test_run("refactorer", ref_attempts + 1, report)
+        state.log(f"Refactorer test run passed={report.passed}.", phase="refactorer")
+        if report.passed and full_due and verified_suite != full_suite:
+            report = await _run_tests("refactorer", candidate_code, full_suite)
+            ref_tracker.remember(candidate_code, report)
+            state.log(f"Full suite run passed={report.passed}.", phase="refactorer")
+            if not report.passed and impl_full is None:
+                same = same_behavior(candidate_code, impl_code)
+                impl_full = report if same else await _run_tests("refactorer", impl_code, full_suite)
+        if report.passed:
             break
+        invalidate(served)
         ref_attempts += 1
-        snippet = details.replace('\n',' ')[:300] if details else 'no details'
-        state.system_log.append({"timestamp": now_iso(), "message": f"Refactorer failing tests attempt {ref_attempts}: {snippet}"})
+        state.log(f"Refactorer failing tests attempt {ref_attempts}: {report.signature or 'no details'}", "warning", "refactorer")
+        if report.outcome == "resource":
+            state.aborted = True
+            state.abort_reason = "refactorer_resource_limit"
+            return "aborted", {"tester": tester_out, "implementer": impl_out, "refactorer": refactor_out}
+        last_failure = report.failure_text()
+        verdict = ref_tracker.failure(candidate_code, report.signature)
+        if impl_full is not None and (verdict == "abort" or ref_attempts >= max_retries):
+            if not impl_full.passed:  # the implementation itself fails: nothing green to revert to
+                state.log(f"Full suite failing: {impl_full.signature or 'no details'}", "warning", "refactorer")
+                state.aborted = True
+                state.abort_reason = f"full_suite_{impl_full.outcome}"
+                return "aborted", {"tester": tester_out, "implementer": impl_out, "refactorer": refactor_out}
+            state.log("Refactorer could not pass the full suite; reverting to the implementation.", "warning", "refactorer")
+            refactor_out = {"refactored_code": impl_code, "refactor_notes": "Reverted: refactor failed the full suite."}
+            break
+        if verdict == "abort":
+            state.log("Refactorer repeated an identical failing candidate; aborting.", "warning", "refactorer")
+            state.aborted = True
+            state.abort_reason = "refactorer_repeated_failure"
+            return "aborted", {"tester": tester_out, "implementer": impl_out, "refactorer": refactor_out}
+        if verdict == "repeat":
+            last_failure = f"{last_failure}\n{REPEAT_HINT}"
         if ref_attempts >= max_retries:
             state.aborted = True
             state.abort_reason = "refactorer_retry_exhausted"
             return "aborted", {"tester": tester_out, "implementer": impl_out, "refactorer": refactor_out}
 
     # Supervisor phase only if not aborted
-    supervisor_raw = supervisor.act(state.to_dict())
+    with recorder.span("supervisor", "act", 1):
+        supervisor_raw = await supervisor.aact(state.view())
     supervisor_out, supervisor_msg = validate_supervisor(supervisor_raw)
-    state.system_log.append({"timestamp": now_iso(), "message": supervisor_msg})
+    state.log(supervisor_msg, phase="supervisor")
+    await events.emit(
+        "supervisor_decision",
+        status=supervisor_out.get("status", ""),
+        heuristic_reason=supervisor_out.get("heuristic_reason", ""),
+        issues=list(supervisor_out.get("issues_identified", [])),
+    )
     if supervisor_out.get("heuristic_reason"):
-        state.system_log.append(
-            {
-                "timestamp": now_iso(),
-                "message": f"Supervisor heuristic_reason={supervisor_out.get('heuristic_reason')} status={supervisor_out.get('status')}",
-            }
+        state.log(
+            f"Supervisor heuristic_reason={supervisor_out.get('heuristic_reason')} status={supervisor_out.get('status')}",
+            phase="supervisor",
         )
 
     cycle = TDDCycle(
@@ -156,7 +346,10 @@ def _run_cycle(
     state.final_code = new_code_candidate
     from tdd_agents.diff import unified_code_diff
 
-    diff = unified_code_diff(prev_code, state.final_code)
+    with recorder.span("cycle", "diff", 1) as span:
+        # Cosmetic-only changes (whitespace, comments) are not recorded as diffs
+        diff = "" if same_behavior(prev_code, state.final_code) else unified_code_diff(prev_code, state.final_code)
+        span.outcome = "changed" if diff else "unchanged"
     if diff:
         state.code_diffs.append(diff)
 
@@ -168,59 +361,187 @@ def _run_cycle(
     }
 
 
-def run_single_cycle(language: str, kata_description: str) -> Any:
-    state = initial_state(language, kata_description)
-    llm_client, llm_info = build_llm()
-    state.system_log.append(
-        {"timestamp": now_iso(), "message": f"LLM provider selected: {llm_info}"}
+def _test_cache_stats() -> Dict[str, int]:
+    from tdd_agents.result_cache import default_cache
+
+    cache = default_cache()
+    return cache.stats() if cache else {"hits": 0, "misses": 0}
+
+
+def _log_test_cache_stats(state: Any, baseline: Dict[str, int]) -> None:
+    """Append run-relative test result cache counters to the system log."""
+    current = _test_cache_stats()
+    hits = current["hits"] - baseline["hits"]
+    misses = current["misses"] - baseline["misses"]
+    state.log(f"Test result cache hits={hits} misses={misses}", phase="cycle")
+
+
+async def _emit_cycle_complete(state: Any, events: EventEmitter, diffs_before: int) -> None:
+    new_diff = len(state.code_diffs) > diffs_before
+    await events.emit(
+        "cycle_complete",
+        diff=state.code_diffs[-1] if new_diff else "",
+        aborted=state.aborted,
+        abort_reason=state.abort_reason,
     )
-    tester = TesterAgent("tester", llm=llm_client)
-    implementer = ImplementerAgent("implementer", llm=llm_client)
-    refactorer = RefactorerAgent("refactorer", llm=llm_client)
-    supervisor = SupervisorAgent("supervisor", llm=llm_client)
 
-    _run_cycle(state, 1, tester, implementer, refactorer, supervisor)
+
+async def _emit_run_complete(state: Any, events: EventEmitter, status: str) -> None:
+    await events.emit(
+        "run_complete",
+        cycles=len(state.tdd_history),
+        aborted=state.aborted,
+        abort_reason=state.abort_reason,
+        status=status,
+    )
+
+
+def _run_cycle(
+    state: Any,
+    cycle_number: int,
+    tester: TesterAgent,
+    implementer: ImplementerAgent,
+    refactorer: RefactorerAgent,
+    supervisor: SupervisorAgent,
+    recorder: MetricsRecorder | None = None,
+    events: EventEmitter | None = None,
+    timeouts: AdaptiveTimeout | None = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Sync wrapper over `_arun_cycle`."""
+    return asyncio.run(
+        _arun_cycle(
+            state, cycle_number, tester, implementer, refactorer, supervisor, recorder, events, timeouts
+        )
+    )
+
+
+def _setup(
+    language: str,
+    kata_description: str,
+    llm: Any | None = None,
+    recorder: MetricsRecorder | None = None,
+) -> Tuple[Any, TesterAgent, ImplementerAgent, RefactorerAgent, SupervisorAgent]:
+    state = initial_state(language, kata_description)
+    if llm is not None:
+        llm_client = llm
+        llm_info = {"provider": "injected", "model": type(llm).__name__, "mode": "injected"}
+    else:
+        llm_client, llm_info = build_llm()
+    state.log(f"LLM provider selected: {llm_info}", phase="setup")
+    if recorder is not None:
+        llm_client = TimedLLM(llm_client, recorder)
+    tester = TesterAgent("tester", llm=for_role(llm_client, "tester"))
+    implementer = ImplementerAgent("implementer", llm=for_role(llm_client, "implementer"))
+    refactorer = RefactorerAgent("refactorer", llm=for_role(llm_client, "refactorer"))
+    supervisor = SupervisorAgent("supervisor", llm=for_role(llm_client, "supervisor"))
+    return state, tester, implementer, refactorer, supervisor
+
+
+async def arun_single_cycle(
+    language: str, kata_description: str, on_event: Any | None = None
+) -> Any:
+    recorder = MetricsRecorder()
+    events = EventEmitter(on_event)
+    state, tester, implementer, refactorer, supervisor = _setup(
+        language, kata_description, recorder=recorder
+    )
+    cache_baseline = _test_cache_stats()
+    status, _outputs = await _arun_cycle(
+        state, 1, tester, implementer, refactorer, supervisor, recorder, events
+    )
+    await _emit_cycle_complete(state, events, 0)
+    _log_test_cache_stats(state, cache_baseline)
+    state.metrics = recorder.to_dict()
+    await _emit_run_complete(state, events, status)
+    state.system_log.flush()
     return state.to_dict()
 
 
-def run_n_cycles(
+def run_single_cycle(language: str, kata_description: str, on_event: Any | None = None) -> Any:
+    return asyncio.run(arun_single_cycle(language, kata_description, on_event=on_event))
+
+
+async def arun_n_cycles(
     language: str,
     kata_description: str,
     max_cycles: int = 3,
     on_cycle: Any | None = None,
+    llm: Any | None = None,
+    on_event: Any | None = None,
 ) -> Any:
-    """Run up to `max_cycles` TDD cycles, stopping early if supervisor says 'done'."""
-    state = initial_state(language, kata_description)
-    llm_client, llm_info = build_llm()
-    state.system_log.append(
-        {"timestamp": now_iso(), "message": f"LLM provider selected: {llm_info}"}
-    )
-    tester = TesterAgent("tester", llm=llm_client)
-    implementer = ImplementerAgent("implementer", llm=llm_client)
-    refactorer = RefactorerAgent("refactorer", llm=llm_client)
-    supervisor = SupervisorAgent("supervisor", llm=llm_client)
+    """Async `run_n_cycles`; many katas can share one event loop via gather.
 
+    `on_cycle` may be a plain function or a coroutine function; it receives a
+    read-only `StateView` (call `.to_dict()` for a mutable copy). `llm`
+    injects a client instead of `build_llm()` (benchmarks, embedding).
+    Timing spans accumulate in `state["metrics"]`, refreshed before each
+    `on_cycle` call (persist spans of cycle N appear from cycle N+1 on and in
+    the returned state). `on_event` receives the typed phase-transition
+    events of `tdd_agents.events` as they happen. With
+    `TDD_AGENTS_MINIMIZE_EVERY=N`, redundant tests are marked dormant every N
+    cycles (see `tdd_agents.minimize`).
+    """
+    import os
+    from tdd_agents.minimize import minimize_suite
+
+    recorder = MetricsRecorder()
+    events = EventEmitter(on_event)
+    timeouts = AdaptiveTimeout.from_env()  # per kata: durations carry across cycles
+    minimize_every = int(os.getenv("TDD_AGENTS_MINIMIZE_EVERY", "0"))
+    status = ""
+    state, tester, implementer, refactorer, supervisor = _setup(
+        language, kata_description, llm, recorder
+    )
+    cache_baseline = _test_cache_stats()
     for cycle_number in range(1, max_cycles + 1):
         if state.aborted:
             break
-        status, _outputs = _run_cycle(
-            state, cycle_number, tester, implementer, refactorer, supervisor
+        diffs_before = len(state.code_diffs)
+        status, _outputs = await _arun_cycle(
+            state, cycle_number, tester, implementer, refactorer, supervisor, recorder, events, timeouts
         )
+        await _emit_cycle_complete(state, events, diffs_before)
+        _log_test_cache_stats(state, cache_baseline)
+        if minimize_every > 0 and cycle_number % minimize_every == 0 and not state.aborted:
+            with recorder.span("cycle", "minimize", 1):
+                await asyncio.to_thread(minimize_suite, state, timeouts.ceiling)
+        state.metrics = recorder.to_dict()
         if on_cycle:
             try:
-                on_cycle(state.to_dict(), cycle_number)
+                with recorder.span("persist", "on_cycle", 1):
+                    maybe = on_cycle(state.view(), cycle_number)
+                    if inspect.isawaitable(maybe):
+                        await maybe
             except Exception as e:  # keep orchestration resilient
-                state.system_log.append(
-                    {"timestamp": now_iso(), "message": f"on_cycle callback error: {e}"}
-                )
+                state.log(f"on_cycle callback error: {e}", "error", "persist")
         if state.aborted:
-            state.system_log.append(
-                {"timestamp": now_iso(), "message": f"Aborted: {state.abort_reason}"}
-            )
+            state.log(f"Aborted: {state.abort_reason}", "error", "cycle")
             break
         if status == "done":  # early stop
-            state.system_log.append(
-                {"timestamp": now_iso(), "message": "Supervisor signaled completion."}
-            )
+            state.log("Supervisor signaled completion.", phase="supervisor")
             break
+    state.metrics = recorder.to_dict()
+    await _emit_run_complete(state, events, status)
+    state.system_log.flush()
     return state.to_dict()
+
+
+def run_n_cycles(
+    language: str,
+    kata_description: str,
+    max_cycles: int = 3,
+    on_cycle: Any | None = None,
+    llm: Any | None = None,
+    on_event: Any | None = None,
+) -> Any:
+    """Run up to `max_cycles` TDD cycles, stopping early if supervisor says 'done'."""
+    return asyncio.run(
+        arun_n_cycles(
+            language,
+            kata_description,
+            max_cycles=max_cycles,
+            on_cycle=on_cycle,
+            llm=llm,
+            on_event=on_event,
+        )
+    )
@@ -3,7 +3,8 @@
 Side effects: writes files under an output directory. Keep inputs minimal.
 Directory layout (root = out_dir):
 - code/ : latest code artifact (main.py)
-- tests/ : accumulated test suite (generated_tests.py)
+- tests/ : accumulated test suite (generated_tests.py) and the snippets of it
+  marked dormant by coverage minimization (dormant.json)
 - snapshots/cycle_<N>/ : per-cycle snapshot files
     - code.py
     - tests.py
@@ -16,7 +17,7 @@ All write functions create parent directories as needed.
 from __future__ import annotations
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 def _ensure_dir(path: str) -> None:
@@ -26,7 +27,8 @@ def _ensure_dir(path: str) -> None:
 def write_current(state: Dict[str, Any], out_dir: str) -> None:
     """Persist latest aggregate code and test suite.
 
-    Writes `code/main.py` and `tests/generated_tests.py` under `out_dir`.
+    Writes `code/main.py`, `tests/generated_tests.py` and
+    `tests/dormant.json` under `out_dir`.
     """
     _ensure_dir(out_dir)
     code_dir = os.path.join(out_dir, "code")
@@ -39,6 +41,15 @@ def write_current(state: Dict[str, Any], out_dir: str) -> None:
         f.write(state.get("final_code", ""))
     with open(tests_path, "w", encoding="utf-8") as f:
         f.write(state.get("full_test_suite", ""))
+    write_dormant(list(state.get("dormant_tests", None) or []), out_dir)
+
+
+def write_dormant(dormant: List[str], out_dir: str) -> None:
+    """Persist the dormant test snippets as `tests/dormant.json`."""
+    tests_dir = os.path.join(out_dir, "tests")
+    _ensure_dir(tests_dir)
+    with open(os.path.join(tests_dir, "dormant.json"), "w", encoding="utf-8") as f:
+        json.dump(dormant, f, indent=2)
 
 
 def write_snapshot(state: Dict[str, Any], out_dir: str, cycle_number: int) -> None:
@@ -48,6 +48,21 @@ def _context_block(state: Dict[str, Any]) -> str:
     return "\n".join(parts) if parts else "(no prior diff or heuristic context)"
 
 
+def _failure_block(state: Dict[str, Any]) -> str:
+    """Failing tests of the previous attempt this cycle ('' on first try)."""
+    failure = state.get("last_failure", "")
+    return f"Previous attempt failed these tests:\n{failure}\n" if failure else ""
+
+
+def _variant_block(state: Dict[str, Any]) -> str:
+    """Nudge speculative candidates 2..K apart ('' for the first/only one)."""
+    variant = int(state.get("candidate_variant", 1) or 1)
+    if variant <= 1:
+        return ""
+    count = state.get("candidate_count", variant)
+    return f"Candidate {variant} of {count}: propose a valid implementation that differs from the most obvious one.\n"
+
+
 def tester_prompt(state: Dict[str, Any]) -> str:
     kata = state.get("kata_description", "")
     history_len = len(state.get("tdd_history", []))
@@ -69,6 +84,8 @@ def implementer_prompt(state: Dict[str, Any]) -> str:
         "Return ONLY raw python code (no fences, no commentary). Do not invent unrelated functions. If insufficient info, output a single TODO comment.\n"
         f"Latest test snippet:\n{last_test}\n"
         f"Context:\n{context}\n"
+        f"{_failure_block(state)}"
+        f"{_variant_block(state)}"
     )
 
 
@@ -80,6 +97,7 @@ def refactorer_prompt(state: Dict[str, Any]) -> str:
         "Keep diff minimal; return ONLY raw code (no fences, no extra comments). If no safe improvement, echo original exactly.\n"
         f"Current code:\n{current_code}\n"
         f"Context:\n{context}\n"
+        f"{_failure_block(state)}"
     )
 
 
@@ -0,0 +1,204 @@
+"""Structured test run results.
+
+`SuiteReport` is what every runner produces: overall outcome, per-test
+`CaseResult`s (name, outcome, duration, one-line message), wall-clock
+duration and the raw output tail (`details`, for humans only). The compact
+`signature` identifies *how* a run failed so retry logic and prompts can use
+exact failing-test data instead of scanning pytest text.
+
+Sources: pytest `--junitxml` reports (`parse_junit`), the fast path's own
+case list, or, as a fallback, pytest `-q` text (`from_output`).
+Pure functions apart from reading the junit file.
+"""
+
+from __future__ import annotations
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Tuple
+
+TIMEOUT_DETAILS = "Test execution timeout"
+RESOURCE_DETAILS = "Resource limit exceeded"
+_MESSAGE_LIMIT = 200
+_FAILED_LINE = re.compile(r"^(FAILED|ERROR) (\S+?)(?:::(\S+))?(?: - (.*))?$")
+_TRAILING_EXC = re.compile(r":\s*([A-Za-z_][\w.]*(?:Error|Exception|Exit|Interrupt))\s*$")
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    name: str
+    outcome: str  # passed | failed | error | skipped
+    duration: float = 0.0
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class SuiteReport:
+    passed: bool
+    outcome: str  # passed | failed | error | timeout | resource
+    cases: Tuple[CaseResult, ...] = ()
+    duration: float = 0.0
+    details: str = ""
+
+    @property
+    def failures(self) -> Tuple[CaseResult, ...]:
+        return tuple(c for c in self.cases if c.outcome in ("failed", "error"))
+
+    @property
+    def signature(self) -> str:
+        """Stable compact description of the failure ('' when green)."""
+        if self.passed:
+            return ""
+        if self.outcome == "timeout":
+            return "timeout"
+        if self.outcome == "resource":
+            return self.details.splitlines()[0] if self.details else RESOURCE_DETAILS
+        if self.failures:
+            return "; ".join(sorted(f"{c.name}: {c.message}" for c in self.failures))
+        first = next((line for line in self.details.splitlines() if line.strip()), "")
+        return f"{self.outcome}: {first.strip()[:_MESSAGE_LIMIT]}"
+
+    @property
+    def summary(self) -> str:
+        """One line such as '1 failed, 2 passed in 0.12s'."""
+        if self.outcome == "timeout":
+            return TIMEOUT_DETAILS
+        if self.outcome == "resource":
+            return self.signature
+        counts: Dict[str, int] = {}
+        for case in self.cases:
+            counts[case.outcome] = counts.get(case.outcome, 0) + 1
+        parts = [f"{counts[k]} {k}" for k in ("failed", "error", "passed", "skipped") if counts.get(k)]
+        if not parts:
+            return self.signature or self.outcome
+        return f"{', '.join(parts)} in {self.duration:.2f}s"
+
+    def failure_text(self, limit: int = 5) -> str:
+        """Bullet list of failing tests for prompts/logs ('' when green)."""
+        if self.passed:
+            return ""
+        if not self.failures:
+            return f"- {self.signature}"
+        lines = [f"- {c.name}: {c.message}" for c in self.failures[:limit]]
+        if len(self.failures) > limit:
+            lines.append(f"- ... {len(self.failures) - limit} more")
+        return "\n".join(lines)
+
+    def as_tuple(self) -> Tuple[bool, str]:
+        """Legacy `(passed, details)` contract of `run_tests`."""
+        return self.passed, self.details
+
+    def to_json(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "SuiteReport":
+        cases = tuple(CaseResult(**c) for c in data.get("cases", ()))
+        return cls(
+            passed=bool(data["passed"]),
+            outcome=str(data["outcome"]),
+            cases=cases,
+            duration=float(data.get("duration", 0.0)),
+            details=str(data.get("details", "")),
+        )
+
+
+def _short(text: str) -> str:
+    first = next((line.strip() for line in (text or "").splitlines() if line.strip()), "")
+    return first[:_MESSAGE_LIMIT]
+
+
+def _message(element: ET.Element) -> str:
+    """'ExcType: first line' from a junit failure/error element."""
+    msg = element.get("message", "") or ""
+    body = element.text or ""
+    if msg == "collection failure":  # pytest puts the real error in the last E-line
+        e_lines = [line[1:].strip() for line in body.splitlines() if line.startswith("E ")]
+        return _short(e_lines[-1] if e_lines else msg)
+    short = _short(msg)
+    tail = body.rstrip().splitlines()[-1] if body.strip() else ""
+    match = _TRAILING_EXC.search(tail)
+    if match and not short.startswith(match.group(1)):
+        short = f"{match.group(1)}: {short}" if short else match.group(1)
+    return short[:_MESSAGE_LIMIT]
+
+
+def parse_junit(path: str) -> Tuple[CaseResult, ...]:
+    """Per-test results from a pytest junit XML file (empty if unreadable)."""
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return ()
+    cases: List[CaseResult] = []
+    for case in root.iter("testcase"):
+        name = case.get("name", "")
+        duration = float(case.get("time", "0") or 0)
+        outcome, message = "passed", ""
+        for tag in ("failure", "error", "skipped"):
+            child = case.find(tag)
+            if child is not None:
+                outcome = "failed" if tag == "failure" else tag
+                message = _message(child) if tag != "skipped" else _short(child.get("message", ""))
+                break
+        cases.append(CaseResult(name, outcome, round(duration, 6), message))
+    return tuple(cases)
+
+
+def from_cases(passed: bool, cases: Tuple[CaseResult, ...], duration: float, details: str) -> SuiteReport:
+    """Report for a finished run. Pure function."""
+    if passed:
+        outcome = "passed"
+    elif any(c.outcome == "failed" for c in cases):
+        outcome = "failed"
+    else:
+        outcome = "error"
+    return SuiteReport(passed, outcome, cases, round(duration, 6), details)
+
+
+def timeout_report(duration: float) -> SuiteReport:
+    return SuiteReport(False, "timeout", (), round(duration, 6), TIMEOUT_DETAILS)
+
+
+def resource_report(reason: str, cases: Tuple[CaseResult, ...], duration: float, details: str) -> SuiteReport:
+    """Run killed or crippled by a sandbox resource limit (`reason`: cpu, memory, ...)."""
+    text = f"{RESOURCE_DETAILS}: {reason}\n{details}".strip()
+    return SuiteReport(False, "resource", cases, round(duration, 6), text)
+
+
+def from_output(passed: bool, details: str, duration: float = 0.0) -> SuiteReport:
+    """Best-effort report from pytest `-q` style text (legacy runners). Pure."""
+    if not passed and details.startswith(TIMEOUT_DETAILS):
+        return timeout_report(duration)
+    if not passed and details.startswith(RESOURCE_DETAILS):
+        return SuiteReport(False, "resource", (), round(duration, 6), details)
+    cases: List[CaseResult] = []
+    for line in details.splitlines():
+        match = _FAILED_LINE.match(line.strip())
+        if match:
+            kind, path, name, msg = match.groups()
+            cases.append(
+                CaseResult(name or path, "failed" if kind == "FAILED" else "error", 0.0, _short(msg or ""))
+            )
+    return from_cases(passed, tuple(cases), duration, details)
+
+
+def coerce(value: Any) -> SuiteReport:
+    """Accept a `SuiteReport`, its JSON dict, or a legacy `(passed, details)` pair."""
+    if isinstance(value, SuiteReport):
+        return value
+    if isinstance(value, dict):
+        return SuiteReport.from_json(value)
+    passed, details = value
+    return from_output(bool(passed), str(details))
+
+
+__all__ = [
+    "CaseResult",
+    "SuiteReport",
+    "coerce",
+    "from_cases",
+    "from_output",
+    "parse_junit",
+    "resource_report",
+    "timeout_report",
+]
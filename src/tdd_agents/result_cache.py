@@ -0,0 +1,239 @@
+"""Content-addressed cache for test run results.
+
+Keys hash the exact implementation code and test suite text, the runner mode and
+the pytest/python versions, so identical candidates skip the subprocess.
+Two layers:
+- in-memory LRU (always on when caching is enabled)
+- optional on-disk layer (`TDD_AGENTS_TEST_CACHE_DIR`) with size-based
+  eviction of least recently used entries (`TDD_AGENTS_TEST_CACHE_MAX_BYTES`)
+
+Disable entirely with `TDD_AGENTS_TEST_CACHE=0`.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from tdd_agents.reports import SuiteReport
+
+# Legacy `(passed, details)` pair or `SuiteReport.to_json()` dict.
+Result = Union[Tuple[bool, str], Dict[str, Any]]
+
+# Outcomes that depend only on code + suite; timeouts and resource kills don't.
+DETERMINISTIC_OUTCOMES = frozenset({"passed", "failed", "error"})
+_WORKER_FAULT = "Worker"  # pool infrastructure failures surface as outcome `error`
+_UNCACHEABLE_PREFIXES = ("Test execution timeout", _WORKER_FAULT, "Resource limit exceeded")
+
+
+def _pytest_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("pytest")
+    except Exception:  # pragma: no cover - pytest missing
+        return "unknown"
+
+
+_RUNTIME_TAG = f"py{sys.version_info[0]}.{sys.version_info[1]}-pytest{_pytest_version()}"
+
+
+def normalize_code(code: str) -> str:
+    """Normalize line endings and trailing whitespace. Pure function."""
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def _exact(code: str) -> str:
+    """Code text with only line endings normalized (the parser treats them alike)."""
+    return code.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def cache_key(impl_code: str, test_suite: str, runner: str) -> str:
+    """Stable content hash for a test run. Pure function.
+
+    Hashes the exact code text: whitespace can live inside string literals,
+    so any looser normalization could hand one program another's result.
+    """
+    h = hashlib.sha256()
+    for part in (_RUNTIME_TAG, runner, _exact(impl_code), _exact(test_suite)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def is_cacheable(result: Union["SuiteReport", Result]) -> bool:
+    """Only deterministic outcomes are cached (no timeouts, resource kills or worker faults).
+
+    Reports (or their JSON dicts) are judged by `outcome`; legacy tuples,
+    which carry no outcome, by the prefix of their details text.
+    """
+    from tdd_agents.reports import SuiteReport
+
+    if isinstance(result, dict):
+        result = SuiteReport.from_json(result)
+    if isinstance(result, SuiteReport):
+        worker_fault = not result.cases and result.details.startswith(_WORKER_FAULT)
+        return result.outcome in DETERMINISTIC_OUTCOMES and not worker_fault
+    return not str(result[1]).startswith(_UNCACHEABLE_PREFIXES)
+
+
+class _DiskLayer:
+    """Sharded JSON files under `root`; evicts by mtime once over `max_bytes`."""
+
+    def __init__(self, root: str, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._total: Optional[int] = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Result]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)  # refresh recency for LRU eviction
+        except (OSError, ValueError):
+            return None
+        if isinstance(data, dict):
+            return data
+        passed, details = data
+        return bool(passed), str(details)
+
+    def put(self, key: str, value: Result) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(value if isinstance(value, dict) else list(value)).encode("utf-8")
+        tmp = path + f".{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        if self._total is None:
+            self._total = sum(size for _, size, _ in self._entries())
+        else:
+            self._total += len(data)
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 3 // 4  # hysteresis: avoid evicting every put
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._total = total
+
+
+class ResultCache:
+    """Two-layer (memory LRU + optional disk) cache with hit/miss counters."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Result]" = OrderedDict()
+        self._disk = _DiskLayer(disk_dir, max_disk_bytes) if disk_dir else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Result]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+        value = self._disk.get(key) if self._disk else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Result) -> None:
+        with self._lock:
+            self._remember(key, value)
+        if self._disk:
+            try:
+                self._disk.put(key, value)
+            except OSError:
+                pass  # disk layer is best-effort
+
+    def _remember(self, key: str, value: Result) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_DEFAULT_CACHE: Optional[ResultCache] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_cache() -> Optional[ResultCache]:
+    """Process-wide cache configured from env; None when disabled."""
+    global _DEFAULT_CACHE
+    if os.getenv("TDD_AGENTS_TEST_CACHE", "1") == "0":
+        return None
+    with _DEFAULT_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = ResultCache(
+                max_entries=int(os.getenv("TDD_AGENTS_TEST_CACHE_ENTRIES", "256")),
+                disk_dir=os.getenv("TDD_AGENTS_TEST_CACHE_DIR") or None,
+                max_disk_bytes=int(
+                    os.getenv("TDD_AGENTS_TEST_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+                ),
+            )
+        return _DEFAULT_CACHE
+
+
+def reset_default_cache() -> None:
+    global _DEFAULT_CACHE
+    with _DEFAULT_LOCK:
+        _DEFAULT_CACHE = None
+
+
+__all__ = [
+    "ResultCache",
+    "cache_key",
+    "default_cache",
+    "is_cacheable",
+    "normalize_code",
+    "reset_default_cache",
+]
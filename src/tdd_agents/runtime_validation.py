@@ -1,16 +1,42 @@
 """Runtime compilation + test execution helpers.
 
-Side-effect boundary: running pytest in a temporary directory. All functions
-here remain small; entry points wrap side effects with minimal inputs.
+Side-effect boundary: running pytest in a pooled workspace directory (see
+`workspace`). All functions here remain small; entry points wrap side
+effects with minimal inputs.
+
+Runner selection via `TDD_AGENTS_TEST_RUNNER`:
+- `subprocess` (default): cold `pytest -q` subprocess per run
+- `pool`: warm pre-imported workers (see `worker_pool`)
+- `fast`: in-process executor for simple assert-style suites (see `fastpath`),
+  falling back to the cold subprocess whenever pytest features are needed
+- `sandbox`: cold subprocess in its own process group under rlimits; limit
+  kills report outcome `resource` (see `sandbox`)
+
+Runners produce a structured `SuiteReport` (see `reports`); `run_tests`
+keeps the legacy `(passed, details)` tuple. Suites longer than
+`MAX_TEST_LINES` are split into shards run concurrently and merged (see
+`sharding`). Results are memoized by content hash per shard (see
+`result_cache`).
 """
 from __future__ import annotations
 import ast
+import asyncio
 import os
-import tempfile
 import subprocess
-from typing import Tuple
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-MAX_TEST_LINES = 200  # guardrail
+from tdd_agents.reports import (
+    SuiteReport,
+    coerce,
+    from_cases,
+    from_output,
+    parse_junit,
+    timeout_report,
+)
+
+MAX_TEST_LINES = 200  # target shard size; longer suites run as parallel shards
+_JUNIT_FILE = "report.xml"
 
 
 def compile_snippet(snippet: str) -> Tuple[bool, str]:
@@ -21,34 +47,203 @@ def compile_snippet(snippet: str) -> Tuple[bool, str]:
         return False, f"SyntaxError: {e.msg} at line {e.lineno}"  # deterministic message
 
 
-def _write_runtime_files(tmp: str, impl_code: str, test_suite: str) -> None:
-    with open(os.path.join(tmp, "impl.py"), "w", encoding="utf-8") as f:
-        f.write(impl_code or "# empty impl\n")
-    # prepend import line once
-    tests_path = os.path.join(tmp, "tests")
-    os.makedirs(tests_path, exist_ok=True)
+def runtime_files(impl_code: str, test_suite: str) -> Dict[str, str]:
+    """Relative path -> content of the files a run needs. Pure function."""
     suite = test_suite.strip()
     if not suite:
         suite = "def test_placeholder():\n    assert True\n"
-    content = "from impl import *\n" + suite
-    with open(os.path.join(tests_path, "test_generated.py"), "w", encoding="utf-8") as f:
-        f.write(content)
+    return {
+        "impl.py": impl_code or "# empty impl\n",
+        # prepend import line once
+        os.path.join("tests", "test_generated.py"): "from impl import *\n" + suite,
+    }
+
+
+def _write_runtime_files(tmp: str, impl_code: str, test_suite: str) -> None:
+    os.makedirs(os.path.join(tmp, "tests"), exist_ok=True)
+    for rel, content in runtime_files(impl_code, test_suite).items():
+        with open(os.path.join(tmp, rel), "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def _runner_mode() -> str:
+    mode = os.getenv("TDD_AGENTS_TEST_RUNNER", "subprocess").lower()
+    if mode in {"pool", "fast"} and not hasattr(os, "fork"):
+        return "subprocess"  # both rely on fork; degrade gracefully
+    if mode == "sandbox":
+        from tdd_agents.sandbox import available
+
+        return mode if available() else "subprocess"
+    return mode
+
+
+def _cache_lookup(impl_code: str, test_suite: str, mode: str) -> Tuple[Any, str, Optional[SuiteReport]]:
+    """Return (cache, key, hit); cache is None when disabled."""
+    from tdd_agents.result_cache import cache_key, default_cache
+
+    cache = default_cache()
+    if not cache:
+        return None, "", None
+    key = cache_key(impl_code, test_suite, mode)
+    hit = cache.get(key)
+    return cache, key, coerce(hit) if hit is not None else None
+
+
+def _cache_store(cache: Any, key: str, report: SuiteReport) -> None:
+    from tdd_agents.result_cache import is_cacheable
+
+    if cache and is_cacheable(report):
+        cache.put(key, report.to_json())
+
+
+def _execute(mode: str, impl_code: str, test_suite: str, timeout_sec: float) -> SuiteReport:
+    """Dispatch one uncached run to the selected (blocking) runner."""
+    if mode == "pool":
+        from tdd_agents.worker_pool import default_pool
+
+        return default_pool().run_report(impl_code, test_suite, timeout_sec)
+    if mode == "fast":
+        from tdd_agents.fastpath import run_fast_report
+
+        fast = run_fast_report(impl_code, test_suite, timeout_sec)
+        if fast is not None:
+            return fast
+    if mode == "sandbox":
+        from tdd_agents.sandbox import run_sandboxed
+
+        return run_sandboxed(impl_code, test_suite, timeout_sec)
+    return coerce(_run_subprocess(impl_code, test_suite, timeout_sec))
+
+
+def _shards(test_suite: str) -> List[str]:
+    if test_suite.count("\n") <= MAX_TEST_LINES:
+        return [test_suite]
+    from tdd_agents.sharding import shard_suite
+
+    return shard_suite(test_suite, MAX_TEST_LINES)
+
+
+def _run_one(mode: str, impl_code: str, test_suite: str, timeout_sec: float) -> SuiteReport:
+    cache, key, hit = _cache_lookup(impl_code, test_suite, mode)
+    if hit is not None:
+        return hit
+    report = _execute(mode, impl_code, test_suite, timeout_sec)
+    _cache_store(cache, key, report)
+    return report
+
+
+def run_tests_report(impl_code: str, test_suite: str, timeout_sec: float = 5) -> SuiteReport:
+    """Run the suite against `impl_code`; structured per-test result."""
+    mode = _runner_mode()
+    shards = _shards(test_suite)
+    if len(shards) == 1:
+        return _run_one(mode, impl_code, test_suite, timeout_sec)
+    from concurrent.futures import ThreadPoolExecutor
+    from tdd_agents.sharding import merge_reports, shard_concurrency
+
+    with ThreadPoolExecutor(max_workers=min(len(shards), shard_concurrency())) as executor:
+        reports = list(executor.map(lambda shard: _run_one(mode, impl_code, shard, timeout_sec), shards))
+    return merge_reports(reports)
+
+
+def run_tests(impl_code: str, test_suite: str, timeout_sec: float = 5) -> Tuple[bool, str]:
+    return run_tests_report(impl_code, test_suite, timeout_sec).as_tuple()
+
+
+async def _arun_one(mode: str, impl_code: str, test_suite: str, timeout_sec: float) -> SuiteReport:
+    cache, key, hit = _cache_lookup(impl_code, test_suite, mode)
+    if hit is not None:
+        return hit
+    if mode == "subprocess":
+        report = await _arun_subprocess(impl_code, test_suite, timeout_sec)
+    elif mode == "sandbox":
+        from tdd_agents.sandbox import arun_sandboxed
+
+        report = await arun_sandboxed(impl_code, test_suite, timeout_sec)
+    else:
+        report = await asyncio.to_thread(_execute, mode, impl_code, test_suite, timeout_sec)
+    _cache_store(cache, key, report)
+    return report
+
+
+async def arun_tests_report(impl_code: str, test_suite: str, timeout_sec: float = 5) -> SuiteReport:
+    """Async `run_tests_report`: subprocess runs use `asyncio.create_subprocess_exec`.
+
+    Fork-based runners (`pool`, `fast`) block briefly, so they run off-loop.
+    """
+    mode = _runner_mode()
+    shards = _shards(test_suite)
+    if len(shards) == 1:
+        return await _arun_one(mode, impl_code, test_suite, timeout_sec)
+    from tdd_agents.sharding import merge_reports, shard_concurrency
+
+    limit = asyncio.Semaphore(shard_concurrency())
+
+    async def _shard(shard: str) -> SuiteReport:
+        async with limit:
+            return await _arun_one(mode, impl_code, shard, timeout_sec)
+
+    return merge_reports(await asyncio.gather(*(_shard(shard) for shard in shards)))
+
+
+async def arun_tests(impl_code: str, test_suite: str, timeout_sec: float = 5) -> Tuple[bool, str]:
+    return (await arun_tests_report(impl_code, test_suite, timeout_sec)).as_tuple()
+
+
+def _pytest_env(tmp: str) -> Dict[str, str]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = tmp + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _pytest_args(tmp: str) -> List[str]:
+    return ["pytest", "-q", "-p", "no:cacheprovider", f"--junitxml={os.path.join(tmp, _JUNIT_FILE)}"]
+
+
+def _report(tmp: str, returncode: int, output: str, started: float) -> SuiteReport:
+    passed = returncode == 0
+    cases = parse_junit(os.path.join(tmp, _JUNIT_FILE))
+    details = output.strip()[:4000]
+    if not cases:  # no junit (e.g. pytest crashed early): fall back to the text
+        return from_output(passed, details, time.perf_counter() - started)
+    return from_cases(passed, cases, time.perf_counter() - started, details)
+
+
+async def _arun_subprocess(impl_code: str, test_suite: str, timeout_sec: float) -> SuiteReport:
+    """Async cold path: same layout as `_run_subprocess`, awaited without a thread."""
+    from tdd_agents.workspace import default_workspaces
+
+    started = time.perf_counter()
+    with default_workspaces().acquire(impl_code, test_suite) as workspace:
+        tmp = workspace.path
+        proc = await asyncio.create_subprocess_exec(
+            *_pytest_args(tmp),
+            cwd=tmp,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_pytest_env(tmp),
+        )
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout_sec)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return timeout_report(time.perf_counter() - started)
+        output = out.decode("utf-8", "replace") + err.decode("utf-8", "replace")
+        return _report(tmp, int(proc.returncode or 0), output, started)
+
 
+def _run_subprocess(impl_code: str, test_suite: str, timeout_sec: float) -> SuiteReport:
+    """Cold path: pooled workspace + `pytest -q` subprocess with a junit report."""
+    from tdd_agents.workspace import default_workspaces
 
-def run_tests(impl_code: str, test_suite: str, timeout_sec: int = 5) -> Tuple[bool, str]:
-    # safeguard size
-    if test_suite.count("\n") > MAX_TEST_LINES:
-        return False, "Test suite exceeds MAX_TEST_LINES guardrail"
-    with tempfile.TemporaryDirectory() as tmp:
-        _write_runtime_files(tmp, impl_code, test_suite)
+    started = time.perf_counter()
+    with default_workspaces().acquire(impl_code, test_suite) as workspace:
+        tmp = workspace.path
         try:
-            env = os.environ.copy()
-            env["PYTHONPATH"] = tmp + os.pathsep + env.get("PYTHONPATH", "")
             proc = subprocess.run(
-                ["pytest", "-q"], cwd=tmp, capture_output=True, text=True, timeout=timeout_sec, env=env
+                _pytest_args(tmp), cwd=tmp, capture_output=True, text=True, timeout=timeout_sec, env=_pytest_env(tmp)
             )
         except subprocess.TimeoutExpired:
-            return False, "Test execution timeout"
-        passed = proc.returncode == 0
-        details = proc.stdout + proc.stderr
-        return passed, details.strip()[:4000]
+            return timeout_report(time.perf_counter() - started)
+        return _report(tmp, proc.returncode, proc.stdout + proc.stderr, started)
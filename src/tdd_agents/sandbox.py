@@ -0,0 +1,173 @@
+"""Resource-governed pytest runner (`TDD_AGENTS_TEST_RUNNER=sandbox`).
+
+Side-effect boundary: a pytest subprocess started in its own session/process
+group through a tiny launcher that applies `setrlimit` caps before exec'ing
+pytest (no `preexec_fn`, which is unsafe with threads). On timeout, and after
+every run to reap stray grandchildren, the whole group is SIGKILLed.
+
+Runs stopped by a limit (CPU signal, kernel kill, or a failing test whose
+exception is `MemoryError`, EMFILE or EAGAIN on fork) come back as outcome
+`resource` so the orchestrator can abort instead of retrying. Limits, via env (0 disables one):
+- `TDD_AGENTS_SANDBOX_CPU`: CPU seconds (default: timeout + 1)
+- `TDD_AGENTS_SANDBOX_MEM_MB`: address space in MiB (default 2048)
+- `TDD_AGENTS_SANDBOX_NOFILE`: open files (default 256)
+- `TDD_AGENTS_SANDBOX_NPROC`: processes (default 0: RLIMIT_NPROC counts every
+  process of the user, so a safe default depends on the host)
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from tdd_agents.reports import SuiteReport, resource_report, timeout_report
+
+_LAUNCHER = """
+import os, resource, sys
+def cap(res, soft, hard):
+    if soft <= 0:
+        return
+    _, current = resource.getrlimit(res)
+    if current != resource.RLIM_INFINITY:
+        soft, hard = min(soft, current), min(hard, current)
+    resource.setrlimit(res, (soft, hard))
+cpu, mem, nofile, nproc = (int(v) for v in sys.argv[1:5])
+cap(resource.RLIMIT_CPU, cpu, cpu + 1)
+cap(resource.RLIMIT_AS, mem * 1024 * 1024, mem * 1024 * 1024)
+cap(resource.RLIMIT_NOFILE, nofile, nofile)
+cap(resource.RLIMIT_NPROC, nproc, nproc)
+os.execvp(sys.argv[5], sys.argv[5:])
+"""
+
+# (exception type, text its message must contain, resource) of limit hits
+_LIMIT_ERRORS = (
+    ("MemoryError", "", "memory"),
+    ("OSError", "Too many open files", "open files"),
+    ("BlockingIOError", "Resource temporarily unavailable", "processes"),
+)
+
+
+@dataclass(frozen=True)
+class Limits:
+    cpu_sec: int
+    mem_mb: int
+    nofile: int
+    nproc: int
+
+    @classmethod
+    def from_env(cls, timeout_sec: float) -> "Limits":
+        return cls(
+            cpu_sec=int(os.getenv("TDD_AGENTS_SANDBOX_CPU", str(int(timeout_sec) + 1))),
+            mem_mb=int(os.getenv("TDD_AGENTS_SANDBOX_MEM_MB", "2048")),
+            nofile=int(os.getenv("TDD_AGENTS_SANDBOX_NOFILE", "256")),
+            nproc=int(os.getenv("TDD_AGENTS_SANDBOX_NPROC", "0")),
+        )
+
+    def argv(self, command: List[str]) -> List[str]:
+        caps = [str(v) for v in (self.cpu_sec, self.mem_mb, self.nofile, self.nproc)]
+        return [sys.executable, "-c", _LAUNCHER, *caps, *command]
+
+
+def available() -> bool:
+    try:
+        import resource  # noqa: F401
+    except ImportError:
+        return False
+    return hasattr(os, "killpg")
+
+
+def _kill_group(pid: int) -> None:
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _limit_reason(message: str) -> Optional[str]:
+    """Resource behind a failing case's 'ExcType: text' message, if any. Pure."""
+    exc_type, _, text = message.partition(":")
+    return next(
+        (why for name, marker, why in _LIMIT_ERRORS if exc_type.strip() == name and marker in text),
+        None,
+    )
+
+
+def classify(returncode: int, report: SuiteReport) -> SuiteReport:
+    """Re-label `report` as `resource` when a limit stopped the run. Pure.
+
+    Only runs killed by a signal or with failing cases qualify; a test that
+    merely prints or asserts on "MemoryError" keeps its own outcome.
+    """
+    reason: Optional[str] = None
+    if returncode in (-signal.SIGXCPU, -signal.SIGKILL):
+        reason = "cpu" if returncode == -signal.SIGXCPU else "killed"
+    elif returncode != 0 and report.outcome in ("failed", "error"):
+        reason = next((why for c in report.failures if (why := _limit_reason(c.message))), None)
+    if reason is None:
+        return report
+    return resource_report(reason, report.cases, report.duration, report.details)
+
+
+def run_sandboxed(impl_code: str, test_suite: str, timeout_sec: float) -> SuiteReport:
+    """Blocking sandboxed run in a pooled workspace."""
+    from tdd_agents.runtime_validation import _pytest_args, _pytest_env, _report
+    from tdd_agents.workspace import default_workspaces
+
+    started = time.perf_counter()
+    with default_workspaces().acquire(impl_code, test_suite) as workspace:
+        tmp = workspace.path
+        proc = subprocess.Popen(
+            Limits.from_env(timeout_sec).argv(_pytest_args(tmp)),
+            cwd=tmp,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=_pytest_env(tmp),
+            start_new_session=True,
+        )
+        try:
+            out, _ = proc.communicate(timeout=timeout_sec)
+        except subprocess.TimeoutExpired:
+            _kill_group(proc.pid)
+            proc.communicate()
+            return timeout_report(time.perf_counter() - started)
+        finally:
+            _kill_group(proc.pid)
+        output = out.decode("utf-8", "replace")
+        return classify(proc.returncode, _report(tmp, proc.returncode, output, started))
+
+
+async def arun_sandboxed(impl_code: str, test_suite: str, timeout_sec: float) -> SuiteReport:
+    """Async `run_sandboxed` using `asyncio.create_subprocess_exec`."""
+    from tdd_agents.runtime_validation import _pytest_args, _pytest_env, _report
+    from tdd_agents.workspace import default_workspaces
+
+    started = time.perf_counter()
+    with default_workspaces().acquire(impl_code, test_suite) as workspace:
+        tmp = workspace.path
+        proc = await asyncio.create_subprocess_exec(
+            *Limits.from_env(timeout_sec).argv(_pytest_args(tmp)),
+            cwd=tmp,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=_pytest_env(tmp),
+            start_new_session=True,
+        )
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout_sec)
+        except asyncio.TimeoutError:
+            _kill_group(proc.pid)
+            await proc.wait()
+            return timeout_report(time.perf_counter() - started)
+        finally:
+            _kill_group(proc.pid)
+        returncode = int(proc.returncode or 0)
+        output = out.decode("utf-8", "replace")
+        return classify(returncode, _report(tmp, returncode, output, started))
+
+
+__all__ = ["Limits", "arun_sandboxed", "available", "classify", "run_sandboxed"]
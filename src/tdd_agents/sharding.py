@@ -0,0 +1,88 @@
+"""Split large test suites into shards and merge their results.
+
+A suite is cut into top-level blocks (see `symbols.split_blocks`). Blocks
+made only of `test_*` functions / `Test*` classes are packed, in order, into
+shards of roughly `max_lines` lines; every other block (imports, helpers,
+fixtures) is a shared preamble copied into each shard. Packing contiguously
+keeps earlier shards byte-identical as the suite grows, so their cached
+results stay valid. Suites that do not parse or redefine a test name are not
+sharded. Pure functions.
+
+Concurrency for sharded runs: `TDD_AGENTS_TEST_SHARDS` (default: CPU count).
+"""
+
+from __future__ import annotations
+import ast
+import os
+from typing import List, Optional, Sequence
+
+from tdd_agents.reports import TIMEOUT_DETAILS, SuiteReport, from_cases
+
+
+def shard_concurrency() -> int:
+    return max(1, int(os.getenv("TDD_AGENTS_TEST_SHARDS", str(os.cpu_count() or 1))))
+
+
+def _test_names(block: str) -> Optional[List[str]]:
+    """Names of the tests a block defines, or None if it is preamble."""
+    try:
+        body = ast.parse(block).body
+    except (SyntaxError, ValueError):
+        return None
+    names = []
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            names.append(node.name)
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            names.append(node.name)
+        else:
+            return None
+    return names or None
+
+
+def shard_suite(test_suite: str, max_lines: int) -> List[str]:
+    """Shards of `test_suite`, each preamble + contiguous test blocks."""
+    from tdd_agents.symbols import split_blocks
+
+    try:
+        ast.parse(test_suite)
+    except (SyntaxError, ValueError):
+        return [test_suite]
+    preamble: List[str] = []
+    groups: List[List[str]] = [[]]
+    seen: set = set()
+    size = 0
+    for block in split_blocks(test_suite):
+        names = _test_names(block)
+        if names is None:
+            preamble.append(block)
+            continue
+        if seen.intersection(names):
+            return [test_suite]  # later definition shadows earlier: keep module semantics
+        seen.update(names)
+        lines = block.count("\n") + 1
+        if groups[-1] and size + lines > max_lines:
+            groups.append([])
+            size = 0
+        groups[-1].append(block)
+        size += lines
+    if len(groups) < 2:
+        return [test_suite]
+    return ["\n\n".join(preamble + group) for group in groups]
+
+
+def merge_reports(reports: Sequence[SuiteReport]) -> SuiteReport:
+    """One report for concurrently run shards (duration = slowest shard)."""
+    cases = tuple(c for r in reports for c in r.cases)
+    duration = max((r.duration for r in reports), default=0.0)
+    failing = [r for r in reports if not r.passed]
+    details = "\n".join(r.details for r in (failing or reports) if r.details)[:4000]
+    limited = next((r for r in reports if r.outcome == "resource"), None)
+    if limited is not None:
+        return SuiteReport(False, "resource", cases, round(duration, 6), limited.details)
+    if any(r.outcome == "timeout" for r in reports):
+        return SuiteReport(False, "timeout", cases, round(duration, 6), TIMEOUT_DETAILS)
+    return from_cases(not failing, cases, duration, details)
+
+
+__all__ = ["merge_reports", "shard_concurrency", "shard_suite"]
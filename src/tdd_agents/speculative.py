@@ -0,0 +1,128 @@
+"""Speculative multi-candidate execution for the implementer phase.
+
+Requests K candidates concurrently (as asyncio tasks) and verifies each one
+through a process pool as soon as it arrives. The first green candidate wins;
+pending work is cancelled. Retry latency becomes the max of K attempts
+instead of their sum.
+
+Enable via `TDD_AGENTS_SPECULATIVE_K` (> 1); verification pool size via
+`TDD_AGENTS_SPECULATIVE_WORKERS`.
+"""
+
+from __future__ import annotations
+import asyncio
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from tdd_agents.reports import SuiteReport
+
+Candidate = Tuple[Dict[str, Any], str]  # (validated output, validation message)
+
+
+@dataclass
+class SpeculationResult:
+    output: Dict[str, Any]
+    messages: List[str] = field(default_factory=list)
+    report: SuiteReport = field(default_factory=lambda: SuiteReport(False, "error"))
+    tested: int = 0
+
+    @property
+    def passed(self) -> bool:
+        return self.report.passed
+
+    @property
+    def details(self) -> str:
+        return self.report.details
+
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_PID = 0
+_POOL_LOCK = threading.Lock()
+
+
+def _verification_pool() -> ProcessPoolExecutor:
+    """Process-wide verification pool (forkserver where available)."""
+    global _POOL, _POOL_PID
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_PID != os.getpid():
+            methods = mp.get_all_start_methods()
+            ctx = mp.get_context("forkserver" if "forkserver" in methods else None)
+            workers = int(os.getenv("TDD_AGENTS_SPECULATIVE_WORKERS", str(os.cpu_count() or 1)))
+            _POOL = ProcessPoolExecutor(max_workers=max(1, workers), mp_context=ctx)
+            _POOL_PID = os.getpid()
+        return _POOL
+
+
+async def aspeculate(
+    produce: Callable[[], Awaitable[Candidate]],
+    k: int,
+    test_suite: str,
+    code_key: str = "updated_code",
+    timeout_sec: float = 5,
+) -> SpeculationResult:
+    """Race `k` awaited calls of `produce`; verify candidates as they arrive.
+
+    Identical candidates (same AST fingerprint) are verified once. Returns the
+    first passing candidate, else the first failing one observed, with the
+    `SuiteReport` of its run.
+    """
+    from tdd_agents.fingerprint import code_fingerprint
+    from tdd_agents.runtime_validation import run_tests_report
+
+    loop = asyncio.get_running_loop()
+    verify_pool = _verification_pool()
+    pending: Set[asyncio.Future[Any]] = {asyncio.ensure_future(produce()) for _ in range(k)}
+    under_test: Dict[asyncio.Future[Any], Dict[str, Any]] = {}
+    seen: Set[str] = set()
+    result: Optional[SpeculationResult] = None
+    messages: List[str] = []
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                if fut in under_test:
+                    report = fut.result()
+                    if report.passed:
+                        return SpeculationResult(under_test[fut], messages, report, len(under_test))
+                    if result is None:
+                        result = SpeculationResult(under_test[fut], messages, report)
+                    continue
+                output, msg = fut.result()
+                messages.append(msg)
+                key = code_fingerprint(str(output.get(code_key, "")))
+                if key in seen:
+                    continue
+                seen.add(key)
+                tf = loop.run_in_executor(
+                    verify_pool, run_tests_report, output.get(code_key, ""), test_suite, timeout_sec
+                )
+                under_test[tf] = output
+                pending.add(tf)
+    finally:
+        for fut in pending:
+            fut.cancel()  # in-flight LLM calls are cancelled; queued verifications dropped
+    assert result is not None  # k >= 1 guarantees at least one verified candidate
+    result.tested = len(under_test)
+    return result
+
+
+def speculate(
+    produce: Callable[[], Candidate],
+    k: int,
+    test_suite: str,
+    code_key: str = "updated_code",
+    timeout_sec: float = 5,
+) -> SpeculationResult:
+    """Sync wrapper over `aspeculate` for blocking `produce` callables."""
+
+    async def _produce() -> Candidate:
+        return await asyncio.to_thread(produce)
+
+    return asyncio.run(aspeculate(_produce, k, test_suite, code_key, timeout_sec))
+
+
+__all__ = ["SpeculationResult", "aspeculate", "speculate"]
@@ -1,11 +1,24 @@
 """State management and JSON assembly for multi-agent TDD cycles.
 Pure functions only (except timestamp generation).
+
+Agents and `on_cycle` callbacks receive a read-only `StateView` (see
+`SystemState.view`) instead of a deep copy; `to_dict` is for final output.
+With `TDD_AGENTS_HISTORY_RETAIN` set, `tdd_history` and `code_diffs` are
+`SpillableList`s that keep only the newest cycles in memory. `full_test_suite`
+is a `SnippetStore`; views and `to_dict` see its rendered string.
+`dormant_tests` lists the snippets of it left out of verification runs.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field, asdict
+from collections.abc import Mapping as _MappingABC, Sequence as _SequenceABC
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime, timezone
-from typing import Any, List, Dict
+from types import MappingProxyType
+from typing import Any, Iterator, List, Dict, Mapping, Tuple
+
+from .history import SpillableList, retention_from_env
+from .suite import SnippetStore
+from .system_log import LogRecord, SystemLog, render
 
 ISOFormat = str
 
@@ -61,25 +74,184 @@ class SystemState:
     kata_description: str
     tdd_history: List[TDDCycle] = field(default_factory=list)
     final_code: str = ""
-    full_test_suite: str = ""
+    full_test_suite: SnippetStore = field(default_factory=SnippetStore)
+    dormant_tests: List[str] = field(default_factory=list)
     code_diffs: List[str] = field(default_factory=list)
-    system_log: List[Dict[str, Any]] = field(default_factory=list)
+    system_log: SystemLog = field(default_factory=SystemLog.from_env)
     aborted: bool = False
     abort_reason: str = ""
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Per-field cache of frozen list items, shared by every view of this state.
+        self._frozen: Dict[str, Tuple[int, Dict[int, Any]]] = {}
+
+    def log(self, message: str, level: str = "info", phase: str = "") -> None:
+        """Append a structured record to `system_log`."""
+        self.system_log.log(message, level, phase)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy; spilled history is streamed back in from disk."""
+        return {f.name: _to_plain(getattr(self, f.name)) for f in fields(self)}
+
+    def view(self, **overrides: Any) -> "StateView":
+        """Read-only snapshot view; `overrides` replace top-level keys."""
+        return StateView(self, overrides)
+
+    def _frozen_items(self, name: str, source: Any) -> Dict[int, Any]:
+        if isinstance(source, SpillableList):
+            return source.frozen
+        cached = self._frozen.get(name)
+        if cached is None or cached[0] != id(source):
+            cached = (id(source), {})
+            self._frozen[name] = cached
+        return cached[1]
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, SnippetStore):
+        return value.render()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _to_plain(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, (list, tuple, SpillableList, SystemLog)):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    return value
+
+
+def freeze(value: Any) -> Any:
+    """Immutable equivalent of `value`: mappings/dataclasses -> MappingProxyType, lists -> tuples."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return MappingProxyType({f.name: freeze(getattr(value, f.name)) for f in fields(value)})
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def plain(value: Any) -> Any:
+    """JSON-ready copy of a (possibly frozen) value: mappings -> dict, sequences -> list."""
+    if isinstance(value, _MappingABC):
+        return {k: plain(v) for k, v in value.items()}
+    if isinstance(value, _SequenceABC) and not isinstance(value, (str, bytes)):
+        return [plain(v) for v in value]
+    return value
+
+
+class _FrozenList(_SequenceABC):
+    """Length-bounded read-only view over an append-only state list.
+
+    Items are frozen on first access and cached on the owning state, so
+    repeated views share them instead of re-copying the whole list.
+    """
+
+    __slots__ = ("_source", "_items", "_length")
+
+    def __init__(self, source: Any, items: Dict[int, Any]) -> None:
+        self._source = source
+        self._items = items
+        self._length = len(source)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._length)))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("state list index out of range")
+        item = self._items.get(index)
+        if item is None:
+            item = freeze(self._source[index])
+            if index >= getattr(self._source, "spilled", 0):  # don't pin spilled items
+                self._items[index] = item
+        return item
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, _FrozenList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"_FrozenList({list(self)!r})"
+
+
+class _LogSnapshot(_SequenceABC):
+    """System log records captured by a view; rendered to dicts on access."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Tuple[LogRecord, ...]) -> None:
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return tuple(MappingProxyType(render(r)) for r in self._records[index])
+        return MappingProxyType(render(self._records[index]))
+
+
+class StateView(Mapping[str, Any]):
+    """Read-only mapping over a `SystemState` at the moment it was created.
+
+    Scalars are captured by reference; list fields become `_FrozenList`s and
+    the metrics mapping is frozen only when read. Use `to_dict()` (or `plain`)
+    for a mutable JSON-ready copy.
+    """
+
+    __slots__ = ("_state", "_raw", "_values")
+
+    def __init__(self, state: SystemState, overrides: Mapping[str, Any] | None = None) -> None:
+        self._state = state
+        self._raw: Dict[str, Any] = {f.name: getattr(state, f.name) for f in fields(state)}
+        self._values: Dict[str, Any] = {}
+        for name, value in self._raw.items():
+            if isinstance(value, (list, SpillableList)):
+                self._values[name] = _FrozenList(value, state._frozen_items(name, value))
+            elif isinstance(value, SystemLog):
+                self._values[name] = _LogSnapshot(value.records())
+            elif isinstance(value, SnippetStore):
+                self._raw[name] = self._values[name] = value.render()
+            elif not isinstance(value, dict):
+                self._values[name] = value
+        for name, value in (overrides or {}).items():
+            self._raw[name] = value
+            self._values[name] = freeze(value)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._values[key] = freeze(self._raw[key])
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {k: plain(v) for k, v in self.items()}
 
 
 def initial_state(language: str, kata_description: str) -> SystemState:
     state = SystemState(language=language, kata_description=kata_description)
-    state.system_log.append({"timestamp": now_iso(), "message": "State initialized."})
+    retain = retention_from_env()
+    if retain:
+        state.tdd_history = SpillableList(retain, prefix="tdd_agents_history_")  # type: ignore[assignment]
+        state.code_diffs = SpillableList(retain, prefix="tdd_agents_diffs_")  # type: ignore[assignment]
+    state.log("State initialized.")
     return state
 
 
 def append_cycle(state: SystemState, cycle: TDDCycle) -> SystemState:
     state.tdd_history.append(cycle)
-    state.system_log.append(
-        {"timestamp": now_iso(), "message": f"Cycle {cycle.cycle_number} appended."}
-    )
+    state.log(f"Cycle {cycle.cycle_number} appended.", phase="cycle")
     return state
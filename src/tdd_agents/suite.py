@@ -0,0 +1,99 @@
+"""Ordered store of accepted test snippets.
+
+`SnippetStore` keeps each snippet next to its AST fingerprint (plus a set
+of the fingerprints), so membership checks and appends are O(1) and snippets
+that differ from an accepted one only in formatting or comments are rejected.
+The suite string (snippets joined by a blank line, the historical
+`full_test_suite` format) is rendered lazily and cached until the next
+append. Compares equal to that string. `render_active` leaves out dormant
+snippets (see `tdd_agents.minimize`); its result is cached per dormant list
+until the next append. Pure in-memory state.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from tdd_agents.fingerprint import code_fingerprint
+
+
+class SnippetStore:
+    def __init__(self, snippets: Iterable[str] = ()) -> None:
+        self._snippets: List[Tuple[str, str]] = []  # (snippet, fingerprint)
+        self._keys: Set[str] = set()
+        self._rendered: Optional[str] = ""
+        self._active: Optional[Tuple[Tuple[str, ...], str]] = None  # (dormant, rendered)
+        for snippet in snippets:
+            self.add(snippet)
+
+    @classmethod
+    def parse(cls, suite: str) -> "SnippetStore":
+        """Store from a rendered suite string (one snippet per top-level block)."""
+        from tdd_agents.symbols import split_blocks
+
+        return cls(split_blocks(suite))
+
+    def __contains__(self, snippet: object) -> bool:
+        if not isinstance(snippet, str) or not snippet.strip():
+            return False
+        return code_fingerprint(snippet.strip()) in self._keys
+
+    def add(self, snippet: str) -> bool:
+        """Append `snippet` unless blank or already present; True if added."""
+        snippet = snippet.strip()
+        if not snippet:
+            return False
+        key = code_fingerprint(snippet)
+        if key in self._keys:
+            return False
+        self._snippets.append((snippet, key))
+        self._keys.add(key)
+        self._rendered = None
+        self._active = None
+        return True
+
+    def render(self) -> str:
+        if self._rendered is None:
+            self._rendered = "\n\n".join(s for s, _ in self._snippets)
+        return self._rendered
+
+    def render_active(self, dormant: Iterable[str] = ()) -> str:
+        """Suite string without the `dormant` snippets (matched by fingerprint)."""
+        dormant = tuple(dormant)
+        if not dormant:
+            return self.render()
+        if self._active is None or self._active[0] != dormant:
+            skip = {code_fingerprint(s.strip()) for s in dormant if s.strip()}
+            active = "\n\n".join(s for s, key in self._snippets if key not in skip)
+            self._active = (dormant, active)
+        return self._active[1]
+
+    def with_snippet(self, snippet: str, dormant: Iterable[str] = ()) -> str:
+        """Active suite string including `snippet` (if new), without storing it."""
+        rendered = self.render_active(dormant)
+        if not snippet.strip() or snippet in self:
+            return rendered
+        return f"{rendered}\n\n{snippet.strip()}" if rendered else snippet.strip()
+
+    def __len__(self) -> int:
+        return len(self._snippets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(tuple(s for s, _ in self._snippets))
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SnippetStore):
+            return self.render() == other.render()
+        if isinstance(other, str):
+            return self.render() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SnippetStore(snippets={len(self)})"
+
+
+__all__ = ["SnippetStore"]
@@ -0,0 +1,141 @@
+"""AST symbol index shared by agents and heuristics.
+
+`index_for(code)` returns a `SymbolIndex` with, for the given code:
+- `defs`: names of every function definition (any nesting level);
+- `calls`: names called as plain functions, excluding `test_*` and names the
+  code itself defines (builtins are kept: katas may target e.g. `sum`);
+- `expected`: per called function, the source of the first literal RHS of an
+  `assert fn(...) == <literal>`.
+
+Code is split into top-level blocks (a non-indented line after a blank line
+starts a new block, matching how snippets are appended to the suite) and each
+block is parsed once and memoized, so re-indexing a suite after a snippet is
+appended only parses the new block. Blocks that do not parse fall back to the
+old regex scans. Indexes are memoized per code string so every agent in a
+cycle shares the same instance. Pure functions.
+"""
+
+from __future__ import annotations
+import ast
+import keyword
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Set, Tuple
+
+_CALL_RE = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
+_DEF_RE = re.compile(r"\bdef\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
+_LITERAL_RE = re.compile(r"^(\[.*\]|\{.*\}|\d+|'.*'|\".*\")$")
+
+
+@dataclass(frozen=True)
+class BlockSymbols:
+    defs: FrozenSet[str] = frozenset()
+    calls: Tuple[str, ...] = ()  # first-seen order
+    expected: Tuple[Tuple[str, str], ...] = ()
+
+
+def split_blocks(code: str) -> List[str]:
+    """Top-level blocks of `code`, each a non-indented line after a blank line onward."""
+    blocks: List[str] = []
+    current: List[str] = []
+    blank = False
+    for line in code.splitlines():
+        if current and blank and line[:1] not in ("", " ", "\t"):
+            blocks.append("\n".join(current).rstrip())
+            current = []
+        current.append(line)
+        blank = not line.strip()
+    if current:
+        blocks.append("\n".join(current).rstrip())
+    return [b for b in blocks if b.strip()]
+
+
+def _literal_source(block: str, node: ast.expr) -> str:
+    try:
+        ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return ""
+    return ast.get_source_segment(block, node) or ""
+
+
+def _scan_ast(block: str, tree: ast.AST) -> BlockSymbols:
+    defs: Set[str] = set()
+    calls: Dict[str, None] = {}
+    expected: List[Tuple[str, str]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            defs.add(node.name)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            calls.setdefault(node.func.id)
+        elif isinstance(node, ast.Assert) and isinstance(node.test, ast.Compare):
+            test = node.test
+            if (
+                len(test.ops) == 1
+                and isinstance(test.ops[0], ast.Eq)
+                and isinstance(test.left, ast.Call)
+                and isinstance(test.left.func, ast.Name)
+            ):
+                literal = _literal_source(block, test.comparators[0])
+                if literal:
+                    expected.append((test.left.func.id, literal))
+    return BlockSymbols(frozenset(defs), tuple(calls), tuple(expected))
+
+
+def _scan_text(block: str) -> BlockSymbols:
+    """Regex fallback for blocks that do not parse."""
+    defs = frozenset(_DEF_RE.findall(block))
+    calls = tuple(dict.fromkeys(n for n in _CALL_RE.findall(block) if not keyword.iskeyword(n)))
+    expected: List[Tuple[str, str]] = []
+    for line in block.splitlines():
+        if "assert" not in line or "==" not in line:
+            continue
+        rhs = line.split("==", 1)[1].strip()
+        if "," in rhs:
+            rhs = rhs.split(",", 1)[0].strip()
+        if not _LITERAL_RE.match(rhs):
+            continue
+        for fn in calls:
+            if f"{fn}(" in line:
+                expected.append((fn, rhs))
+    return BlockSymbols(defs, calls, tuple(expected))
+
+
+@lru_cache(maxsize=1024)
+def scan_block(block: str) -> BlockSymbols:
+    try:
+        tree = ast.parse(block)
+    except (SyntaxError, ValueError):
+        return _scan_text(block)
+    return _scan_ast(block, tree)
+
+
+@dataclass(frozen=True)
+class SymbolIndex:
+    defs: FrozenSet[str] = frozenset()
+    calls: FrozenSet[str] = frozenset()
+    expected: Mapping[str, str] = field(default_factory=dict)
+
+    def missing(self, names: Set[str]) -> Set[str]:
+        """Subset of `names` this code does not define."""
+        return set(names) - self.defs
+
+
+@lru_cache(maxsize=64)
+def index_for(code: str) -> SymbolIndex:
+    defs: Set[str] = set()
+    calls: Dict[str, None] = {}
+    expected: Dict[str, str] = {}
+    for block in split_blocks(code):
+        symbols = scan_block(block)
+        defs |= symbols.defs
+        for name in symbols.calls:
+            calls.setdefault(name)
+        for fn, literal in symbols.expected:
+            expected.setdefault(fn, literal)
+    called = frozenset(n for n in calls if not n.startswith("test_") and n not in defs)
+    return SymbolIndex(frozenset(defs), called, MappingProxyType(expected))
+
+
+__all__ = ["BlockSymbols", "SymbolIndex", "index_for", "scan_block", "split_blocks"]
@@ -0,0 +1,167 @@
+"""Ring-buffered structured system log with an optional JSONL sink.
+
+Records are compact tuples `(ts, level, phase, message)` (`ts` = epoch
+seconds) held in a bounded deque; once full, the oldest are dropped and
+counted in `dropped`. Rendering to `{"timestamp", "level", "phase",
+"message"}` dicts happens only when the log is read (`to_dict`, views).
+
+Side effects: when a sink path is configured every record is also queued to a
+background thread that appends one JSON line per record (plus the run id), so
+the full log survives even though memory stays bounded. Sinks are shared per
+path within a process and flushed at exit.
+
+Configure via `TDD_AGENTS_LOG_CAPACITY` (default 1000) and
+`TDD_AGENTS_LOG_FILE` (CLI `--log-file`).
+"""
+
+from __future__ import annotations
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional, Tuple
+
+LogRecord = Tuple[float, str, str, str]
+
+LEVELS = ("debug", "info", "warning", "error")
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def render(record: LogRecord) -> Dict[str, Any]:
+    """Dict form of a record. Pure function."""
+    ts, level, phase, message = record
+    return {"timestamp": _iso(ts), "level": level, "phase": phase, "message": message}
+
+
+class _JsonlSink:
+    """Background writer appending JSON lines to `path`."""
+
+    _STOP = object()
+
+    def __init__(self, path: str) -> None:
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self.path = path
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="tdd-agents-log", daemon=True)
+        self._thread.start()
+
+    def put(self, run_id: str, record: LogRecord) -> None:
+        self._queue.put((run_id, record))
+
+    def _drain(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                item = self._queue.get()
+                if item is self._STOP:
+                    self._queue.task_done()
+                    return
+                run_id, (ts, level, phase, message) = item
+                f.write(
+                    json.dumps(
+                        {"ts": ts, "run": run_id, "level": level, "phase": phase, "message": message}
+                    )
+                    + "\n"
+                )
+                if self._queue.empty():
+                    f.flush()
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=5)
+
+
+_SINKS: Dict[Tuple[int, str], _JsonlSink] = {}
+_SINKS_LOCK = threading.Lock()
+
+
+def sink_for(path: str) -> _JsonlSink:
+    """Shared sink for `path` in this process (forked children get their own)."""
+    key = (os.getpid(), os.path.abspath(path))
+    with _SINKS_LOCK:
+        sink = _SINKS.get(key)
+        if sink is None:
+            sink = _SINKS[key] = _JsonlSink(key[1])
+        return sink
+
+
+def _close_sinks() -> None:
+    with _SINKS_LOCK:
+        sinks = [s for (pid, _), s in _SINKS.items() if pid == os.getpid()]
+        _SINKS.clear()
+    for sink in sinks:
+        sink.close()
+
+
+atexit.register(_close_sinks)
+
+
+class SystemLog:
+    """Bounded log of `LogRecord`s; list-like reads yield rendered dicts."""
+
+    def __init__(self, capacity: int = 1000, sink: Optional[_JsonlSink] = None) -> None:
+        self._records: Deque[LogRecord] = deque(maxlen=capacity if capacity > 0 else None)
+        self.sink = sink
+        self.run_id = uuid.uuid4().hex[:12]
+        self.total = 0
+
+    @classmethod
+    def from_env(cls) -> "SystemLog":
+        path = os.getenv("TDD_AGENTS_LOG_FILE")
+        return cls(
+            capacity=int(os.getenv("TDD_AGENTS_LOG_CAPACITY", "1000")),
+            sink=sink_for(path) if path else None,
+        )
+
+    @property
+    def dropped(self) -> int:
+        return self.total - len(self._records)
+
+    def log(self, message: str, level: str = "info", phase: str = "") -> None:
+        record = (time.time(), level, phase, message)
+        self._records.append(record)
+        self.total += 1
+        if self.sink is not None:
+            self.sink.put(self.run_id, record)
+
+    def append(self, entry: Mapping[str, Any]) -> None:
+        """Accept legacy `{"timestamp", "message"}` dict entries."""
+        self.log(
+            str(entry.get("message", "")),
+            level=str(entry.get("level", "info")),
+            phase=str(entry.get("phase", "")),
+        )
+
+    def records(self) -> Tuple[LogRecord, ...]:
+        return tuple(self._records)
+
+    def flush(self) -> None:
+        if self.sink is not None:
+            self.sink.flush()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (render(r) for r in tuple(self._records))
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return render(self._records[index])
+
+    def __repr__(self) -> str:
+        return f"SystemLog(len={len(self)}, dropped={self.dropped})"
+
+
+__all__ = ["LEVELS", "LogRecord", "SystemLog", "render", "sink_for"]
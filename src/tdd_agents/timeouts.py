@@ -0,0 +1,62 @@
+"""Adaptive per-kata test timeouts.
+
+An `AdaptiveTimeout` lives for one kata run. It keeps a rolling window of
+observed test-run durations and sets the next timeout to
+`p99(window) * factor`, clamped to `[floor, ceiling]`. Suites only grow, so
+recent durations track the current suite size. Before the first observation
+the old fixed default (5 s) applies. After a timeout the next limit doubles
+(still capped), so a suite that outgrew its estimate recovers instead of
+timing out forever.
+
+Configure via `TDD_AGENTS_TIMEOUT_FLOOR` (default 2 s),
+`TDD_AGENTS_TIMEOUT_CEILING` (30 s) and `TDD_AGENTS_TIMEOUT_FACTOR` (3).
+Pure in-memory state.
+"""
+
+from __future__ import annotations
+import math
+import os
+from collections import deque
+from typing import Deque
+
+DEFAULT_TIMEOUT = 5.0
+_WINDOW = 50
+
+
+def _p99(values: Deque[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(0.99 * len(ordered)) - 1)]
+
+
+class AdaptiveTimeout:
+    def __init__(self, floor: float = 2.0, ceiling: float = 30.0, factor: float = 3.0) -> None:
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+        self.factor = factor
+        self._durations: Deque[float] = deque(maxlen=_WINDOW)
+        self._backoff = 1.0
+        self.timeouts = 0
+
+    @classmethod
+    def from_env(cls) -> "AdaptiveTimeout":
+        return cls(
+            floor=float(os.getenv("TDD_AGENTS_TIMEOUT_FLOOR", "2")),
+            ceiling=float(os.getenv("TDD_AGENTS_TIMEOUT_CEILING", "30")),
+            factor=float(os.getenv("TDD_AGENTS_TIMEOUT_FACTOR", "3")),
+        )
+
+    def current(self) -> float:
+        """Timeout (seconds) for the next test run."""
+        base = _p99(self._durations) * self.factor if self._durations else DEFAULT_TIMEOUT
+        return round(min(self.ceiling, max(self.floor, base * self._backoff)), 3)
+
+    def observe(self, duration: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+            self._backoff *= 2
+            return
+        self._durations.append(max(0.0, duration))
+        self._backoff = 1.0
+
+
+__all__ = ["AdaptiveTimeout", "DEFAULT_TIMEOUT"]
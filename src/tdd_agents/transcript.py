@@ -0,0 +1,171 @@
+"""Record/replay LLM transcripts for deterministic, zero-cost reruns.
+
+Side effects: `RecordingLLM` appends one JSON line per call to a transcript:
+`{"role", "prompt", "response", "latency_ms", "timestamp"}`. `ReplayLLM`
+serves responses back from such a file without any network access.
+
+Replay matching per call: exact (role, prompt) first, else the next unused
+record for the role in transcript order. Exhausted lookups return the NullLLM
+sentinel and bump `misses`. Optionally sleeps for the recorded latency.
+
+Agents get role-scoped views via `for_role(role)`.
+Enable via `TDD_AGENTS_RECORD` / `TDD_AGENTS_REPLAY` (CLI `--record` /
+`--replay`), latency via `TDD_AGENTS_REPLAY_LATENCY=1` (`--replay-latency`).
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
+from typing import Any, Deque, Dict, List, Set, Tuple
+
+from tdd_agents.state import now_iso
+
+_NULL_OUTPUT = "[NULL_LLM_OUTPUT]"
+
+
+class _TranscriptWriter:
+    """Append-only JSONL writer shared by all role views."""
+
+    def __init__(self, path: str) -> None:
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+@dataclass
+class RecordingLLM:
+    """Pass calls through to `inner` and record them."""
+
+    inner: Any
+    writer: _TranscriptWriter
+    role: str = ""
+
+    @classmethod
+    def to_file(cls, inner: Any, path: str) -> "RecordingLLM":
+        return cls(inner, _TranscriptWriter(path))
+
+    def for_role(self, role: str) -> "RecordingLLM":
+        return replace(self, role=role)
+
+    def _record(self, prompt: str, response: str, started: float) -> None:
+        self.writer.write(
+            {
+                "role": self.role,
+                "prompt": prompt,
+                "response": response,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+                "timestamp": now_iso(),
+            }
+        )
+
+    def generate(self, prompt: str) -> str:
+        started = time.perf_counter()
+        response = str(self.inner.generate(prompt))
+        self._record(prompt, response, started)
+        return response
+
+    async def agenerate(self, prompt: str) -> str:
+        from tdd_agents.llm import agenerate
+
+        started = time.perf_counter()
+        response = await agenerate(self.inner, prompt)
+        self._record(prompt, response, started)
+        return response
+
+
+class _TranscriptIndex:
+    """Loaded transcript with consumption tracking shared across role views."""
+
+    def __init__(self, path: str) -> None:
+        self.records: List[Dict[str, Any]] = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self.records.append(json.loads(line))
+        self.by_key: Dict[Tuple[str, str], Deque[int]] = defaultdict(deque)
+        self.by_role: Dict[str, Deque[int]] = defaultdict(deque)
+        for i, rec in enumerate(self.records):
+            role, prompt = str(rec.get("role", "")), str(rec.get("prompt", ""))
+            self.by_key[(role, prompt)].append(i)
+            self.by_role[role].append(i)
+            self.by_key[("", prompt)].append(i)  # role-less lookups
+        self.used: Set[int] = set()
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _pop(self, queue: Deque[int]) -> int:
+        while queue:
+            i = queue.popleft()
+            if i not in self.used:
+                self.used.add(i)
+                return i
+        return -1
+
+    def take(self, role: str, prompt: str) -> Dict[str, Any] | None:
+        with self._lock:
+            i = self._pop(self.by_key.get((role, prompt), deque()))
+            if i < 0 and role:
+                i = self._pop(self.by_role.get(role, deque()))
+            if i < 0:
+                self.misses += 1
+                return None
+            return self.records[i]
+
+
+@dataclass
+class ReplayLLM:
+    """Serve recorded responses; never touches the network."""
+
+    index: _TranscriptIndex
+    role: str = ""
+    reproduce_latency: bool = False
+
+    @classmethod
+    def from_file(cls, path: str, reproduce_latency: bool = False) -> "ReplayLLM":
+        return cls(_TranscriptIndex(path), reproduce_latency=reproduce_latency)
+
+    @property
+    def misses(self) -> int:
+        return self.index.misses
+
+    def for_role(self, role: str) -> "ReplayLLM":
+        return replace(self, role=role)
+
+    def _lookup(self, prompt: str) -> Tuple[str, float]:
+        rec = self.index.take(self.role, prompt)
+        if rec is None:
+            return _NULL_OUTPUT, 0.0
+        delay = float(rec.get("latency_ms", 0)) / 1000 if self.reproduce_latency else 0.0
+        return str(rec.get("response", "")), delay
+
+    def generate(self, prompt: str) -> str:
+        response, delay = self._lookup(prompt)
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def agenerate(self, prompt: str) -> str:
+        response, delay = self._lookup(prompt)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+
+def for_role(client: Any, role: str) -> Any:
+    """Role-scoped view of `client` when supported, else the client itself."""
+    bind = getattr(client, "for_role", None)
+    return bind(role) if bind is not None else client
+
+
+__all__ = ["RecordingLLM", "ReplayLLM", "for_role"]
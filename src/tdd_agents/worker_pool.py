@@ -0,0 +1,269 @@
+"""Warm pytest worker pool for runtime test execution.
+
+Side-effect boundary: long-lived worker processes. Each worker imports pytest
+once at startup, then forks a fresh child per job (forkserver-style) so every
+run starts from a warm interpreter yet stays isolated from previous jobs.
+Jobs travel over a pipe as `(kind, impl_code, test_suite, timeout_sec)`.
+`pytest` jobs come back as `SuiteReport` JSON (junit-derived per-test
+outcomes); `run` keeps the `(passed, details)` contract of `run_tests`.
+`fast` jobs (`run_fast_job`) run `fastpath`'s in-process executor and return
+the raw `run_forked` pair: forking happens only in these single-threaded
+spawned workers, never in the multi-threaded orchestrator process. Each worker owns one
+`workspace.Workspace` that its job children reset in place, sharing the
+content-keyed bytecode cache.
+
+Enable via `TDD_AGENTS_TEST_RUNNER=pool`; size via `TDD_AGENTS_POOL_SIZE`.
+"""
+
+from __future__ import annotations
+import atexit
+import json
+import multiprocessing as mp
+import os
+import queue
+import select
+import signal
+import sys
+import threading
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.util import Finalize
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tdd_agents.reports import SuiteReport, from_cases, from_output, parse_junit, timeout_report
+
+_RESULT_LIMIT = 4000
+_WARM_MODULES = (
+    "pytest",
+    "_pytest.config",
+    "_pytest.main",
+    "_pytest.python",
+    "_pytest.terminal",
+    "_pytest.assertion.rewrite",
+)
+
+
+def _run_job(impl_code: str, test_suite: str, tmp: str) -> Dict[str, Any]:
+    """Run pytest in-process for one job in workspace `tmp`. Forked child only."""
+    from tdd_agents.workspace import reset_workspace
+    import pytest
+
+    reset_workspace(tmp, impl_code, test_suite)
+    out_path = os.path.join(tmp, "pytest_output.txt")
+    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.chdir(tmp)
+    sys.path.insert(0, tmp)
+    junit_path = os.path.join(tmp, "report.xml")
+    started = time.perf_counter()
+    rc = pytest.main(["-q", "-p", "no:cacheprovider", f"--junitxml={junit_path}", "tests"])
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with open(out_path, "r", encoding="utf-8", errors="replace") as f:
+        details = f.read().strip()[:_RESULT_LIMIT]
+    passed, elapsed = int(rc) == 0, time.perf_counter() - started
+    cases = parse_junit(junit_path)
+    report = (
+        from_cases(passed, cases, elapsed, details) if cases else from_output(passed, details, elapsed)
+    )
+    return report.to_json()
+
+
+def _read_until(fd: int, deadline: float) -> Optional[bytes]:
+    """Read `fd` to EOF; return None if `deadline` passes first."""
+    chunks: List[bytes] = []
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return None
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def run_forked(
+    fn: Callable[..., Any], args: Tuple[Any, ...], timeout_sec: float
+) -> Tuple[str, Any]:
+    """Run `fn(*args)` in a forked child; JSON result travels back over a pipe.
+
+    Returns ("ok", result), ("timeout", None) after killing the child, or
+    ("error", message). The child never returns into the caller's frame.
+    """
+    r, w = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child
+        os.close(r)
+        try:
+            payload = json.dumps(["ok", fn(*args)])
+        except BaseException as e:  # report anything, never return into caller
+            payload = json.dumps(["error", f"{type(e).__name__}: {e}"])
+        with os.fdopen(w, "wb") as out:
+            out.write(payload.encode("utf-8"))
+        os._exit(0)
+    os.close(w)
+    try:
+        data = _read_until(r, time.monotonic() + timeout_sec)
+    finally:
+        os.close(r)
+    if data is None:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        return "timeout", None
+    os.waitpid(pid, 0)
+    if not data:
+        return "error", "child exited without result"
+    kind, value = json.loads(data.decode("utf-8"))
+    return str(kind), value
+
+
+def _fork_and_run(impl_code: str, test_suite: str, timeout_sec: float, workspace: str) -> Dict[str, Any]:
+    """Fork the warm worker, run one job in the child, enforce timeout."""
+    started = time.perf_counter()
+    kind, value = run_forked(_run_job, (impl_code, test_suite, workspace), timeout_sec)
+    if kind == "timeout":
+        return timeout_report(time.perf_counter() - started).to_json()
+    if kind == "error":
+        return SuiteReport(False, "error", details=f"Worker error: {value}").to_json()
+    return dict(value)
+
+
+def _worker_main(conn: Connection, workspace: str) -> None:
+    """Worker loop: warm imports once, then serve jobs until EOF/None."""
+    for name in _WARM_MODULES:
+        __import__(name)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        kind, impl_code, test_suite, timeout_sec = job
+        if kind == "fast":
+            from tdd_agents.fastpath import _execute
+
+            conn.send(list(run_forked(_execute, (impl_code, test_suite), timeout_sec)))
+        else:
+            conn.send(_fork_and_run(impl_code, test_suite, timeout_sec, workspace))
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, ctx: Any) -> None:
+        from tdd_agents.workspace import Workspace, workspace_root
+
+        self.workspace = Workspace(workspace_root())
+        self.conn, child_conn = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child_conn, self.workspace.path), daemon=True)
+        self.proc.start()
+        child_conn.close()
+
+    def close(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.conn.close()
+        self.proc.join(timeout=1)
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.workspace.close()
+
+
+class WarmPytestPool:
+    """Pool of warm pytest workers; thread-safe `run` with `run_tests` contract."""
+
+    def __init__(self, size: int = 2) -> None:
+        # Workers start from a clean interpreter; only they fork per job.
+        self._ctx = mp.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers: List[_Worker] = []
+        self.pid = os.getpid()
+        for _ in range(max(1, size)):
+            worker = _Worker(self._ctx)
+            self._workers.append(worker)
+            self._idle.put(worker)
+
+    def _request(self, job: Tuple[Any, ...], timeout_sec: float) -> Any:
+        """Send `job` to an idle worker; raises EOFError/OSError on worker faults."""
+        worker = self._idle.get()
+        try:
+            worker.conn.send(job)
+            # worker enforces the job timeout itself; allow slack for IPC
+            if not worker.conn.poll(timeout_sec + 5):
+                raise EOFError("worker unresponsive")
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            worker = self._replace(worker)
+            raise
+        finally:
+            self._idle.put(worker)
+
+    def run_report(self, impl_code: str, test_suite: str, timeout_sec: float = 5) -> SuiteReport:
+        try:
+            data = self._request(("pytest", impl_code, test_suite, timeout_sec), timeout_sec)
+        except (EOFError, OSError) as e:
+            return SuiteReport(False, "error", details=f"Worker pool error: {e}")
+        return SuiteReport.from_json(data)
+
+    def run_fast_job(self, impl_code: str, test_suite: str, timeout_sec: float = 5) -> Tuple[str, Any]:
+        """`fastpath` executor in a forked child of a worker; `run_forked` result."""
+        try:
+            kind, value = self._request(("fast", impl_code, test_suite, timeout_sec), timeout_sec)
+        except (EOFError, OSError) as e:
+            return "error", f"Worker pool error: {e}"
+        return str(kind), value
+
+    def run(self, impl_code: str, test_suite: str, timeout_sec: float = 5) -> Tuple[bool, str]:
+        return self.run_report(impl_code, test_suite, timeout_sec).as_tuple()
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.close()
+        fresh = _Worker(self._ctx)
+        with self._lock:
+            self._workers = [w for w in self._workers if w is not worker] + [fresh]
+        return fresh
+
+    def close(self) -> None:
+        if self.pid != os.getpid():  # inherited by a forked child: not ours
+            return
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+
+_DEFAULT_POOL: Optional[WarmPytestPool] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_pool() -> WarmPytestPool:
+    """Return the process-wide pool, creating it lazily (per pid)."""
+    global _DEFAULT_POOL
+    with _DEFAULT_LOCK:
+        if _DEFAULT_POOL is None or _DEFAULT_POOL.pid != os.getpid():
+            size = int(os.getenv("TDD_AGENTS_POOL_SIZE", str(min(4, os.cpu_count() or 1))))
+            _DEFAULT_POOL = WarmPytestPool(size=size)
+            # atexit does not run in multiprocessing workers (batch, speculative)
+            Finalize(_DEFAULT_POOL, _DEFAULT_POOL.close, exitpriority=10)
+        return _DEFAULT_POOL
+
+
+def shutdown_default_pool() -> None:
+    global _DEFAULT_POOL
+    with _DEFAULT_LOCK:
+        if _DEFAULT_POOL is not None and _DEFAULT_POOL.pid == os.getpid():
+            _DEFAULT_POOL.close()
+        _DEFAULT_POOL = None
+
+
+atexit.register(shutdown_default_pool)
+
+
+__all__ = ["WarmPytestPool", "default_pool", "run_forked", "shutdown_default_pool"]
@@ -0,0 +1,144 @@
+"""Reusable on-disk workspaces for pytest runs.
+
+Side-effect boundary: directories under `/dev/shm` when writable (override
+with `TDD_AGENTS_WORKSPACE_DIR`, falling back to the temp dir). A
+`WorkspacePool` hands out pre-created workspaces that are reset in place per
+job instead of creating and deleting a temp dir per run; all are removed at
+process exit (including multiprocessing workers).
+
+`reset` rewrites `impl.py` / `tests/test_generated.py` only when their content
+changed, and stamps each file with an mtime derived from its content hash.
+Python and pytest validate cached bytecode by source mtime + size, so the
+workspace's own `__pycache__` dirs (pytest's assertion-rewritten test module
+included) are effectively keyed by content: an unchanged test file is not
+recompiled on the next attempt, and a changed one can never pick up stale
+bytecode. That bytecode lives and dies with the workspace; installed
+packages keep their usual `__pycache__`.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from multiprocessing.util import Finalize
+from typing import Iterator, List, Optional
+
+_STALE = ("report.xml", "pytest_output.txt")
+
+
+def workspace_root() -> str:
+    root = os.getenv("TDD_AGENTS_WORKSPACE_DIR")
+    if root:
+        os.makedirs(root, exist_ok=True)
+        return root
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def _content_mtime(data: bytes) -> int:
+    """Deterministic mtime (2001..2033) for `data`. Pure function."""
+    return 1_000_000_000 + int(hashlib.sha256(data).hexdigest()[:8], 16) % 1_000_000_000
+
+
+def _sync(path: str, content: str) -> bool:
+    """Write `content` unless the file already holds it; True if written."""
+    data = content.encode("utf-8")
+    mtime = _content_mtime(data)
+    try:
+        st = os.stat(path)
+        if st.st_size == len(data) and int(st.st_mtime) == mtime:
+            return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    os.utime(path, (mtime, mtime))
+    return True
+
+
+def reset_workspace(path: str, impl_code: str, test_suite: str) -> None:
+    """Bring the workspace at `path` to exactly this job's files."""
+    from tdd_agents.runtime_validation import runtime_files
+
+    os.makedirs(os.path.join(path, "tests"), exist_ok=True)
+    for rel, content in runtime_files(impl_code, test_suite).items():
+        _sync(os.path.join(path, rel), content)
+    for name in _STALE:
+        try:
+            os.remove(os.path.join(path, name))
+        except OSError:
+            pass
+
+
+class Workspace:
+    def __init__(self, root: str) -> None:
+        self.path = tempfile.mkdtemp(prefix="tdd_agents_ws_", dir=root)
+        os.makedirs(os.path.join(self.path, "tests"), exist_ok=True)
+
+    def reset(self, impl_code: str, test_suite: str) -> None:
+        reset_workspace(self.path, impl_code, test_suite)
+
+    def close(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class WorkspacePool:
+    """Thread-safe pool; grows to the peak number of concurrent runs."""
+
+    def __init__(self, root: Optional[str] = None) -> None:
+        self.root = root or workspace_root()
+        self.pid = os.getpid()
+        self._idle: "queue.Queue[Workspace]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._all: List[Workspace] = []
+
+    @contextmanager
+    def acquire(self, impl_code: str, test_suite: str) -> Iterator[Workspace]:
+        try:
+            workspace = self._idle.get_nowait()
+        except queue.Empty:
+            workspace = Workspace(self.root)
+            with self._lock:
+                self._all.append(workspace)
+        try:
+            workspace.reset(impl_code, test_suite)
+            yield workspace
+        finally:
+            self._idle.put(workspace)
+
+    def close(self) -> None:
+        if self.pid != os.getpid():  # forked children inherit finalizers; not theirs to remove
+            return
+        with self._lock:
+            workspaces, self._all = self._all, []
+        for workspace in workspaces:
+            workspace.close()
+
+
+_DEFAULT: Optional[WorkspacePool] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_workspaces() -> WorkspacePool:
+    """Process-wide pool, created lazily (per pid)."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None or _DEFAULT.pid != os.getpid():
+            _DEFAULT = WorkspacePool()
+            # unlike atexit, also runs when multiprocessing pool workers exit
+            Finalize(_DEFAULT, _DEFAULT.close, exitpriority=10)
+        return _DEFAULT
+
+
+__all__ = [
+    "Workspace",
+    "WorkspacePool",
+    "default_workspaces",
+    "reset_workspace",
+    "workspace_root",
+]
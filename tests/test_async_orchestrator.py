@@ -0,0 +1,51 @@
+import asyncio
+
+from tdd_agents.agents.refactorer import RefactorerAgent
+from tdd_agents.orchestrator import arun_n_cycles
+from tdd_agents.runtime_validation import arun_tests
+
+
+class AsyncOnlyLLM:
+    def __init__(self):
+        self.prompts = []
+
+    async def agenerate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        await asyncio.sleep(0)
+        return "def f():\n    return 1\n"
+
+
+def test_arun_n_cycles_drives_katas_concurrently(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("LLM_PROVIDER", "none")
+
+    async def main():
+        return await asyncio.gather(
+            arun_n_cycles("python", "Kata one", max_cycles=2),
+            arun_n_cycles("python", "Kata two", max_cycles=2),
+        )
+
+    first, second = asyncio.run(main())
+    assert first["kata_description"] == "Kata one"
+    assert second["kata_description"] == "Kata two"
+    assert 1 <= len(first["tdd_history"]) <= 2
+
+
+def test_agent_aact_awaits_async_llm():
+    llm = AsyncOnlyLLM()
+    agent = RefactorerAgent("refactorer", llm=llm)
+    out = asyncio.run(agent.aact({"final_code": "def f():\n    return 0\n"}))
+    assert out["refactored_code"] == "def f():\n    return 1\n"
+    assert llm.prompts and "Current code" in llm.prompts[0]
+
+
+def test_arun_tests_pass_fail_and_timeout(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_TEST_CACHE", "0")
+    ok = asyncio.run(arun_tests("X = 1\n", "def test_x():\n    assert X == 1\n"))
+    bad = asyncio.run(arun_tests("X = 2\n", "def test_x():\n    assert X == 1\n"))
+    hang = asyncio.run(
+        arun_tests("import time\n", "def test_x():\n    time.sleep(30)\n", timeout_sec=1)
+    )
+    assert ok[0] is True
+    assert bad[0] is False and "failed" in bad[1]
+    assert hang == (False, "Test execution timeout")
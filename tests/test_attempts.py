@@ -0,0 +1,40 @@
+from tdd_agents.attempts import REPEAT_HINT, AttemptTracker
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.reports import from_output
+
+
+class StuckImplementer:
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return "def test_add():\n    assert add(2, 2) == 4\n"
+        if prompt.startswith("You are an implementation agent"):
+            self.prompts.append(prompt)
+            return "def add(a, b):\n    return a - b\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_tracker_classifies_repeats_and_reuses_reports():
+    tracker = AttemptTracker(max_repeats=1)
+    report = from_output(False, "FAILED t.py::test_add - assert 0 == 4")
+    assert tracker.report_for("x = 1") is None
+    tracker.remember("x = 1\n", report)
+    assert tracker.report_for("x = 1   \r\n") is report  # normalized
+    assert tracker.failure("x = 1", report.signature) == "new"
+    assert tracker.failure("x = 2", report.signature) == "new"  # different code
+    assert tracker.failure("x = 1\n", report.signature) == "repeat"
+    assert tracker.failure("x = 1", report.signature) == "abort"
+
+
+def test_identical_failing_candidate_aborts_with_distinct_reason(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_MAX_RETRIES", "5")
+    monkeypatch.delenv("TDD_AGENTS_MAX_REPEATS", raising=False)
+    llm = StuckImplementer()
+    result = run_n_cycles("python", "add numbers", max_cycles=1, llm=llm)
+    assert result["aborted"] and result["abort_reason"] == "implementer_repeated_failure"
+    assert len(llm.prompts) == 3
+    assert REPEAT_HINT not in llm.prompts[1] and REPEAT_HINT in llm.prompts[2]
+    runs = [s for s in result["metrics"]["spans"] if (s["phase"], s["name"]) == ("implementer", "run_tests")]
+    assert len(runs) == 1  # repeats reuse the first report
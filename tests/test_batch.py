@@ -0,0 +1,85 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from tdd_agents.batch import load_katas, summarize
+
+
+def test_load_katas_from_dir_and_jsonl():
+    with tempfile.TemporaryDirectory() as tmp:
+        kata_dir = os.path.join(tmp, "katas")
+        os.makedirs(kata_dir)
+        with open(os.path.join(kata_dir, "fizz buzz.txt"), "w") as f:
+            f.write("FizzBuzz kata\n")
+        with open(os.path.join(kata_dir, "notes.json"), "w") as f:
+            f.write("{}")
+        specs = load_katas(kata_dir)
+        assert [(s.kata_id, s.description) for s in specs] == [("fizz_buzz", "FizzBuzz kata")]
+        jsonl = os.path.join(tmp, "katas.jsonl")
+        with open(jsonl, "w") as f:
+            f.write(json.dumps({"id": "primes", "kata": "Prime check"}) + "\n\n")
+            f.write(json.dumps({"description": "Roman numerals", "language": "python"}) + "\n")
+        specs = load_katas(jsonl)
+        assert [s.kata_id for s in specs] == ["primes", "kata_0003"]
+        assert specs[1].language == "python"
+
+
+def test_load_katas_rejects_duplicate_ids():
+    with tempfile.TemporaryDirectory() as tmp:
+        kata_dir = os.path.join(tmp, "katas")
+        os.makedirs(kata_dir)
+        for name in ("fizz buzz.txt", "fizz_buzz.md"):
+            with open(os.path.join(kata_dir, name), "w") as f:
+                f.write("FizzBuzz kata\n")
+        with pytest.raises(ValueError, match="fizz_buzz"):
+            load_katas(kata_dir)
+        jsonl = os.path.join(tmp, "katas.jsonl")
+        with open(jsonl, "w") as f:
+            f.write(json.dumps({"id": "primes", "kata": "Prime check"}) + "\n")
+            f.write(json.dumps({"id": "primes", "kata": "Prime factors"}) + "\n")
+        with pytest.raises(ValueError, match="primes"):
+            load_katas(jsonl)
+
+
+def test_summarize_counts_aborts_and_errors():
+    results = [
+        {"kata_id": "a", "cycles": 3, "aborted": False, "error": ""},
+        {"kata_id": "b", "cycles": 1, "aborted": True, "error": ""},
+        {"kata_id": "c", "cycles": 0, "aborted": False, "error": "boom"},
+        {"kata_id": "d", "cycles": 2, "aborted": False, "error": ""},
+    ]
+    summary = summarize(results, 2.0)
+    assert summary["cycles"] == 6
+    assert summary["failure_rate"] == 0.5
+    assert summary["katas_per_min"] == 120.0
+    assert summary["cycles_per_sec"] == 3.0
+
+
+def test_run_batch_persists_per_kata(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("LLM_PROVIDER", "none")
+    with tempfile.TemporaryDirectory() as tmp:
+        katas = os.path.join(tmp, "katas.jsonl")
+        with open(katas, "w") as f:
+            f.write(json.dumps({"id": "one", "kata": "Return zero"}) + "\n")
+            f.write(json.dumps({"id": "two", "kata": "Sum numbers"}) + "\n")
+        out = os.path.join(tmp, "out")
+        proc = subprocess.run(
+            [sys.executable, "-m", "tdd_agents.cli", "batch", "--katas", katas,
+             "--out-dir", out, "--workers", "2", "--cycles", "1"],
+            capture_output=True, text=True,
+        )
+        assert proc.returncode == 0, proc.stderr
+        assert "katas/min" in proc.stdout.splitlines()[-1]
+        for kata_id in ("one", "two"):
+            assert os.path.isfile(os.path.join(out, kata_id, "code", "main.py"))
+            assert os.path.isfile(os.path.join(out, kata_id, "tests", "generated_tests.py"))
+            with open(os.path.join(out, kata_id, "state.json")) as f:
+                assert len(json.load(f)["tdd_history"]) == 1
+        with open(os.path.join(out, "batch_summary.json")) as f:
+            summary = json.load(f)
+        assert summary["katas"] == 2 and [r["kata_id"] for r in summary["results"]] == ["one", "two"]
@@ -0,0 +1,64 @@
+import asyncio
+import json
+import subprocess
+import sys
+
+from tdd_agents.events import EVENT_TYPES
+from tdd_agents.orchestrator import arun_n_cycles, run_n_cycles
+
+
+class Scripted:
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return "def test_add():\n    assert add(2, 2) == 4\n"
+        if prompt.startswith("You are an implementation agent"):
+            return "def add(a, b):\n    return a + b\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_events_follow_phase_order_with_deltas_only():
+    events = []
+    run_n_cycles("python", "add numbers", max_cycles=1, llm=Scripted(), on_event=events.append)
+    kinds = [e["event"] for e in events]
+    assert kinds == [
+        "tester_proposed",
+        "impl_attempt",
+        "test_run",
+        "refactor_attempt",
+        "test_run",
+        "supervisor_decision",
+        "cycle_complete",
+        "run_complete",
+    ]
+    assert set(kinds) <= set(EVENT_TYPES)
+    assert all(e["cycle"] == 1 and "tdd_history" not in e for e in events)
+    impl = events[1]
+    assert impl["code"] == "def add(a, b):\n    return a + b\n" and impl["attempt"] == 1
+    assert events[2]["phase"] == "implementer" and events[2]["passed"] is True
+    assert "+def add" in events[6]["diff"]
+    assert events[-1]["cycles"] == 1
+
+
+def test_async_on_event_is_awaited():
+    seen = []
+
+    async def on_event(event):
+        await asyncio.sleep(0)
+        seen.append(event["event"])
+
+    asyncio.run(arun_n_cycles("python", "Kata", max_cycles=1, on_event=on_event))
+    assert seen[0] == "tester_proposed" and seen[-1] == "run_complete"
+
+
+def test_cli_jsonl_output_streams_events(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "none")
+    proc = subprocess.run(
+        [sys.executable, "-m", "tdd_agents.cli", "run", "--language", "python",
+         "--kata", "Return zero", "--cycles", "2", "--output", "jsonl", "--stream"],
+        capture_output=True, text=True, check=True,
+    )
+    events = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert events[0]["event"] == "tester_proposed"
+    assert events[-1]["event"] == "run_complete"
+    assert "Completed at" in proc.stderr
+    assert "[cycle 1] status=" in proc.stderr
@@ -0,0 +1,59 @@
+import os
+
+import tdd_agents.runtime_validation as rv
+from tdd_agents.fastpath import is_simple_suite, run_fast
+from tdd_agents.result_cache import reset_default_cache
+
+IMPL = "def add(a, b):\n    return a + b\n"
+
+
+def test_simple_suite_detection():
+    assert is_simple_suite(IMPL, "def test_add():\n    assert add(1, 2) == 3\n")
+    assert not is_simple_suite(IMPL, "def test_add(tmp_path):\n    assert add(1, 2) == 3\n")
+    assert not is_simple_suite(IMPL, "import pytest\n\ndef test_add():\n    assert add(1, 2) == 3\n")
+    assert not is_simple_suite(
+        IMPL, "@pytest.mark.skip\ndef test_add():\n    assert add(1, 2) == 3\n"
+    )
+    assert not is_simple_suite(IMPL, "class TestAdd:\n    def test_a(self):\n        pass\n")
+
+
+def test_run_fast_pass_fail_and_collection_error():
+    passed, details = run_fast(IMPL, "def test_add():\n    assert add(1, 2) == 3\n")
+    assert passed and "1 passed" in details
+    passed, details = run_fast(
+        IMPL, "def test_ok():\n    assert add(0, 0) == 0\n\ndef test_bad():\n    assert add(1, 1) == 3, 'nope'\n"
+    )
+    assert not passed
+    assert "FAILED tests/test_generated.py::test_bad - AssertionError: nope" in details
+    assert "1 failed, 1 passed" in details
+    passed, details = run_fast("raise ValueError('boom')\n", "def test_x():\n    assert True\n")
+    assert not passed and "ValueError: boom" in details
+
+
+def test_run_fast_timeout_and_fallback():
+    hang = "def spin():\n    while True:\n        pass\n"
+    assert run_fast(hang, "def test_spin():\n    spin()\n", timeout_sec=1) == (
+        False,
+        "Test execution timeout",
+    )
+    assert run_fast(IMPL, "def test_add(capsys):\n    assert add(1, 2) == 3\n") is None
+
+
+def test_fast_runner_falls_back_to_pytest(monkeypatch):
+    reset_default_cache()
+    monkeypatch.setenv("TDD_AGENTS_TEST_RUNNER", "fast")
+    calls = []
+    monkeypatch.setattr(rv, "_run_subprocess", lambda *a: calls.append(a) or (True, "ok"))
+    assert rv.run_tests(IMPL, "def test_add():\n    assert add(2, 2) == 4\n")[0]
+    assert calls == []
+    assert rv.run_tests(IMPL, "def test_add(tmp_path):\n    assert add(2, 2) == 4\n") == (True, "ok")
+    assert len(calls) == 1
+    reset_default_cache()
+
+
+def test_fast_path_never_forks_the_calling_process(monkeypatch):
+    def no_fork():
+        raise AssertionError("forked the multi-threaded caller")
+
+    monkeypatch.setattr(os, "fork", no_fork)
+    assert run_fast(IMPL, "def test_add():\n    assert add(1, 2) == 3\n")[0]
@@ -0,0 +1,43 @@
+from tdd_agents.agents.supervisor import _is_cycle_equal
+from tdd_agents.fingerprint import code_fingerprint, same_behavior
+from tdd_agents.orchestrator import run_n_cycles
+
+IMPL = "def add(a, b):\n    return a + b\n"
+COSMETIC = "# adds numbers\ndef add(a,b):\n\n    return (a + b)  # sum\n"
+
+
+class CosmeticRefactor:
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return "def test_add():\n    assert add(2, 2) == 4\n"
+        if prompt.startswith("You are an implementation agent"):
+            return IMPL
+        if prompt.startswith("You are a refactoring assistant"):
+            return COSMETIC
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_fingerprint_ignores_formatting_and_comments():
+    assert code_fingerprint(IMPL) == code_fingerprint(COSMETIC)
+    assert not same_behavior(IMPL, IMPL.replace("+", "-"))
+    assert same_behavior("def broken(:", "def broken(:  \n")  # text fallback
+    assert not same_behavior("def broken(:", "def other(:")
+
+
+def test_stagnation_compares_fingerprints():
+    cycle = lambda code: {
+        "tester_output": {"test_code": "assert add(1, 1) == 2"},
+        "implementer_output": {"updated_code": code},
+        "refactorer_output": {"refactored_code": code},
+    }
+    assert _is_cycle_equal(cycle(IMPL), cycle(COSMETIC))
+    assert not _is_cycle_equal(cycle(IMPL), cycle(IMPL.replace("+", "*")))
+
+
+def test_cosmetic_refactor_skips_test_run_and_diff():
+    result = run_n_cycles("python", "add numbers", max_cycles=1, llm=CosmeticRefactor())
+    names = [(s["phase"], s["name"]) for s in result["metrics"]["spans"]]
+    assert ("refactorer", "act") in names
+    assert ("refactorer", "run_tests") not in names
+    assert result["final_code"] == COSMETIC
+    assert len(result["code_diffs"]) == 1  # the implementation; refactor adds none
@@ -0,0 +1,45 @@
+import json
+import os
+
+from tdd_agents.history import SpillableList
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.state import TDDCycle, append_cycle, initial_state
+
+
+def test_spillable_list_keeps_tail_in_memory(tmp_path, monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_HISTORY_DIR", str(tmp_path))
+    items = SpillableList(2)
+    for i in range(5):
+        items.append({"n": i})
+    assert len(items) == 5 and items.spilled == 3
+    assert len(items._recent) == 2
+    assert items[0] == {"n": 0} and items[-1] == {"n": 4}
+    assert [x["n"] for x in items] == [0, 1, 2, 3, 4]
+    segment = items._segment.path
+    assert os.path.dirname(segment) == str(tmp_path)
+    items.close()
+    assert not os.path.exists(segment)
+
+
+def test_state_with_retention_round_trips(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_HISTORY_RETAIN", "1")
+    state = initial_state("python", "kata")
+    for i in range(1, 4):
+        append_cycle(state, TDDCycle(cycle_number=i))
+        state.code_diffs.append(f"diff-{i}")
+    view = state.view()
+    assert view["tdd_history"][0]["cycle_number"] == 1  # read back from disk
+    assert view["code_diffs"][-1] == "diff-3"
+    out = state.to_dict()
+    assert [c["cycle_number"] for c in out["tdd_history"]] == [1, 2, 3]
+    assert out["code_diffs"] == ["diff-1", "diff-2", "diff-3"]
+    json.dumps(out)
+
+
+def test_run_n_cycles_with_retention_matches_unbounded(monkeypatch):
+    monkeypatch.delenv("TDD_AGENTS_HISTORY_RETAIN", raising=False)
+    full = run_n_cycles("python", "Kata", max_cycles=4)
+    monkeypatch.setenv("TDD_AGENTS_HISTORY_RETAIN", "1")
+    bounded = run_n_cycles("python", "Kata", max_cycles=4)
+    assert bounded["tdd_history"] == full["tdd_history"]
+    assert bounded["code_diffs"] == full["code_diffs"]
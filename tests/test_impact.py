@@ -0,0 +1,78 @@
+from tdd_agents.impact import affected_names, impacted_tests
+from tdd_agents.orchestrator import run_n_cycles
+
+BASE = "def _sign(x):\n    return x\n\ndef add(a, b):\n    return a + b\n\ndef mul(a, b):\n    return _sign(a) * b\n"
+SUITE = (
+    "import math\n\n"
+    "def test_add():\n    assert add(1, 2) == 3\n\n"
+    "def test_mul():\n    assert mul(2, 3) == 6\n\n"
+    "class TestBoth:\n    def test_both(self):\n        assert add(1, 1) == mul(1, 2)\n"
+)
+
+
+def test_changes_propagate_to_referring_definitions():
+    changed = BASE.replace("return x", "return +x")
+    assert affected_names(BASE, changed) == {"_sign", "mul"}
+    assert affected_names(BASE, BASE.replace("a + b", "b + a")) == {"add"}
+    assert affected_names(BASE, BASE) == set()
+
+
+def test_module_level_bindings_join_the_closure():
+    aliased = BASE + "\nstep = _sign\n"
+    assert affected_names(aliased, aliased.replace("return x", "return +x")) == {"_sign", "mul", "step"}
+    suite = SUITE + "\ndef test_step():\n    assert step(1) == 1\n"
+    sel = impacted_tests(aliased, aliased.replace("return x", "return +x"), suite)
+    assert "test_step" in sel.suite and "test_add()" not in sel.suite
+    registered = BASE + "\nprint(_sign(1))\n"
+    assert affected_names(registered, registered.replace("return x", "return +x")) is None
+
+
+def test_unsafe_changes_fall_back_to_full_suite():
+    assert affected_names(BASE, "import os\n" + BASE) is None
+    assert affected_names(BASE, "def add(:\n") is None
+    assert impacted_tests(BASE, BASE.replace("* b", "* +b"), "def helper():\n    return mul(1, 1)\n\n" + SUITE) is None
+
+
+def test_selects_only_tests_reaching_changed_code():
+    sel = impacted_tests(BASE, BASE.replace("return x", "return +x"), SUITE)
+    assert (sel.selected, sel.total) == (2, 3)
+    assert sel.suite.startswith("import math") and "test_add()" not in sel.suite
+    assert "test_mul()" in sel.suite and "test_both" in sel.suite
+    untouched = impacted_tests(BASE, BASE + "\n\ndef unused():\n    return 0\n", SUITE)
+    assert (untouched.suite, untouched.selected) == ("", 0)
+    assert impacted_tests(BASE, BASE.replace("a + b", "b + a").replace("* b", "* +b"), SUITE) is None
+
+
+class Scripted:
+    def __init__(self) -> None:
+        self.tests = iter(["def test_add():\n    assert add(2, 2) == 4\n", "def test_mul():\n    assert add(mul(2, 3), 0) == 6\n"])
+
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return next(self.tests, "[NULL_LLM_OUTPUT]")
+        impl = "def add(a, b):\n    return a + b\n\ndef mul(a, b):\n    return a * b\n"
+        if prompt.startswith("You are an implementation agent"):
+            return impl
+        if prompt.startswith("You are a refactoring assistant"):
+            return impl.replace("a * b", "b * a")
+        return "[NULL_LLM_OUTPUT]"
+
+
+def _refactor_scopes(monkeypatch, every: str):
+    monkeypatch.setenv("TDD_AGENTS_FULL_SUITE_EVERY", every)
+    result = run_n_cycles("python", "add and multiply", max_cycles=2, llm=Scripted())
+    assert not result["aborted"]
+    spans = result["metrics"]["spans"]
+    return [(s["cycle"], s["attrs"]["scope"]) for s in spans if s["name"] == "run_tests" and s["phase"] == "refactorer"]
+
+
+def test_refactorer_runs_impacted_tests_then_full_suite(monkeypatch):
+    assert (2, "impacted") in _refactor_scopes(monkeypatch, "1")
+    assert (2, "full") in _refactor_scopes(monkeypatch, "1")
+    assert (2, "impacted") not in _refactor_scopes(monkeypatch, "0")
+
+
+def test_full_suite_runs_once_per_cadence_cycle(monkeypatch):
+    scopes = _refactor_scopes(monkeypatch, "2")
+    assert scopes.count((2, "full")) == 1
+    assert (1, "full") not in scopes
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import tempfile
+
+import tdd_agents.llm as llm_mod
+from tdd_agents.llm_cache import CachingLLM, SQLiteResponseStore, invalidate, served_responses
+from tdd_agents.orchestrator import run_n_cycles
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        return f"reply-{self.calls}:{prompt}"
+
+
+def test_repeated_prompt_served_from_store():
+    with tempfile.TemporaryDirectory() as tmp:
+        inner = CountingLLM()
+        client = CachingLLM(inner, SQLiteResponseStore(os.path.join(tmp, "c.sqlite")), "openai", "m")
+        first = client.generate("same prompt")
+        assert client.generate("same prompt") == first
+        assert asyncio.run(client.agenerate("same prompt")) == first
+        assert inner.calls == 1 and client.hits == 2 and client.misses == 1
+        # a different model must not share entries
+        other = CachingLLM(inner, client.store, "openai", "other-model")
+        assert other.generate("same prompt") != first
+
+
+def test_sampled_generations_bypass_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        inner = CountingLLM()
+        store = SQLiteResponseStore(os.path.join(tmp, "c.sqlite"))
+        client = CachingLLM(inner, store, "openai", "m", temperature=0.7)
+        client.generate("p")
+        client.generate("p")
+        assert inner.calls == 2 and len(store) == 0
+
+
+def test_invalidated_reply_is_not_replayed():
+    with tempfile.TemporaryDirectory() as tmp:
+        inner = CountingLLM()
+        client = CachingLLM(inner, SQLiteResponseStore(os.path.join(tmp, "c.sqlite")), "openai", "m")
+        with served_responses() as served:
+            rejected = client.generate("p")
+        invalidate(served)
+        assert client.generate("p") != rejected and inner.calls == 2
+        assert client.generate("p") == "reply-2:p"
+
+
+class FlakyTester:
+    """First tester reply has a syntax error; later ones are valid."""
+
+    def __init__(self):
+        self.tester_calls = 0
+
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            self.tester_calls += 1
+            head = "def test_add(:" if self.tester_calls == 1 else "def test_add():"
+            return head + "\n    assert add(1, 1) == 2\n"
+        if prompt.startswith("You are an implementation agent"):
+            return "def add(a, b):\n    return a + b\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_rejected_tester_reply_is_retried_upstream():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteResponseStore(os.path.join(tmp, "c.sqlite"))
+        inner = FlakyTester()
+        result = run_n_cycles("python", "add numbers", max_cycles=1, llm=CachingLLM(inner, store, "openai", "m"))
+        assert not result["aborted"] and inner.tester_calls == 2
+        again = run_n_cycles("python", "add numbers", max_cycles=1, llm=CachingLLM(inner, store, "openai", "m"))
+        assert not again["aborted"] and inner.tester_calls == 2  # valid reply now served from the store
+
+
+def test_ttl_and_max_entries_eviction(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteResponseStore(os.path.join(tmp, "c.sqlite"), max_entries=2, ttl_sec=60)
+        clock = [1000.0]
+        monkeypatch.setattr("tdd_agents.llm_cache.time.time", lambda: clock[0])
+        store.put("a", "A")
+        clock[0] += 1
+        store.put("b", "B")
+        clock[0] += 1
+        assert store.get("a") == "A"  # refresh a
+        clock[0] += 1
+        store.put("c", "C")
+        assert len(store) == 2 and store.get("b") is None
+        clock[0] += 120
+        assert store.get("a") is None
+
+
+def test_build_llm_wraps_live_client(monkeypatch):
+    class FakeOpenAI:
+        def __init__(self, model, api_key=None, base_url=None):
+            self.model, self.temperature = model, 0.0
+
+        def generate(self, prompt):
+            return "live"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "llm.sqlite")
+        monkeypatch.delenv("PYTEST_RUNNING", raising=False)
+        monkeypatch.setenv("LLM_PROVIDER", "openai")
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("TDD_AGENTS_LLM_CACHE", path)
+        monkeypatch.setattr(llm_mod, "OpenAIClient", FakeOpenAI)
+        client, info = llm_mod.build_llm()
+        assert isinstance(client, CachingLLM)
+        assert info["cache"] == path and info["mode"] == "live"
+        assert client.generate("x") == "live"
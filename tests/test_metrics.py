@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from tdd_agents.metrics import MetricsRecorder, TimedLLM
+from tdd_agents.orchestrator import run_n_cycles
+
+
+class Scripted:
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return "def test_add():\n    assert add(2, 2) == 4\n"
+        if prompt.startswith("You are an implementation agent"):
+            return "def add(a, b):\n    return a + b\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_span_records_attempt_outcome_and_errors():
+    rec = MetricsRecorder()
+    rec.cycle = 2
+    with rec.span("implementer", "act", 3):
+        pass
+    with rec.span("implementer", "run_tests") as span:
+        span.outcome = "failed"
+    with pytest.raises(ValueError):
+        with rec.span("tester", "act", 1):
+            raise ValueError("boom")
+    act, run, err = rec.spans
+    assert (act.cycle, act.attempt, act.outcome) == (2, 3, "ok")
+    assert (run.attempt, run.outcome) == (3, "failed")  # inherits phase attempt
+    assert err.outcome == "error"
+    assert rec.summary()["implementer.act"]["count"] == 1
+
+
+def test_timed_llm_spans_generate_per_role():
+    rec = MetricsRecorder()
+    llm = TimedLLM(Scripted(), rec).for_role("implementer")
+    asyncio.run(llm.agenerate("You are an implementation agent"))
+    assert [(s.phase, s.name) for s in rec.spans] == [("implementer", "llm.generate")]
+
+
+def test_run_n_cycles_exposes_metrics_to_state_and_on_cycle():
+    seen = []
+    result = run_n_cycles(
+        "python", "add numbers", max_cycles=1, llm=Scripted(),
+        on_cycle=lambda state, n: seen.append(state["metrics"]),
+    )
+    names = {(s["phase"], s["name"]) for s in result["metrics"]["spans"]}
+    for expected in [
+        ("tester", "act"),
+        ("tester", "llm.generate"),
+        ("tester", "compile_snippet"),
+        ("implementer", "run_tests"),
+        ("refactorer", "act"),
+        ("supervisor", "act"),
+        ("cycle", "diff"),
+        ("persist", "on_cycle"),
+    ]:
+        assert expected in names
+    runs = [s for s in result["metrics"]["spans"] if s["name"] == "run_tests"]
+    assert all(s["outcome"] == "passed" and s["duration_ms"] >= 0 for s in runs)
+    assert seen and seen[0]["summary"]["implementer.act"]["count"] == 1
@@ -0,0 +1,149 @@
+import json
+
+import tdd_agents.suite as suite_mod
+from tdd_agents.cli import main
+from tdd_agents.minimize import collect_coverage, dormant_tests, redundant_tests
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.suite import SnippetStore
+
+IMPL = "def sign(x):\n    if x < 0:\n        return -1\n    return 1\n"
+SNIPPETS = [
+    "import pytest",
+    "def test_positive():\n    assert sign(2) == 1",
+    "def test_other_positive():\n    assert sign(7) == 1",
+    "def test_negative():\n    assert sign(-2) == -1",
+    "class TestBoth:\n    def test_both(self):\n        assert sign(-1) + sign(1) == 0",
+    "def test_fixture(tmp_path):\n    assert sign(1) == 1",
+    "def test_failing():\n    assert sign(3) == 0",
+    "def test_no_impl():\n    assert True",
+]
+
+
+def test_redundant_tests_keeps_first_cover():
+    a, b = frozenset({(1, 2)}), frozenset({(2, 3)})
+    assert redundant_tests("abcde", [a, None, b, a | b, frozenset()]) == ["d"]
+
+
+def test_coverage_per_snippet():
+    coverage = collect_coverage(IMPL, SNIPPETS, timeout_sec=30)
+    assert coverage is not None and len(coverage) == len(SNIPPETS)
+    assert coverage[0] is None and coverage[5] is None and coverage[6] is None
+    assert coverage[1] == coverage[2] and coverage[1] != coverage[3]
+    assert coverage[7] == frozenset()
+    assert dormant_tests(IMPL, SNIPPETS, 30) == [SNIPPETS[2], SNIPPETS[4]]
+
+
+def test_store_renders_active_suite():
+    store = SnippetStore(SNIPPETS[:4])
+    active = store.render_active([SNIPPETS[2] + "  # comment"])
+    assert "test_other_positive" not in active and "test_negative" in active
+    assert store.with_snippet(SNIPPETS[4], [SNIPPETS[2]]).endswith("sign(1) == 0")
+    assert store.render_active() == store.render()
+
+
+def test_render_active_fingerprints_each_snippet_once(monkeypatch):
+    calls = []
+    fingerprint = suite_mod.code_fingerprint
+    monkeypatch.setattr(suite_mod, "code_fingerprint", lambda code: calls.append(code) or fingerprint(code))
+    store = SnippetStore(SNIPPETS[:4])
+    assert len(calls) == 4
+    dormant = [SNIPPETS[2]]
+    first = store.render_active(dormant)
+    assert store.render_active(list(dormant)) is first and len(calls) == 5
+    store.add(SNIPPETS[4])
+    assert "sign(1) == 0" in store.render_active(dormant) and len(calls) == 7
+
+
+def test_cli_minimize_writes_dormant_json(tmp_path, capsys):
+    (tmp_path / "code").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "code" / "main.py").write_text(IMPL)
+    (tmp_path / "tests" / "generated_tests.py").write_text("\n\n".join(SNIPPETS[:4]))
+    main(["minimize", "--out-dir", str(tmp_path)])
+    assert json.loads(capsys.readouterr().out) == {"snippets": 4, "dormant": 1, "active": 3}
+    assert json.loads((tmp_path / "tests" / "dormant.json").read_text()) == [SNIPPETS[2]]
+
+
+class Scripted:
+    def __init__(self) -> None:
+        self.tests = iter(["def test_add():\n    assert add(2, 2) == 4\n", "def test_add_again():\n    assert add(3, 3) == 6\n"])
+
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return next(self.tests, "[NULL_LLM_OUTPUT]")
+        if prompt.startswith("You are an implementation agent"):
+            return "def add(a, b):\n    return a + b\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_minimize_between_cycles(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_MINIMIZE_EVERY", "1")
+    result = run_n_cycles("python", "add numbers", max_cycles=2, llm=Scripted())
+    assert not result["aborted"]
+    assert result["dormant_tests"] == ["def test_add_again():\n    assert add(3, 3) == 6"]
+    assert "test_add_again" in result["full_test_suite"]
+    assert any(s["name"] == "minimize" for s in result["metrics"]["spans"])
+
+
+class RegressingScripted(Scripted):
+    """Third cycle's implementation breaks only the (dormant) second test."""
+
+    def __init__(self) -> None:
+        self.tests = iter([
+            "def test_add():\n    assert add(2, 2) == 4\n",
+            "def test_add_again():\n    assert add(3, 3) == 6\n",
+            "def test_add_zero():\n    assert add(0, 5) == 5\n",
+        ])
+        self.cycle = 0
+
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            self.cycle += 1
+        if prompt.startswith("You are an implementation agent") and self.cycle == 3:
+            return "def add(a, b):\n    if a == 3:\n        return 0\n    return a + b\n"
+        return super().generate(prompt)
+
+
+def test_regression_caught_only_by_dormant_test_fails_cycle(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_MINIMIZE_EVERY", "1")
+    result = run_n_cycles("python", "add numbers", max_cycles=3, llm=RegressingScripted())
+    assert result["dormant_tests"] == ["def test_add_again():\n    assert add(3, 3) == 6"]
+    assert result["aborted"] and result["abort_reason"] == "full_suite_failed"
+    assert len(result["tdd_history"]) == 2
+
+
+class RegressingRefactor(RegressingScripted):
+    """Third cycle's refactor breaks the dormant test; `fixed_after` attempts it recovers."""
+
+    def __init__(self, fixed_after: int) -> None:
+        super().__init__()
+        self.fixed_after = fixed_after
+        self.refactor_prompts = []
+
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are an implementation agent"):
+            return "def add(a, b):\n    return a + b\n"
+        if prompt.startswith("You are a refactoring assistant") and self.cycle == 3:
+            self.refactor_prompts.append(prompt)
+            if len(self.refactor_prompts) <= self.fixed_after:
+                return "def add(a, b):\n    if a == 3:\n        return 0\n    return b + a\n"
+            return "def add(a, b):\n    return b + a\n"
+        return super().generate(prompt)
+
+
+def test_refactor_missing_dormant_test_is_retried(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_MINIMIZE_EVERY", "1")
+    llm = RegressingRefactor(fixed_after=1)
+    result = run_n_cycles("python", "add numbers", max_cycles=3, llm=llm)
+    assert not result["aborted"] and len(result["tdd_history"]) == 3
+    assert len(llm.refactor_prompts) == 2 and "test_add_again" in llm.refactor_prompts[1]
+    assert result["final_code"] == "def add(a, b):\n    return b + a\n"
+
+
+def test_refactor_that_keeps_failing_full_suite_is_reverted(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_MINIMIZE_EVERY", "1")
+    result = run_n_cycles("python", "add numbers", max_cycles=3, llm=RegressingRefactor(fixed_after=99))
+    assert not result["aborted"] and len(result["tdd_history"]) == 3
+    assert result["final_code"] == "def add(a, b):\n    return a + b\n"
+    assert result["tdd_history"][-1]["refactorer_output"]["refactor_notes"].startswith("Reverted")
+
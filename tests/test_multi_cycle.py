@@ -13,3 +13,17 @@ def test_run_n_cycles_structure(monkeypatch):
     # Final code and test suite updated from last cycle outputs
     assert isinstance(result["final_code"], str)
     assert isinstance(result["full_test_suite"], str)
+
+
+def test_run_n_cycles_accepts_injected_llm():
+    class Scripted:
+        def generate(self, prompt: str) -> str:
+            if prompt.startswith("You are a TDD test author"):
+                return "def test_add():\n    assert add(2, 2) == 4\n"
+            if prompt.startswith("You are an implementation agent"):
+                return "def add(a, b):\n    return a + b\n"
+            return "[NULL_LLM_OUTPUT]"
+
+    result = run_n_cycles("python", "add numbers", max_cycles=1, llm=Scripted())
+    assert result["final_code"] == "def add(a, b):\n    return a + b\n"
+    assert any("provider': 'injected'" in e["message"] for e in result["system_log"])
@@ -0,0 +1,67 @@
+from tdd_agents import runtime_validation as rv
+from tdd_agents.fastpath import run_fast_report
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.reports import SuiteReport, coerce, from_output
+from tdd_agents.result_cache import reset_default_cache
+
+IMPL = "def add(a, b):\n    return a + b\n"
+SUITE = (
+    "def test_ok():\n    assert add(1, 1) == 2\n\n"
+    "def test_bad():\n    assert add(1, 2) == 4\n\n"
+    "def test_boom():\n    assert 1 / 0\n"
+)
+
+
+def test_subprocess_runner_reports_per_test_outcomes(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_TEST_RUNNER", "subprocess")
+    monkeypatch.setenv("TDD_AGENTS_TEST_CACHE", "0")
+    report = rv.run_tests_report(IMPL, SUITE)
+    assert not report.passed and report.outcome == "failed"
+    by_name = {c.name: c for c in report.cases}
+    assert by_name["test_ok"].outcome == "passed"
+    assert by_name["test_bad"].message == "AssertionError: assert 3 == 4"
+    assert by_name["test_boom"].message == "ZeroDivisionError: division by zero"
+    assert report.signature == (
+        "test_bad: AssertionError: assert 3 == 4; test_boom: ZeroDivisionError: division by zero"
+    )
+    assert report.summary.startswith("2 failed, 1 passed")
+    assert rv.run_tests(IMPL, SUITE)[0] is False
+
+
+def test_collection_error_and_fast_path_signatures():
+    syntax = rv._run_subprocess(IMPL, "def test_x(:\n    pass\n", 5)
+    assert syntax.outcome == "error" and "SyntaxError" in syntax.signature
+    fast = run_fast_report(IMPL, SUITE)
+    assert fast is not None
+    assert {c.name for c in fast.failures} == {"test_bad", "test_boom"}
+    assert "test_boom: ZeroDivisionError: division by zero" in fast.signature
+
+
+def test_legacy_results_coerce_and_round_trip():
+    legacy = coerce((False, "F\nFAILED tests/test_generated.py::test_a - AssertionError: x\n1 failed"))
+    assert legacy.signature == "test_a: AssertionError: x"
+    assert from_output(False, "Test execution timeout").signature == "timeout"
+    assert SuiteReport.from_json(legacy.to_json()) == legacy
+
+
+def test_retry_prompt_includes_previous_failures(monkeypatch):
+    reset_default_cache()
+    prompts = []
+
+    class FlakyImplementer:
+        def generate(self, prompt: str) -> str:
+            if prompt.startswith("You are a TDD test author"):
+                return "def test_add():\n    assert add(2, 2) == 4\n"
+            if prompt.startswith("You are an implementation agent"):
+                prompts.append(prompt)
+                body = "a - b" if len(prompts) == 1 else "a + b"
+                return f"def add(a, b):\n    return {body}\n"
+            return "[NULL_LLM_OUTPUT]"
+
+    result = run_n_cycles("python", "add", max_cycles=1, llm=FlakyImplementer())
+    assert not result["aborted"]
+    assert "Previous attempt failed" not in prompts[0]
+    assert "- test_add: AssertionError" in prompts[1]
+    messages = [e["message"] for e in result["system_log"]]
+    assert any("attempt 1: test_add: AssertionError" in m for m in messages)
+    reset_default_cache()
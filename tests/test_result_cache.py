@@ -0,0 +1,89 @@
+import os
+import tempfile
+
+import tdd_agents.runtime_validation as rv
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.reports import SuiteReport, resource_report, timeout_report
+from tdd_agents.result_cache import ResultCache, cache_key, is_cacheable, reset_default_cache
+
+
+def test_cache_key_normalizes_line_endings_only():
+    base = cache_key("def f():\n    return 1\n", "def test_f(): assert f() == 1", "subprocess")
+    crlf = cache_key("def f():\r\n    return 1\r\n", "def test_f(): assert f() == 1", "subprocess")
+    other = cache_key("def f():\n    return 2\n", "def test_f(): assert f() == 1", "subprocess")
+    assert base == crlf
+    assert base != other
+    # trailing whitespace inside a string literal changes behavior
+    suite = 'def test_f(): assert f() == "x\\ny"'
+    assert cache_key('def f(): return """x  \ny"""', suite, "subprocess") != cache_key(
+        'def f(): return """x\ny"""', suite, "subprocess"
+    )
+    assert base != cache_key("def f():\n    return 1\n", "def test_f(): assert f() == 1", "pool")
+
+
+def test_memory_lru_evicts_oldest():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", (True, "a"))
+    cache.put("b", (True, "b"))
+    assert cache.get("a") == (True, "a")  # a becomes most recent
+    cache.put("c", (False, "c"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats() == {"hits": 3, "misses": 1}
+
+
+def test_disk_layer_survives_new_instance_and_evicts_by_size():
+    with tempfile.TemporaryDirectory() as tmp:
+        ResultCache(disk_dir=tmp).put("k1" * 8, (True, "ok"))
+        fresh = ResultCache(disk_dir=tmp)
+        assert fresh.get("k1" * 8) == (True, "ok")
+        small = ResultCache(disk_dir=tmp, max_disk_bytes=200)
+        for i in range(20):
+            small.put(f"{i:02d}" * 8, (False, "x" * 40))
+        total = sum(
+            os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(tmp) for f in files
+        )
+        assert total <= 200
+
+
+def test_run_tests_hit_skips_subprocess(monkeypatch):
+    reset_default_cache()
+    monkeypatch.setenv("TDD_AGENTS_TEST_RUNNER", "subprocess")
+    calls = []
+
+    def fake_run(impl_code, test_suite, timeout_sec):
+        calls.append(impl_code)
+        return True, "1 passed"
+
+    monkeypatch.setattr(rv, "_run_subprocess", fake_run)
+    assert rv.run_tests("X = 1\n", "def test_x(): assert X == 1") == (True, "1 passed")
+    assert rv.run_tests("X = 1\r\n", "def test_x(): assert X == 1") == (True, "1 passed")
+    assert len(calls) == 1
+    reset_default_cache()
+
+
+def test_cache_counters_logged(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("LLM_PROVIDER", "none")
+    result = run_n_cycles("python", "Kata", max_cycles=2)
+    messages = [e["message"] for e in result["system_log"]]
+    assert any(m.startswith("Test result cache hits=") for m in messages)
+
+
+def test_cacheability_follows_report_outcome():
+    assert is_cacheable(SuiteReport(False, "failed", details="Resource limit exceeded in a message"))
+    assert is_cacheable(SuiteReport(True, "passed").to_json())
+    assert not is_cacheable(timeout_report(1.0))
+    assert not is_cacheable(resource_report("cpu", (), 1.0, ""))
+    assert not is_cacheable(SuiteReport(False, "error", details="Worker error: boom"))
+    assert not is_cacheable((False, "Test execution timeout"))
+    assert is_cacheable((True, "1 passed"))
+
+
+def test_cache_never_turns_a_red_run_green(monkeypatch):
+    reset_default_cache()
+    monkeypatch.setenv("TDD_AGENTS_TEST_RUNNER", "subprocess")
+    suite = 'def test_f():\n    assert f() == "x\\ny"'
+    assert rv.run_tests('def f():\n    return """x\ny"""\n', suite)[0]
+    assert not rv.run_tests('def f():\n    return """x  \ny"""\n', suite)[0]
+    reset_default_cache()
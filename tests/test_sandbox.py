@@ -0,0 +1,69 @@
+import signal
+
+import pytest
+
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.reports import CaseResult, SuiteReport, coerce, from_output, resource_report
+from tdd_agents.runtime_validation import run_tests_report
+from tdd_agents.sandbox import available, classify
+
+pytestmark = pytest.mark.skipif(not available(), reason="needs resource + killpg")
+
+SUITE = "def test_add():\n    assert add(1, 2) == 3\n"
+HOG = "def add(a, b):\n    blob = bytearray(1024 ** 3)\n    return a + b\n"
+
+
+@pytest.fixture
+def sandbox(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_TEST_RUNNER", "sandbox")
+    monkeypatch.setenv("TDD_AGENTS_SANDBOX_MEM_MB", "512")
+
+
+def test_classify_limit_signals_and_errors():
+    failed = SuiteReport(False, "failed", (CaseResult("test_add", "failed", 0, "MemoryError"),))
+    assert classify(1, failed).outcome == "resource"
+    assert classify(-signal.SIGXCPU, SuiteReport(False, "error")).signature.endswith(": cpu")
+    plain = SuiteReport(False, "failed", (CaseResult("test_add", "failed", 0, "AssertionError"),))
+    assert classify(1, plain) is plain
+    emfile = CaseResult("test_add", "error", 0, "OSError: [Errno 24] Too many open files")
+    assert classify(1, SuiteReport(False, "error", (emfile,))).signature.endswith(": open files")
+
+
+def test_classify_ignores_markers_outside_failing_exception_types():
+    mentions = CaseResult("test_add", "failed", 0, "AssertionError: assert 'MemoryError' == ''")
+    failed = SuiteReport(False, "failed", (mentions,), details="MemoryError printed by the test")
+    assert classify(1, failed) is failed
+    noisy = SuiteReport(True, "passed", (CaseResult("test_add", "passed"),), details="Too many open files")
+    assert classify(0, noisy) is noisy
+
+
+def test_sandbox_passes_and_flags_memory_and_cpu(sandbox, monkeypatch):
+    assert run_tests_report("def add(a, b):\n    return a + b\n", SUITE).passed
+    report = run_tests_report(HOG, SUITE)
+    assert (report.outcome, report.signature) == ("resource", "Resource limit exceeded: memory")
+    monkeypatch.setenv("TDD_AGENTS_SANDBOX_CPU", "1")
+    spin = "def add(a, b):\n    while True:\n        pass\n"
+    assert run_tests_report(spin, SUITE, timeout_sec=15).outcome == "resource"
+
+
+class Hog:
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return SUITE
+        if prompt.startswith("You are an implementation agent"):
+            return HOG
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_resource_kill_aborts_without_retrying(sandbox):
+    result = run_n_cycles("python", "add numbers", max_cycles=1, llm=Hog())
+    assert result["abort_reason"] == "implementer_resource_limit"
+    runs = [s for s in result["metrics"]["spans"] if s["name"] == "run_tests"]
+    assert len(runs) == 1
+
+
+def test_legacy_resource_tuples_keep_outcome():
+    report = resource_report("cpu", (), 1.5, "Killed")
+    legacy = coerce(report.as_tuple())
+    assert legacy.outcome == "resource" and legacy.details == report.details
+    assert from_output(False, "Resource limit exceeded: memory").signature == "Resource limit exceeded: memory"
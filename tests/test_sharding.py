@@ -0,0 +1,52 @@
+from tdd_agents.reports import CaseResult, SuiteReport, timeout_report
+from tdd_agents.runtime_validation import MAX_TEST_LINES, run_tests, run_tests_report
+from tdd_agents.sharding import merge_reports, shard_suite
+
+PREAMBLE = "import math\n\ndef _double(x):\n    return 2 * x"
+
+
+def _suite(n: int, failing: int = -1) -> str:
+    tests = [
+        f"def test_add_{i}():\n    assert add({i}, {i}) == {_expected(i, failing)}"
+        for i in range(n)
+    ]
+    return "\n\n".join([PREAMBLE] + tests)
+
+
+def _expected(i: int, failing: int) -> str:
+    return f"_double({i}) + 1" if i == failing else f"_double({i})"
+
+
+def test_shards_are_contiguous_and_carry_preamble():
+    shards = shard_suite(_suite(10), max_lines=6)
+    assert len(shards) == 4
+    assert all(s.startswith(PREAMBLE) for s in shards)
+    assert "test_add_0()" in shards[0] and "test_add_9()" in shards[-1]
+    assert shard_suite(_suite(10), max_lines=1000) == [_suite(10)]
+
+
+def test_unparseable_or_shadowing_suites_are_not_sharded():
+    broken = _suite(10) + "\n\ndef test_bad(:\n    pass"
+    assert shard_suite(broken, max_lines=6) == [broken]
+    shadowed = _suite(10) + "\n\ndef test_add_0():\n    assert True"
+    assert shard_suite(shadowed, max_lines=6) == [shadowed]
+
+
+def test_merge_reports():
+    ok = SuiteReport(True, "passed", (CaseResult("a", "passed"),), 0.5)
+    bad = SuiteReport(False, "failed", (CaseResult("b", "failed", 0, "AssertionError"),), 0.7, "FAILED b")
+    merged = merge_reports([ok, bad])
+    assert (merged.passed, merged.outcome, merged.duration) == (False, "failed", 0.7)
+    assert [c.name for c in merged.cases] == ["a", "b"] and merged.details == "FAILED b"
+    assert merge_reports([ok, timeout_report(5)]).outcome == "timeout"
+
+
+def test_large_suite_runs_sharded_instead_of_failing():
+    impl = "def add(a, b):\n    return a + b\n"
+    suite = _suite(120)
+    assert suite.count("\n") > MAX_TEST_LINES
+    passed, details = run_tests(impl, suite, timeout_sec=30)
+    assert passed, details
+    report = run_tests_report(impl, _suite(120, failing=77), timeout_sec=30)
+    assert not report.passed and len(report.cases) == 120
+    assert [c.name for c in report.failures] == ["test_add_77"]
@@ -0,0 +1,96 @@
+import itertools
+import os
+import tempfile
+import threading
+
+import tdd_agents.speculative as speculative
+from tdd_agents.llm_cache import CachingLLM, SQLiteResponseStore
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.reports import resource_report
+from tdd_agents.speculative import SpeculationResult, speculate
+
+SUITE = "def test_f():\n    assert f() == 2\n"
+
+
+def _producer(codes):
+    it = itertools.cycle(codes)
+    lock = threading.Lock()
+
+    def produce():
+        with lock:
+            code = next(it)
+        return {"updated_code": code}, f"candidate {code.strip()}"
+
+    return produce
+
+
+def test_first_green_candidate_wins():
+    produce = _producer(["def f():\n    return 1\n", "def f():\n    return 2\n"])
+    result = speculate(produce, 2, SUITE)
+    assert result.passed
+    assert result.output["updated_code"] == "def f():\n    return 2\n"
+
+
+def test_all_failing_reports_failure_and_dedups_identical_candidates():
+    produce = _producer(["def f():\n    return 1\n"])
+    result = speculate(produce, 3, SUITE)
+    assert not result.passed
+    assert result.tested == 1
+    assert len(result.messages) >= 1
+    assert result.details
+    assert [c.name for c in result.report.failures] == ["test_f"]
+
+
+def test_orchestrator_speculative_mode(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("LLM_PROVIDER", "none")
+    monkeypatch.setenv("TDD_AGENTS_SPECULATIVE_K", "2")
+    result = run_n_cycles("python", "Kata", max_cycles=1)
+    messages = [e["message"] for e in result["system_log"]]
+    assert any("Implementer speculative candidates=2" in m for m in messages)
+    assert len(result["tdd_history"]) == 1
+
+
+def test_speculative_resource_kill_aborts_immediately(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("LLM_PROVIDER", "none")
+    monkeypatch.setenv("TDD_AGENTS_SPECULATIVE_K", "2")
+    calls = []
+
+    async def fake_aspeculate(produce, k, test_suite, code_key="updated_code", timeout_sec=5):
+        output, msg = await produce()
+        calls.append(timeout_sec)
+        return SpeculationResult(output, [msg], resource_report("cpu", (), 1.0, ""), 1)
+
+    monkeypatch.setattr(speculative, "aspeculate", fake_aspeculate)
+    result = run_n_cycles("python", "Kata", max_cycles=1)
+    assert result["abort_reason"] == "implementer_resource_limit"
+    assert len(calls) == 1
+
+
+class PromptRecorder:
+    def __init__(self):
+        self.impl_prompts = []
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        if prompt.startswith("You are a TDD test author"):
+            return "def test_f():\n    assert f() == 2\n"
+        if prompt.startswith("You are an implementation agent"):
+            self.impl_prompts.append(prompt)
+            return "def f():\n    return 2\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_speculative_candidates_get_distinct_uncached_prompts(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_SPECULATIVE_K", "3")
+    inner = PromptRecorder()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteResponseStore(os.path.join(tmp, "c.sqlite"))
+        result = run_n_cycles("python", "Kata", max_cycles=1, llm=CachingLLM(inner, store, "openai", "m"))
+        cached = len(store)
+    assert not result["aborted"]
+    assert len(inner.impl_prompts) == 3 and len(set(inner.impl_prompts)) == 3
+    assert any("Candidate 3 of 3" in p for p in inner.impl_prompts)
+    assert cached == inner.calls - 3  # only the speculative calls bypass the store
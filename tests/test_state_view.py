@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.state import TDDCycle, append_cycle, initial_state
+
+
+def _state_with_cycles(n):
+    state = initial_state("python", "kata")
+    for i in range(1, n + 1):
+        append_cycle(state, TDDCycle(cycle_number=i))
+    state.code_diffs.append("diff-1")
+    return state
+
+
+def test_view_is_read_only_snapshot():
+    state = _state_with_cycles(2)
+    view = state.view()
+    with pytest.raises(TypeError):
+        view["final_code"] = "x"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        view["tdd_history"][0]["tester_output"]["test_code"] = "x"
+    append_cycle(state, TDDCycle(cycle_number=3))
+    state.final_code = "changed"
+    assert len(view["tdd_history"]) == 2
+    assert view["final_code"] == ""
+    assert view["tdd_history"][-1]["cycle_number"] == 2
+
+
+def test_views_share_frozen_items(monkeypatch):
+    monkeypatch.delenv("TDD_AGENTS_HISTORY_RETAIN", raising=False)
+    state = _state_with_cycles(3)
+    first, second = state.view(), state.view()
+    assert first["tdd_history"][1] is second["tdd_history"][1]
+
+
+def test_view_overrides_and_to_dict_round_trip():
+    state = _state_with_cycles(1)
+    view = state.view(full_test_suite="def test_x():\n    pass\n")
+    assert view["full_test_suite"].startswith("def test_x")
+    assert state.full_test_suite == ""
+    plain = state.view().to_dict()
+    assert plain == state.to_dict()
+    json.dumps(plain)
+
+
+def test_on_cycle_receives_view():
+    seen = []
+    run_n_cycles(
+        "python", "Kata", max_cycles=1,
+        on_cycle=lambda s, n: seen.append((dict(s)["kata_description"], len(s["tdd_history"]))),
+    )
+    assert seen == [("Kata", 1)]
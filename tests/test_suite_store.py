@@ -0,0 +1,43 @@
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.state import initial_state
+from tdd_agents.suite import SnippetStore
+
+SNIPPET = "def test_add():\n    assert add(1, 2) == 3\n"
+
+
+def test_store_rejects_formatting_duplicates_and_renders_lazily():
+    store = SnippetStore()
+    assert store == "" and not store.add("   ")
+    assert store.add(SNIPPET)
+    assert not store.add("def test_add():\n    # same test\n    assert add(1,2) == 3")
+    assert store.with_snippet("def test_sub():\n    assert sub(3, 1) == 2") == (
+        SNIPPET.strip() + "\n\ndef test_sub():\n    assert sub(3, 1) == 2"
+    )
+    assert len(store) == 1  # with_snippet does not store
+    assert store.render() is store.render()
+    assert SnippetStore.parse(store.render() + "\n\n" + SNIPPET).render() == SNIPPET.strip()
+
+
+def test_state_exposes_rendered_suite():
+    state = initial_state("python", "add")
+    state.full_test_suite.add(SNIPPET)
+    assert state.view()["full_test_suite"] == SNIPPET.strip()
+    assert state.to_dict()["full_test_suite"] == SNIPPET.strip()
+
+
+class Reformatting:
+    def __init__(self):
+        self.variants = ["def test_add():\n    assert add(2,2)==4\n", "def test_add():\n    assert add(2, 2) == 4  # again\n"]
+
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return self.variants.pop(0) if len(self.variants) > 1 else self.variants[0]
+        if prompt.startswith("You are an implementation agent"):
+            return "def add(a, b):\n    return a + b\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_near_duplicate_tester_snippets_are_not_accumulated():
+    result = run_n_cycles("python", "add numbers", max_cycles=2, llm=Reformatting())
+    assert len(result["tdd_history"]) == 2
+    assert result["full_test_suite"].count("def test_add") == 1
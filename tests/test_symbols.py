@@ -0,0 +1,46 @@
+from tdd_agents.agents.implementer import _seed_stubs
+from tdd_agents.symbols import index_for, scan_block, split_blocks
+
+SUITE = (
+    "def test_add():\n"
+    "    assert add(1, 2) == 3, 'msg'\n"
+    "\n"
+    "def _helper(x):\n"
+    "\n"
+    "    return x\n"
+    "\n"
+    "def test_neg():\n"
+    "    assert negate(_helper(2)) == -2\n"
+    "    assert 4 == add(2, 2)\n"
+)
+
+
+def test_index_collects_defs_calls_and_expected_literals():
+    index = index_for(SUITE)
+    assert index.calls == {"add", "negate"}  # test_* and local helpers excluded
+    assert {"test_add", "_helper", "test_neg"} <= index.defs
+    assert dict(index.expected) == {"add": "3", "negate": "-2"}
+    assert index.missing({"add", "_helper"}) == {"add"}
+
+
+def test_blocks_split_on_top_level_and_are_scanned_once():
+    blocks = split_blocks(SUITE)
+    assert len(blocks) == 3 and blocks[1].startswith("def _helper")
+    scan_block.cache_clear()
+    index_for.cache_clear()
+    index_for(SUITE)
+    index_for(SUITE + "\n\ndef test_more():\n    assert mul(2, 3) == 6\n")
+    info = scan_block.cache_info()
+    assert (info.misses, info.hits) == (4, 3)  # only the appended block is parsed
+
+
+def test_unparseable_block_falls_back_to_regex():
+    index = index_for("def test_x():\n    assert fizz(3) == 'Fizz'\n    assert (\n")
+    assert index.calls == {"fizz"}
+    assert index.expected["fizz"] == "'Fizz'"
+
+
+def test_seed_stubs_use_index():
+    referenced, stubs = _seed_stubs(SUITE)
+    assert referenced == {"add", "negate"}
+    assert "def negate(*args, **kwargs):\n    return -2\n" in stubs
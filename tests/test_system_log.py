@@ -0,0 +1,40 @@
+import json
+
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.system_log import SystemLog, sink_for
+
+
+def test_ring_buffer_drops_oldest_and_renders_on_read():
+    log = SystemLog(capacity=3)
+    for i in range(5):
+        log.log(f"m{i}", phase="tester")
+    log.append({"timestamp": "ignored", "message": "legacy"})
+    assert len(log) == 3 and log.dropped == 3
+    assert [e["message"] for e in log] == ["m3", "m4", "legacy"]
+    entry = log[0]
+    assert entry["level"] == "info" and entry["phase"] == "tester"
+    assert entry["timestamp"].endswith("+00:00")
+
+
+def test_sink_receives_every_record(tmp_path):
+    path = tmp_path / "log.jsonl"
+    log = SystemLog(capacity=2, sink=sink_for(str(path)))
+    for i in range(4):
+        log.log(f"m{i}", level="warning")
+    log.flush()
+    lines = [json.loads(x) for x in path.read_text().splitlines()]
+    assert [x["message"] for x in lines] == ["m0", "m1", "m2", "m3"]
+    assert {x["run"] for x in lines} == {log.run_id}
+    assert lines[0]["level"] == "warning"
+
+
+def test_run_n_cycles_logs_levels_phases_and_file(tmp_path, monkeypatch):
+    path = tmp_path / "run.jsonl"
+    monkeypatch.setenv("TDD_AGENTS_LOG_FILE", str(path))
+    monkeypatch.setenv("TDD_AGENTS_LOG_CAPACITY", "5")
+    result = run_n_cycles("python", "Kata", max_cycles=2)
+    assert len(result["system_log"]) == 5
+    written = [json.loads(x) for x in path.read_text().splitlines()]
+    assert len(written) > 5
+    assert written[0]["message"] == "State initialized."
+    assert {"tester", "implementer", "refactorer", "supervisor"} <= {x["phase"] for x in written}
@@ -0,0 +1,45 @@
+from tdd_agents.orchestrator import run_n_cycles
+from tdd_agents.timeouts import DEFAULT_TIMEOUT, AdaptiveTimeout
+
+
+def test_timeout_tracks_p99_within_floor_and_ceiling():
+    t = AdaptiveTimeout(floor=1.0, ceiling=10.0, factor=3.0)
+    assert t.current() == DEFAULT_TIMEOUT
+    for d in [0.1] * 99 + [0.5]:
+        t.observe(d)
+    assert t.current() == 1.5  # p99 0.5 * 3
+    t.observe(0.01)
+    for _ in range(60):
+        t.observe(0.01)
+    assert t.current() == 1.0  # old slow runs left the window; floor applies
+    t.observe(9.0)
+    assert t.current() == 10.0  # ceiling
+
+
+def test_timeout_backs_off_after_timeouts():
+    t = AdaptiveTimeout(floor=1.0, ceiling=8.0, factor=2.0)
+    t.observe(1.0)
+    t.observe(2.0, timed_out=True)
+    assert (t.current(), t.timeouts) == (4.0, 1)
+    t.observe(2.0, timed_out=True)
+    t.observe(2.0, timed_out=True)
+    assert t.current() == 8.0
+    t.observe(1.0)
+    assert t.current() == 2.0
+
+
+class Scripted:
+    def generate(self, prompt: str) -> str:
+        if prompt.startswith("You are a TDD test author"):
+            return "def test_add():\n    assert add(2, 2) == 4\n"
+        if prompt.startswith("You are an implementation agent"):
+            return "def add(a, b):\n    return a + b\n"
+        return "[NULL_LLM_OUTPUT]"
+
+
+def test_run_tests_spans_record_chosen_timeout(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_TIMEOUT_FLOOR", "3")
+    result = run_n_cycles("python", "add numbers", max_cycles=1, llm=Scripted())
+    runs = [s for s in result["metrics"]["spans"] if s["name"] == "run_tests"]
+    assert runs and runs[0]["attrs"]["timeout_s"] == DEFAULT_TIMEOUT
+    assert all(3.0 <= s["attrs"]["timeout_s"] <= 30.0 for s in runs)
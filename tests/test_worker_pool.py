@@ -0,0 +1,37 @@
+import pytest
+
+from tdd_agents.runtime_validation import run_tests
+from tdd_agents.worker_pool import WarmPytestPool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    p = WarmPytestPool(size=1)
+    yield p
+    p.close()
+
+
+def test_pool_reports_pass_and_fail(pool):
+    impl = "def add(a, b):\n    return a + b\n"
+    passed, details = pool.run(impl, "def test_add():\n    assert add(1, 2) == 3\n")
+    assert passed, details
+    passed, details = pool.run(impl, "def test_add():\n    assert add(1, 2) == 4\n")
+    assert not passed
+    assert "failed" in details
+
+
+def test_pool_enforces_timeout_and_recovers(pool):
+    hang = "def spin():\n    while True:\n        pass\n"
+    passed, details = pool.run(hang, "def test_spin():\n    spin()\n", timeout_sec=1)
+    assert not passed
+    assert details == "Test execution timeout"
+    # worker keeps serving after killing the hung child
+    passed, _ = pool.run("X = 1\n", "def test_x():\n    assert X == 1\n")
+    assert passed
+
+
+def test_run_tests_uses_pool_runner(monkeypatch):
+    monkeypatch.setenv("TDD_AGENTS_TEST_RUNNER", "pool")
+    monkeypatch.setenv("TDD_AGENTS_POOL_SIZE", "1")
+    passed, details = run_tests("def f():\n    return 0\n", "def test_f():\n    assert f() == 0\n")
+    assert passed, details
@@ -0,0 +1,44 @@
+import os
+
+from tdd_agents.runtime_validation import run_tests
+from tdd_agents.workspace import WorkspacePool
+
+IMPL = "def add(a, b):\n    return a + b\n"
+SUITE = "def test_add():\n    assert add(1, 2) == 3\n"
+
+
+def test_workspaces_are_reused_and_reset_in_place(tmp_path):
+    pool = WorkspacePool(str(tmp_path))
+    with pool.acquire(IMPL, SUITE) as ws:
+        first = ws.path
+        test_file = os.path.join(first, "tests", "test_generated.py")
+        stamp = os.stat(test_file).st_mtime_ns
+        open(os.path.join(first, "report.xml"), "w").close()
+    with pool.acquire(IMPL.replace("+", "-"), SUITE) as ws:
+        assert ws.path == first
+        assert os.stat(test_file).st_mtime_ns == stamp  # unchanged file not rewritten
+        assert "a - b" in open(os.path.join(first, "impl.py")).read()
+        assert not os.path.exists(os.path.join(first, "report.xml"))
+    pool.close()
+    assert not os.path.exists(first)
+
+
+def test_same_size_edits_get_distinct_mtimes(tmp_path):
+    pool = WorkspacePool(str(tmp_path))
+    stamps = set()
+    for op in "+-*":
+        with pool.acquire(IMPL.replace("+", op), SUITE) as ws:
+            stamps.add(int(os.stat(os.path.join(ws.path, "impl.py")).st_mtime))
+    assert len(stamps) == 3  # bytecode keyed on mtime+size can't go stale
+    pool.close()
+
+
+def test_run_tests_in_pooled_workspace(monkeypatch, tmp_path):
+    monkeypatch.setenv("TDD_AGENTS_TEST_RUNNER", "subprocess")
+    monkeypatch.setenv("TDD_AGENTS_WORKSPACE_DIR", str(tmp_path))
+    monkeypatch.setattr("tdd_agents.workspace._DEFAULT", None)
+    assert run_tests(IMPL, SUITE)[0]
+    assert not run_tests(IMPL.replace("+", "-"), SUITE)[0]
+    assert run_tests(IMPL, SUITE)[0]
+    [workspace] = os.listdir(tmp_path)  # one reused workspace, no shared bytecode dir
+    assert workspace.startswith("tdd_agents_ws_")